@@ -4,16 +4,23 @@
 from __future__ import annotations
 
 import argparse
+import bisect
+import itertools
 import json
 import math
+import operator
 import os
+import sqlite3
 import statistics
 import sys
 from collections import defaultdict
+from contextlib import closing
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import metrics_store
+
 
 QUALITY_LEVELS = {
     "UNMEASURED": 0,
@@ -38,6 +45,15 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("inputs", nargs="*", help="Extractor JSON, existing metrics JSON, or analysis manifest")
     parser.add_argument("--manifest", help="Analysis manifest with run metrics and optional quality evidence")
+    parser.add_argument("--store", help="Analyze the latest runs in a metrics store instead of JSON inputs")
+    parser.add_argument("--task-kind", help="With --store, only analyze runs of this workload task kind")
+    parser.add_argument("--fingerprint", help="With --store, only analyze runs with this workload fingerprint")
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="With --store, emit groups, Pareto, winners, and ranking without per-run documents",
+    )
+    parser.add_argument("--append-store", help="Append the loaded runs to this metrics store (SQLite)")
     parser.add_argument(
         "--weights",
         help="Optional JSON object or JSON file with explicit cost/time/quality weights",
@@ -326,46 +342,64 @@ def winner(runs: list[dict[str, Any]], metric: str, *, require_quality: bool = F
 
 def pareto_frontier(runs: list[dict[str, Any]]) -> list[str]:
     candidates = [
-        run for run in runs
+        (QUALITY_LEVELS[run["quality"]["level"]], run["metrics"]["aiu_per_unit"], run["metrics"]["elapsed_seconds_per_unit"], run["label"])
+        for run in runs
         if run["metrics"]["aiu_per_unit"] is not None
         and run["metrics"]["elapsed_seconds_per_unit"] is not None
         and run["quality"]["passed"] is True
         and run["quality"]["level"] != "UNMEASURED"
     ]
+    # Skyline sweep: quality levels from best to worst, each sorted by (cost, time).
+    # Any run at a better level with no higher cost and time dominates; at the same level one
+    # strictly better coordinate is also required, so identical runs never dominate each other.
+    by_level: dict[int, list[tuple[float, float, str]]] = defaultdict(list)
+    for level, aiu, elapsed, label in candidates:
+        by_level[level].append((aiu, elapsed, label))
     frontier = []
-    for candidate in candidates:
-        dominated = False
-        candidate_quality = QUALITY_LEVELS[candidate["quality"]["level"]]
-        for other in candidates:
-            if other is candidate:
-                continue
-            other_quality = QUALITY_LEVELS[other["quality"]["level"]]
-            no_worse = (
-                other["metrics"]["aiu_per_unit"] <= candidate["metrics"]["aiu_per_unit"]
-                and other["metrics"]["elapsed_seconds_per_unit"] <= candidate["metrics"]["elapsed_seconds_per_unit"]
-                and other_quality >= candidate_quality
-            )
-            strictly_better = (
-                other["metrics"]["aiu_per_unit"] < candidate["metrics"]["aiu_per_unit"]
-                or other["metrics"]["elapsed_seconds_per_unit"] < candidate["metrics"]["elapsed_seconds_per_unit"]
-                or other_quality > candidate_quality
-            )
-            if no_worse and strictly_better:
-                dominated = True
-                break
-        if not dominated:
-            frontier.append(candidate["label"])
+    better_aiu: list[float] = []
+    better_min_elapsed: list[float] = []
+    better: list[tuple[float, float, str]] = []
+    for level in sorted(by_level, reverse=True):
+        members = sorted(by_level[level])
+        best_before = math.inf
+        index = 0
+        while index < len(members):
+            aiu = members[index][0]
+            end = index
+            while end < len(members) and members[end][0] == aiu:
+                end += 1
+            group_min = members[index][1]
+            for _, elapsed, label in members[index:end]:
+                position = bisect.bisect_right(better_aiu, aiu)
+                if position and better_min_elapsed[position - 1] <= elapsed:
+                    continue
+                if best_before <= elapsed or group_min < elapsed:
+                    continue
+                frontier.append(label)
+            best_before = min(best_before, group_min)
+            index = end
+        better = sorted(better + members)
+        better_aiu = [aiu for aiu, _, _ in better]
+        better_min_elapsed = list(itertools.accumulate((elapsed for _, elapsed, _ in better), min))
     return sorted(frontier)
 
 
-def quartiles(values: list[float]) -> dict[str, float] | None:
+def inclusive_quartiles(sorted_values: list[float]) -> tuple[float, float, float]:
+    # Same interpolation as statistics.quantiles(n=4, method="inclusive") on presorted data
+    if len(sorted_values) == 1:
+        return sorted_values[0], sorted_values[0], sorted_values[0]
+    last = len(sorted_values) - 1
+    points = []
+    for quarter in range(1, 4):
+        index, delta = divmod(quarter * last, 4)
+        points.append((sorted_values[index] * (4 - delta) + sorted_values[index + 1] * delta) / 4)
+    return points[0], points[1], points[2]
+
+
+def quartiles(values: list[float], *, presorted: bool = False) -> dict[str, float] | None:
     if not values:
         return None
-    sorted_values = sorted(values)
-    if len(sorted_values) == 1:
-        median = q1 = q3 = sorted_values[0]
-    else:
-        q1, median, q3 = statistics.quantiles(sorted_values, n=4, method="inclusive")
+    q1, median, q3 = inclusive_quartiles(values if presorted else sorted(values))
     return {
         "median": round(median, 6),
         "q1": round(q1, 6),
@@ -374,44 +408,51 @@ def quartiles(values: list[float]) -> dict[str, float] | None:
     }
 
 
-def outlier_labels(members: list[dict[str, Any]], metric: str) -> list[str]:
-    measured = [
-        (item["label"], item["metrics"][metric])
-        for item in members
-        if item["metrics"][metric] is not None
-    ]
-    if len(measured) < 4:
-        return []
-    summary = quartiles([value for _, value in measured])
-    if summary is None:
+def tukey_outliers(measured: list[tuple[float, str]], summary: dict[str, float] | None) -> list[str]:
+    if len(measured) < 4 or summary is None:
         return []
     lower = summary["q1"] - 1.5 * summary["iqr"]
     upper = summary["q3"] + 1.5 * summary["iqr"]
-    return sorted(label for label, value in measured if value < lower or value > upper)
+    return sorted(label for value, label in measured if value < lower or value > upper)
+
+
+def outlier_labels(members: list[dict[str, Any]], metric: str) -> list[str]:
+    measured = sorted(
+        ((item["metrics"][metric], item["label"]) for item in members if item["metrics"][metric] is not None),
+        key=operator.itemgetter(0),
+    )
+    return tukey_outliers(measured, quartiles([value for value, _ in measured], presorted=True))
 
 
 def grouped_summary(runs: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    groups: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+    metrics = ("aiu_per_unit", "elapsed_seconds_per_unit")
+    groups: dict[tuple[str, str], dict[str, Any]] = {}
+    # One pass buckets every metric; each bucket is sorted once and shared by quartiles and outliers
     for run in runs:
         primary = run["primary_model"]
-        groups[(primary["model"], primary["reasoning_effort"])].append(run)
+        key = (primary["model"], primary["reasoning_effort"])
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {"size": 0, "passed": 0, "measured": 0, **{metric: [] for metric in metrics}}
+        group["size"] += 1
+        group["passed"] += run["quality"]["passed"] is True
+        group["measured"] += run["quality"]["level"] != "UNMEASURED"
+        for metric in metrics:
+            value = run["metrics"][metric]
+            if value is not None:
+                group[metric].append((value, run["label"]))
     summaries = []
-    for (model, effort), members in sorted(groups.items()):
-        aiu = [item["metrics"]["aiu_per_unit"] for item in members if item["metrics"]["aiu_per_unit"] is not None]
-        elapsed = [item["metrics"]["elapsed_seconds_per_unit"] for item in members if item["metrics"]["elapsed_seconds_per_unit"] is not None]
-        summaries.append({
-            "model": model,
-            "reasoning_effort": effort,
-            "sample_size": len(members),
-            "aiu_per_unit": quartiles(aiu),
-            "elapsed_seconds_per_unit": quartiles(elapsed),
-            "outliers": {
-                "aiu_per_unit": outlier_labels(members, "aiu_per_unit"),
-                "elapsed_seconds_per_unit": outlier_labels(members, "elapsed_seconds_per_unit"),
-            },
-            "quality_passed": sum(item["quality"]["passed"] is True for item in members),
-            "quality_measured": sum(item["quality"]["level"] != "UNMEASURED" for item in members),
-        })
+    for (model, effort), group in sorted(groups.items()):
+        summary: dict[str, Any] = {"model": model, "reasoning_effort": effort, "sample_size": group["size"]}
+        outliers = {}
+        for metric in metrics:
+            measured = sorted(group[metric], key=operator.itemgetter(0))
+            summary[metric] = quartiles([value for value, _ in measured], presorted=True)
+            outliers[metric] = tukey_outliers(measured, summary[metric])
+        summary["outliers"] = outliers
+        summary["quality_passed"] = group["passed"]
+        summary["quality_measured"] = group["measured"]
+        summaries.append(summary)
     return summaries
 
 
@@ -477,10 +518,15 @@ def weighted_ranking(runs: list[dict[str, Any]], weights: dict[str, float] | Non
     return {"status": "AVAILABLE", "weights": weights, "ranking": ranking}
 
 
-def compare_runs(runs: list[dict[str, Any]], weights: dict[str, float] | None = None) -> dict[str, Any]:
+def compare_runs(
+    runs: list[dict[str, Any]],
+    weights: dict[str, float] | None = None,
+    *,
+    include_runs: bool = True,
+) -> dict[str, Any]:
     if len(runs) < 2:
         raise ValueError("at least two runs are required for comparison")
-    return {
+    comparison = {
         "status": "PASS",
         "schema_version": 1,
         "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
@@ -502,6 +548,9 @@ def compare_runs(runs: list[dict[str, Any]], weights: dict[str, float] | None =
             "ranking_rule": "No weighted overall score is produced unless the caller supplies explicit weights.",
         },
     }
+    if not include_runs:
+        del comparison["runs"]
+    return comparison
 
 
 def session_analysis(run: dict[str, Any]) -> dict[str, Any]:
@@ -518,17 +567,22 @@ def session_analysis(run: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def analyze_runs(runs: list[dict[str, Any]], weights: dict[str, float] | None = None) -> dict[str, Any]:
+def analyze_runs(
+    runs: list[dict[str, Any]],
+    weights: dict[str, float] | None = None,
+    *,
+    summary_only: bool = False,
+) -> dict[str, Any]:
     if not runs:
         raise ValueError("at least one run is required for analysis")
-    comparison = compare_runs(runs, weights) if len(runs) >= 2 else None
+    comparison = compare_runs(runs, weights, include_runs=not summary_only) if len(runs) >= 2 else None
     return {
         "status": "PASS",
         "schema_version": 1,
         "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "analysis_mode": "multi-session-comparison" if comparison is not None else "single-session",
         "run_count": len(runs),
-        "sessions": [session_analysis(run) for run in runs],
+        "sessions": None if summary_only else [session_analysis(run) for run in runs],
         "comparison": comparison,
         "interpretation": {
             "cost_metric": "AIU is relative usage, not currency.",
@@ -555,20 +609,35 @@ def render(payload: dict[str, Any], json_only: bool) -> None:
 def main() -> int:
     args = parse_args()
     try:
-        if bool(args.manifest) == bool(args.inputs):
-            raise ValueError("use either --manifest or positional inputs")
-        if args.manifest:
+        if sum(map(bool, (args.manifest, args.inputs, args.store))) != 1:
+            raise ValueError("use exactly one of --manifest, --store, or positional inputs")
+        if (args.task_kind or args.fingerprint or args.summary_only) and not args.store:
+            raise ValueError("--task-kind, --fingerprint, and --summary-only require --store")
+        if args.store:
+            with closing(metrics_store.connect(Path(args.store))) as connection:
+                runs = metrics_store.load_runs(
+                    connection,
+                    task_kind=args.task_kind,
+                    fingerprint=args.fingerprint,
+                    full=not args.summary_only,
+                )
+            if not runs:
+                raise ValueError(f"no matching runs in metrics store: {args.store}")
+        elif args.manifest:
             runs = load_manifest(Path(args.manifest).expanduser().resolve())
         else:
             runs = []
             for value in args.inputs:
                 runs.extend(load_runs_from_input(Path(value).expanduser().resolve()))
-        payload = analyze_runs(runs, parse_weights(args.weights))
+        if args.append_store:
+            with closing(metrics_store.connect(Path(args.append_store))) as connection:
+                metrics_store.append_runs(connection, runs)
+        payload = analyze_runs(runs, parse_weights(args.weights), summary_only=args.summary_only)
         if args.output_json:
             atomic_write_json(Path(args.output_json), payload)
         render(payload, args.json_only)
         return 0
-    except (OSError, ValueError, json.JSONDecodeError) as exc:
+    except (OSError, ValueError, json.JSONDecodeError, sqlite3.Error) as exc:
         payload = {"status": "FAIL", "error": {"type": type(exc).__name__, "message": str(exc)}}
         render(payload, args.json_only)
         return 1 if args.strict_exit_codes else 0
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark run comparison in analyze_session_metrics on large synthetic run sets."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from typing import Any
+
+import analyze_session_metrics as analyzer
+
+
+MODELS = (("gpt-5.6-sol", "xhigh"), ("gpt-5.6-sol", "high"), ("gpt-5.6-terra", "max"), ("claude-opus", "high"))
+LEVELS = ("UNMEASURED", "PROXY_ONLY", "GATE_SUPPORTED", "VERIFIED")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time compare_runs on synthetic runs and check it against the pairwise reference.")
+    parser.add_argument("--runs", type=int, default=50_000, help="Synthetic runs to compare")
+    parser.add_argument("--check-runs", type=int, default=2_000, help="Runs checked against the O(n^2) reference implementation")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    parser.add_argument("--json-only", action="store_true", help="Print only JSON")
+    return parser.parse_args()
+
+
+def synthetic_runs(count: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    runs = []
+    for index in range(count):
+        model, effort = rng.choice(MODELS)
+        level = rng.choice(LEVELS)
+        # Coarse values produce ties and duplicates; the trade-off share keeps the frontier wide
+        aiu = None if rng.random() < 0.02 else round(rng.lognormvariate(1.0, 0.6), 1)
+        elapsed = None if rng.random() < 0.02 else float(rng.randint(5, 400))
+        if aiu is not None and elapsed is not None and rng.random() < 0.3:
+            elapsed = float(round(400 / max(aiu, 0.1)))
+        runs.append({
+            "label": f"run-{index:06d}",
+            "session_id": f"session-{index:06d}",
+            "measurement_scope": "session",
+            "primary_model": {"model": model, "reasoning_effort": effort},
+            "workload": {"task_kind": "review", "unit_name": "question", "unit_count": 10, "fingerprint": "synthetic"},
+            "metrics": {
+                "aiu_per_unit": aiu,
+                "elapsed_seconds_per_unit": elapsed,
+                "active_llm_seconds_per_unit": elapsed * 0.7 if elapsed is not None else None,
+            },
+            "quality": {
+                "level": level,
+                "passed": level != "UNMEASURED" and rng.random() < 0.8,
+                "adjudicated_residual_defects": rng.randint(0, 3),
+            },
+        })
+    return runs
+
+
+def pareto_frontier_pairwise(runs: list[dict[str, Any]]) -> list[str]:
+    candidates = [
+        run for run in runs
+        if run["metrics"]["aiu_per_unit"] is not None
+        and run["metrics"]["elapsed_seconds_per_unit"] is not None
+        and run["quality"]["passed"] is True
+        and run["quality"]["level"] != "UNMEASURED"
+    ]
+    frontier = []
+    for candidate in candidates:
+        candidate_quality = analyzer.QUALITY_LEVELS[candidate["quality"]["level"]]
+        for other in candidates:
+            if other is candidate:
+                continue
+            other_quality = analyzer.QUALITY_LEVELS[other["quality"]["level"]]
+            no_worse = (
+                other["metrics"]["aiu_per_unit"] <= candidate["metrics"]["aiu_per_unit"]
+                and other["metrics"]["elapsed_seconds_per_unit"] <= candidate["metrics"]["elapsed_seconds_per_unit"]
+                and other_quality >= candidate_quality
+            )
+            strictly_better = (
+                other["metrics"]["aiu_per_unit"] < candidate["metrics"]["aiu_per_unit"]
+                or other["metrics"]["elapsed_seconds_per_unit"] < candidate["metrics"]["elapsed_seconds_per_unit"]
+                or other_quality > candidate_quality
+            )
+            if no_worse and strictly_better:
+                break
+        else:
+            frontier.append(candidate["label"])
+    return sorted(frontier)
+
+
+def quartiles_reference(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    if len(values) == 1:
+        median = q1 = q3 = values[0]
+    else:
+        q1, median, q3 = statistics.quantiles(sorted(values), n=4, method="inclusive")
+    return {"median": round(median, 6), "q1": round(q1, 6), "q3": round(q3, 6), "iqr": round(q3 - q1, 6)}
+
+
+def grouped_summary_reference(runs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    groups: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+    for run in runs:
+        groups[(run["primary_model"]["model"], run["primary_model"]["reasoning_effort"])].append(run)
+    summaries = []
+    for (model, effort), members in sorted(groups.items()):
+        summary: dict[str, Any] = {"model": model, "reasoning_effort": effort, "sample_size": len(members), "outliers": {}}
+        for metric in ("aiu_per_unit", "elapsed_seconds_per_unit"):
+            measured = [(item["label"], item["metrics"][metric]) for item in members if item["metrics"][metric] is not None]
+            stats = quartiles_reference([value for _, value in measured])
+            summary[metric] = stats
+            outliers = []
+            if len(measured) >= 4 and stats is not None:
+                lower = stats["q1"] - 1.5 * stats["iqr"]
+                upper = stats["q3"] + 1.5 * stats["iqr"]
+                outliers = sorted(label for label, value in measured if value < lower or value > upper)
+            summary["outliers"][metric] = outliers
+        summary["quality_passed"] = sum(item["quality"]["passed"] is True for item in members)
+        summary["quality_measured"] = sum(item["quality"]["level"] != "UNMEASURED" for item in members)
+        summaries.append(summary)
+    return summaries
+
+
+def timed(function: Any, runs: list[dict[str, Any]]) -> tuple[float, Any]:
+    started = time.perf_counter()
+    result = function(runs)
+    return round(time.perf_counter() - started, 4), result
+
+
+def main() -> int:
+    args = parse_args()
+    sample = synthetic_runs(args.check_runs, args.seed)
+    pareto_reference_seconds, pareto_expected = timed(pareto_frontier_pairwise, sample)
+    groups_reference_seconds, groups_expected = timed(grouped_summary_reference, sample)
+    pareto_seconds, pareto_actual = timed(analyzer.pareto_frontier, sample)
+    groups_seconds, groups_actual = timed(analyzer.grouped_summary, sample)
+    matches = pareto_actual == pareto_expected and groups_actual == groups_expected
+
+    runs = synthetic_runs(args.runs, args.seed)
+    full_pareto_seconds, frontier = timed(analyzer.pareto_frontier, runs)
+    full_groups_seconds, _ = timed(analyzer.grouped_summary, runs)
+    compare_seconds, _ = timed(lambda items: analyzer.compare_runs(items, {"cost": 1.0, "time": 1.0, "quality": 1.0}), runs)
+    payload = {
+        "status": "PASS" if matches else "FAIL",
+        "check": {
+            "runs": args.check_runs,
+            "matches_reference": matches,
+            "pareto_pairwise_seconds": pareto_reference_seconds,
+            "pareto_skyline_seconds": pareto_seconds,
+            "grouped_reference_seconds": groups_reference_seconds,
+            "grouped_single_sort_seconds": groups_seconds,
+        },
+        "scale": {
+            "runs": args.runs,
+            "frontier_size": len(frontier),
+            "pareto_seconds": full_pareto_seconds,
+            "grouped_summary_seconds": full_groups_seconds,
+            "compare_runs_seconds": compare_seconds,
+        },
+    }
+    if not args.json_only:
+        print("=== Run Comparison Benchmark ===")
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Micro-benchmark duplicate-event detection in extract_session_metrics on synthetic logs."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import extract_session_metrics as extractor
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare event de-duplication engines on a synthetic debug log.")
+    parser.add_argument("--events", type=int, default=200_000, help="Synthetic events to generate")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.02, help="Share of events that are re-appended duplicates")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions per engine")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic log")
+    parser.add_argument("--json-only", action="store_true", help="Print only JSON")
+    return parser.parse_args()
+
+
+def synthetic_event(index: int, rng: random.Random) -> dict[str, Any]:
+    if index % 3:
+        return {
+            "ts": 1_700_000_000_000 + index * 37,
+            "dur": rng.randint(1, 5000),
+            "type": "tool_call",
+            "name": rng.choice(("read_file", "grep_search", "run_in_terminal")),
+            "status": "ok",
+            "spanId": f"tool-{index:08x}",
+            "parentSpanId": f"llm-{index // 3:08x}",
+            "attrs": {"args": "x" * rng.randint(20, 400)},
+        }
+    return {
+        "ts": 1_700_000_000_000 + index * 37,
+        "dur": rng.randint(200, 30_000),
+        "type": "llm_request",
+        "status": "ok",
+        "spanId": f"llm-{index // 3:08x}",
+        "attrs": {
+            "model": rng.choice(("gpt-5.6-sol", "gpt-5.6-terra", "claude-opus")),
+            "inputTokens": rng.randint(1000, 90_000),
+            "outputTokens": rng.randint(10, 4000),
+            "copilotUsageNanoAiu": rng.randint(10**6, 10**9),
+            "requestOptions": json.dumps({"reasoning": {"effort": "high"}}),
+        },
+    }
+
+
+def write_synthetic_log(path: Path, events: int, duplicate_ratio: float, seed: int) -> int:
+    rng = random.Random(seed)
+    recent: list[str] = []
+    duplicates = 0
+    with path.open("w", encoding="utf-8") as handle:
+        for index in range(events):
+            if recent and rng.random() < duplicate_ratio:
+                line = rng.choice(recent)
+                duplicates += 1
+            else:
+                line = json.dumps(synthetic_event(index, rng)) + "\n"
+                recent = (recent + [line])[-64:]
+            handle.write(line)
+    return duplicates
+
+
+Records = Iterable[tuple[int, dict[str, Any]]]
+
+
+# The pre-EventDeduper identity: a SHA-256 of the canonical JSON of the identity fields
+def sha256_identity(event: dict[str, Any]) -> str:
+    attrs = event.get("attrs") if isinstance(event.get("attrs"), dict) else {}
+    identity = {
+        "type": event.get("type"),
+        "name": event.get("name"),
+        "span": event.get("spanId"),
+        "parent": event.get("parentSpanId"),
+        "ts": event.get("ts"),
+        "dur": event.get("dur"),
+        "model": attrs.get("model"),
+        "input": attrs.get("inputTokens"),
+        "output": attrs.get("outputTokens"),
+        "aiu": attrs.get("copilotUsageNanoAiu"),
+    }
+    encoded = json.dumps(identity, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(encoded.encode("ascii")).hexdigest()
+
+
+def baseline_engine(records: Records) -> tuple[int, Any]:
+    seen: set[str] = set()
+    duplicates = 0
+    for _, event in records:
+        identity = sha256_identity(event)
+        if identity in seen:
+            duplicates += 1
+        else:
+            seen.add(identity)
+    return duplicates, seen
+
+
+def deduper_engine(mode: str, path: Path) -> Callable[[Records], tuple[int, Any]]:
+    def run(records: Records) -> tuple[int, Any]:
+        deduper = extractor.EventDeduper(mode)
+        file_index = deduper.add_file(path)
+        duplicates = sum(
+            deduper.is_duplicate(extractor.event_key(event), file_index, offset)
+            for offset, event in records
+        )
+        return duplicates, deduper
+    return run
+
+
+def measure(engine: Callable[[Records], tuple[int, Any]], path: Path, records: list[tuple[int, dict[str, Any]]], repeat: int) -> dict[str, Any]:
+    best = float("inf")
+    duplicates = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        duplicates, _ = engine(records)
+        best = min(best, time.perf_counter() - started)
+    # Retained memory: stream the log so only the engine's own state stays alive
+    tracemalloc.start()
+    _, state = engine(extractor.iter_event_records(path, Counter()))
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del state
+    return {"seconds": round(best, 4), "duplicates": duplicates, "retained_bytes": retained}
+
+
+def main() -> int:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "main.jsonl"
+        injected = write_synthetic_log(path, args.events, args.duplicate_ratio, args.seed)
+        records = list(extractor.iter_event_records(path, Counter()))
+        results = {"sha256-json (baseline)": measure(baseline_engine, path, records, args.repeat)}
+        for mode in extractor.DEDUP_MODES:
+            results[f"EventDeduper({mode})"] = measure(deduper_engine(mode, path), path, records, args.repeat)
+
+    baseline = results["sha256-json (baseline)"]
+    for result in results.values():
+        result["speedup"] = round(baseline["seconds"] / max(result["seconds"], 1e-9), 2)
+    consistent = len({result["duplicates"] for result in results.values()}) == 1
+    payload = {
+        "status": "PASS" if consistent else "FAIL",
+        "events": args.events,
+        "injected_duplicates": injected,
+        "engines": results,
+    }
+    if not args.json_only:
+        print("=== Event Dedup Benchmark ===")
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0 if consistent else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Benchmark extraction, run comparison, and prune planning on synthetic stores at several scales."""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import analyze_session_metrics as analyzer
+import extract_session_metrics as extractor
+import prune_chat_sessions as pruner
+from benchmark_compare_runs import synthetic_runs
+from benchmark_event_dedup import synthetic_event
+
+
+BASE_SIZES = {"extract": 100, "compare": 50, "prune_plan": 20}
+UNIT_NAMES = {"extract": "events", "compare": "runs", "prune_plan": "chat_sessions"}
+SUBAGENT_ROLES = ("reviewer", "fixer", "searcher")
+MIN_COMPARABLE_SECONDS = 0.02
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time extraction, comparison, and prune planning at 10x/100x/1000x synthetic scale.",
+    )
+    parser.add_argument("--scales", default="10,100,1000", help="Comma-separated multipliers of the base workload")
+    parser.add_argument("--sessions", type=int, default=4, help="Debug sessions per synthetic log tree")
+    parser.add_argument("--subagents", type=int, default=2, help="Subagent logs per debug session")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.02, help="Share of re-appended duplicate events")
+    parser.add_argument("--corrupt-ratio", type=float, default=0.001, help="Share of truncated JSON lines")
+    parser.add_argument(
+        "--payload-bytes",
+        type=int,
+        default=0,
+        help="Approximate size of the request payload embedded in every llm_request line",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions per measurement")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    parser.add_argument("--baseline", help="Results JSON from an earlier --save-baseline run to compare against")
+    parser.add_argument("--save-baseline", help="Write this run's results JSON for later --baseline comparison")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown against the baseline, e.g. 0.25 = 25%%")
+    parser.add_argument("--json-only", action="store_true", help="Print only JSON")
+    return parser.parse_args()
+
+
+def parse_scales(value: str) -> list[int]:
+    try:
+        scales = sorted({int(item) for item in value.split(",") if item.strip()})
+    except ValueError as exc:
+        raise ValueError(f"invalid --scales: {value}") from exc
+    if not scales or scales[0] < 1:
+        raise ValueError(f"invalid --scales: {value}")
+    return scales
+
+
+def write_debug_tree(
+    root: Path,
+    *,
+    sessions: int,
+    subagents: int,
+    events: int,
+    duplicate_ratio: float,
+    corrupt_ratio: float,
+    seed: int,
+    payload_bytes: int = 0,
+) -> dict[str, Any]:
+    # Events are split across main.jsonl and the subagent logs; indexes stay unique per session so
+    # only the injected re-appends are duplicates.
+    rng = random.Random(seed)
+    session_dirs = []
+    injected = {"events": 0, "duplicates": 0, "corrupt_lines": 0}
+    for session in range(sessions):
+        session_dir = root / f"{session:08x}-0000-4000-8000-{seed:012x}"
+        session_dir.mkdir(parents=True)
+        names = ["main.jsonl"] + [
+            f"runSubagent-{SUBAGENT_ROLES[child % len(SUBAGENT_ROLES)]}-call_{child:04d}.jsonl"
+            for child in range(subagents)
+        ]
+        share = max(1, events // len(names))
+        index = 0
+        for name in names:
+            recent: list[str] = []
+            with (session_dir / name).open("w", encoding="utf-8") as handle:
+                for _ in range(share):
+                    roll = rng.random()
+                    if recent and roll < duplicate_ratio:
+                        handle.write(rng.choice(recent))
+                        injected["duplicates"] += 1
+                        continue
+                    event = synthetic_event(index, rng)
+                    if payload_bytes and event["type"] == "llm_request":
+                        event["attrs"]["request"] = synthetic_payload(payload_bytes, rng)
+                    line = json.dumps(event) + "\n"
+                    index += 1
+                    if roll < duplicate_ratio + corrupt_ratio:
+                        handle.write(line[: len(line) // 2] + "\n")
+                        injected["corrupt_lines"] += 1
+                        continue
+                    handle.write(line)
+                    recent = (recent + [line])[-64:]
+                    injected["events"] += 1
+                if name == "main.jsonl":
+                    handle.write(json.dumps({"ts": 1_700_000_000_000 + index * 37, "type": "agent_response"}) + "\n")
+        session_dirs.append(session_dir)
+    return {"session_dirs": session_dirs, **injected}
+
+
+def synthetic_payload(size: int, rng: random.Random) -> dict[str, Any]:
+    # Chat-shaped request body: many messages of code-like text with escaped quotes and newlines
+    text = "\n".join(f'    value = compute("item", {number})  # note' for number in range(40))
+    count = max(1, size // (len(text) + 80))
+    return {
+        "messages": [
+            {"role": rng.choice(("system", "user", "assistant", "tool")), "content": text, "ids": [number, count]}
+            for number in range(count)
+        ],
+    }
+
+
+def write_chat_store(root: Path, *, sessions: int, seed: int, now: datetime) -> Path:
+    # One workspaceStorage child with session files, auxiliary dirs, and a state.vscdb index
+    rng = random.Random(seed)
+    storage = root / "workspaceStorage" / "benchmark-storage"
+    session_root = storage / "chatSessions"
+    session_root.mkdir(parents=True)
+    (storage / "workspace.json").write_text(json.dumps({"folder": (root / "repo").as_uri()}), encoding="utf-8")
+    index_entries = {}
+    states = []
+    for number in range(sessions):
+        session_id = f"{number:08x}-{rng.getrandbits(16):04x}-4{rng.getrandbits(12):03x}-8{rng.getrandbits(12):03x}-{rng.getrandbits(48):012x}"
+        modified = (now - timedelta(hours=rng.uniform(0, 14 * 24))).timestamp()
+        path = session_root / f"{session_id}.jsonl"
+        path.write_bytes(b'{"kind":0,"v":{}}\n' * rng.randint(1, 64))
+        os.utime(path, (modified, modified))
+        if number % 4 == 0:
+            auxiliary = storage / "chatEditingSessions" / session_id
+            auxiliary.mkdir(parents=True)
+            (auxiliary / "state.json").write_bytes(b"x" * rng.randint(100, 4000))
+        index_entries[session_id] = {"lastMessageDate": modified * 1000}
+        encoded = base64.urlsafe_b64encode(session_id.encode("ascii")).decode("ascii").rstrip("=")
+        states.append({"resource": f"{pruner.LOCAL_RESOURCE_PREFIX}{encoded}", "pinned": number % 50 == 0})
+    connection = sqlite3.connect(storage / "state.vscdb")
+    try:
+        connection.execute("CREATE TABLE ItemTable (key TEXT PRIMARY KEY, value TEXT)")
+        connection.executemany(
+            "INSERT INTO ItemTable (key, value) VALUES (?, ?)",
+            (
+                (pruner.INDEX_KEY, json.dumps({"version": 1, "entries": index_entries})),
+                (pruner.STATE_KEY, json.dumps(states)),
+            ),
+        )
+        connection.commit()
+    finally:
+        connection.close()
+    return storage
+
+
+def best_of(repeat: int, function: Callable[[], Any]) -> tuple[float, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def measurement(workload: str, units: int, seconds: float, **extra: Any) -> dict[str, Any]:
+    return {
+        "units": units,
+        "unit": UNIT_NAMES[workload],
+        "seconds": round(seconds, 4),
+        "microseconds_per_unit": round(seconds * 1_000_000 / max(units, 1), 3),
+        **extra,
+    }
+
+
+def bench_extract(root: Path, scale: int, args: argparse.Namespace) -> dict[str, Any]:
+    tree = write_debug_tree(
+        root / "debug-logs",
+        sessions=args.sessions,
+        subagents=args.subagents,
+        events=BASE_SIZES["extract"] * scale,
+        duplicate_ratio=args.duplicate_ratio,
+        corrupt_ratio=args.corrupt_ratio,
+        seed=args.seed,
+        payload_bytes=args.payload_bytes,
+    )
+    seconds, sessions = best_of(
+        args.repeat, lambda: [extractor.extract_session(session_dir) for session_dir in tree["session_dirs"]]
+    )
+    warnings: dict[str, int] = {}
+    for session in sessions:
+        for warning in session["warnings"]:
+            warnings[warning["code"]] = warnings.get(warning["code"], 0) + warning["count"]
+    parsed = sum(session["operations"]["llm_calls"] + session["operations"]["tool_calls"] for session in sessions)
+    consistent = (
+        parsed == tree["events"]
+        and warnings.get("duplicate_events_skipped", 0) == tree["duplicates"]
+        and warnings.get("invalid_json_lines_skipped", 0) == tree["corrupt_lines"]
+    )
+    return measurement(
+        "extract",
+        tree["events"] + tree["duplicates"] + tree["corrupt_lines"],
+        seconds,
+        sessions=len(sessions),
+        duplicates=tree["duplicates"],
+        corrupt_lines=tree["corrupt_lines"],
+        consistent=consistent,
+    )
+
+
+def bench_compare(scale: int, args: argparse.Namespace) -> dict[str, Any]:
+    runs = synthetic_runs(BASE_SIZES["compare"] * scale, args.seed)
+    seconds, comparison = best_of(args.repeat, lambda: analyzer.compare_runs(runs, include_runs=False))
+    return measurement("compare", len(runs), seconds, frontier_size=len(comparison["pareto_frontier"]), consistent=True)
+
+
+def bench_prune_plan(root: Path, scale: int, args: argparse.Namespace) -> dict[str, Any]:
+    now = datetime(2026, 7, 31, tzinfo=timezone.utc)
+    count = BASE_SIZES["prune_plan"] * scale
+    storage = write_chat_store(root, sessions=count, seed=args.seed, now=now)
+    seconds, plan = best_of(
+        args.repeat,
+        lambda: pruner.build_plan(storage, 72, set(), 1, now=now, max_bytes=512 * count),
+    )
+    return measurement(
+        "prune_plan",
+        count,
+        seconds,
+        candidates=len(plan["session_files"]),
+        consistent=plan["session_count"] == count,
+    )
+
+
+def find_regressions(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    # Only like-for-like measurements are compared; sub-20 ms timings are too noisy to gate on
+    regressions = []
+    for workload, scales in results.items():
+        for scale, current in scales.items():
+            previous = baseline.get("results", {}).get(workload, {}).get(scale)
+            if not previous or previous["units"] != current["units"]:
+                continue
+            if max(previous["seconds"], current["seconds"]) < MIN_COMPARABLE_SECONDS:
+                continue
+            ratio = current["seconds"] / max(previous["seconds"], MIN_COMPARABLE_SECONDS)
+            if ratio > 1 + threshold:
+                regressions.append({
+                    "workload": workload,
+                    "scale": scale,
+                    "baseline_seconds": previous["seconds"],
+                    "seconds": current["seconds"],
+                    "slowdown": round(ratio - 1, 3),
+                })
+    return regressions
+
+
+def run_suite(args: argparse.Namespace) -> dict[str, Any]:
+    results: dict[str, dict[str, Any]] = {workload: {} for workload in BASE_SIZES}
+    for scale in parse_scales(args.scales):
+        key = f"{scale}x"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results["extract"][key] = bench_extract(Path(tmpdir), scale, args)
+        results["compare"][key] = bench_compare(scale, args)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results["prune_plan"][key] = bench_prune_plan(Path(tmpdir), scale, args)
+    return results
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+        results = run_suite(args)
+    except (OSError, ValueError) as exc:
+        payload = {"status": "FAIL", "error": str(exc)}
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        return 1
+
+    regressions = find_regressions(results, baseline, args.threshold) if baseline else []
+    consistent = all(item["consistent"] for scales in results.values() for item in scales.values())
+    payload = {
+        "status": "PASS" if consistent and not regressions else "FAIL",
+        "scales": parse_scales(args.scales),
+        "threshold": args.threshold,
+        "baseline": Path(args.baseline).name if args.baseline else None,
+        "results": results,
+        "regressions": regressions,
+    }
+    if args.save_baseline:
+        extractor.atomic_write_json(Path(args.save_baseline), payload)
+    if not args.json_only:
+        print("=== Session Analysis Benchmark Suite ===")
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0 if payload["status"] == "PASS" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
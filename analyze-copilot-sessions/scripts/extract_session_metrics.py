@@ -6,17 +6,54 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import marshal
 import os
 import re
+import sqlite3
+import statistics
 import sys
+import time
 from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import closing, nullcontext
 from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
+from json.decoder import scanstring
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+import metrics_store
+from analyze_session_metrics import normalize_run
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 CHILD_PREFIXES = ("runSubagent-", "searchSubagent-")
+DEDUP_MODES = ("exact", "compact")
+LOCATION_OFFSET_BITS = 40
+CACHE_FORMAT = 2
+CACHE_DIGEST_BYTES = 4096
+SPAN_KINDS = {"llm_request": "llm", "tool_call": "tool"}
+LATENCY_PERCENTILES = (50, 90, 99)
 SESSION_ID_PATTERN = re.compile(r"^[0-9a-fA-F-]{36}$")
+SELECTIVE_LINE_BYTES = 1024 * 1024
+EVENT_FIELDS = {
+    "type": None,
+    "name": None,
+    "ts": None,
+    "dur": None,
+    "status": None,
+    "spanId": None,
+    "parentSpanId": None,
+    "attrs": frozenset({"model", "inputTokens", "outputTokens", "cachedTokens", "copilotUsageNanoAiu", "requestOptions"}),
+}
+JSON_STRUCTURE = re.compile(r'["\[\]{}]')
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+JSON_DECODER = json.JSONDecoder()
 
 
 for _stream_name in ("stdout", "stderr"):
@@ -46,6 +83,15 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--workflow-version", default="", help="Workflow version")
     parser.add_argument("--rubric-version", default="", help="Quality rubric version")
     parser.add_argument("--output-json", help="Optional aggregate JSON output path")
+    parser.add_argument("--jobs", type=int, default=1, help="Extract sessions in N worker processes; 0 uses every CPU")
+    parser.add_argument("--dedup", choices=DEDUP_MODES, default="compact", help="Duplicate-event memory: compact verified 64-bit hashes (default) or exact identity tuples")
+    parser.add_argument("--cache-dir", help="Reuse per-file partial aggregates from this directory; reruns parse only appended log tails")
+    parser.add_argument("--store", help="Also append each extracted session to this metrics store (SQLite)")
+    parser.add_argument("--follow", action="store_true", help="Watch one live session and print a rolling JSON snapshot line every --interval seconds")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between --follow snapshots")
+    parser.add_argument("--max-updates", type=int, help="Stop --follow after N snapshots")
+    parser.add_argument("--idle-exit", type=float, help="Stop --follow once no log has grown for this many seconds")
+    parser.add_argument("--jsonl", action="store_true", help="Stream one JSON line per session as it finishes, then a summary line")
     parser.add_argument("--json-only", action="store_true", help="Print only JSON")
     parser.add_argument("--strict-exit-codes", action="store_true", help="Return 1 when extraction fails")
     return parser.parse_args()
@@ -82,20 +128,128 @@ def default_debug_roots() -> list[Path]:
     return sorted({path.resolve() for path in roots if path.is_dir()})
 
 
-def iter_events(path: Path, warnings: Counter[str]) -> Iterator[dict[str, Any]]:
-    with path.open(encoding="utf-8", errors="replace") as handle:
-        for line in handle:
-            if "\ufffd" in line:
+def skip_json_value(text: str, index: int) -> int:
+    # Finds the end of a value without building it: strings go through the C string scanner one at a
+    # time, so a skipped payload never exists as Python objects all at once
+    char = text[index]
+    if char == '"':
+        return scanstring(text, index + 1)[1]
+    if char not in "[{":
+        return JSON_DECODER.raw_decode(text, index)[1]
+    depth = 0
+    while True:
+        match = JSON_STRUCTURE.search(text, index)
+        if match is None:
+            raise ValueError("unterminated container")
+        index = match.end()
+        char = match.group()
+        if char == '"':
+            index = scanstring(text, index)[1]
+        elif char in "[{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return index
+
+
+def parse_json_fields(text: str, index: int, fields: dict[str, Any] | frozenset[str]) -> tuple[dict[str, Any], int]:
+    # text[index] is "{"; only the named keys are decoded, and nested field sets recurse into objects
+    result: dict[str, Any] = {}
+    index = JSON_WHITESPACE.match(text, index + 1).end()
+    if text[index] == "}":
+        return result, index + 1
+    while True:
+        if text[index] != '"':
+            raise ValueError("expected object key")
+        key, index = scanstring(text, index + 1)
+        index = JSON_WHITESPACE.match(text, index).end()
+        if text[index] != ":":
+            raise ValueError("expected ':'")
+        index = JSON_WHITESPACE.match(text, index + 1).end()
+        if key not in fields:
+            index = skip_json_value(text, index)
+        elif isinstance(fields, dict) and fields[key] is not None and text[index] == "{":
+            result[key], index = parse_json_fields(text, index, fields[key])
+        else:
+            result[key], index = JSON_DECODER.raw_decode(text, index)
+        index = JSON_WHITESPACE.match(text, index).end()
+        if text[index] == ",":
+            index = JSON_WHITESPACE.match(text, index + 1).end()
+        elif text[index] == "}":
+            return result, index + 1
+        else:
+            raise ValueError("expected ',' or '}'")
+
+
+def parse_event_fields(line: str) -> Any:
+    # Oversized lines carry request payloads the metrics never read; decode only EVENT_FIELDS.
+    # Skipped values are bracket- and string-matched but not fully validated.
+    index = JSON_WHITESPACE.match(line).end()
+    if not line.startswith("{", index):
+        return json.loads(line)
+    try:
+        event, index = parse_json_fields(line, index, EVENT_FIELDS)
+    except (ValueError, IndexError) as exc:
+        raise json.JSONDecodeError(str(exc), line, index) from None
+    if JSON_WHITESPACE.match(line, index).end() != len(line):
+        raise json.JSONDecodeError("Extra data", line, index)
+    return event
+
+
+def decode_event_line(raw: bytes, warnings: Counter[str], selective: bool = True) -> dict[str, Any] | None:
+    if selective and orjson is not None:
+        # NaN, lone surrogates, and invalid UTF-8 fail here and take the standard path below.
+        # orjson reads integers beyond 64 bits as floats; no metric field comes close.
+        try:
+            event = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            event = None
+        if event is not None:
+            if b"\xef\xbf\xbd" in raw:
                 warnings["invalid_utf8_replaced"] += 1
-            try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
-                warnings["invalid_json_lines_skipped"] += 1
-                continue
             if isinstance(event, dict):
-                yield event
-            else:
-                warnings["non_object_json_lines_skipped"] += 1
+                return event
+            warnings["non_object_json_lines_skipped"] += 1
+            return None
+    line = raw.decode("utf-8", errors="replace")
+    if "\ufffd" in line:
+        warnings["invalid_utf8_replaced"] += 1
+    try:
+        event = parse_event_fields(line) if selective and len(raw) > SELECTIVE_LINE_BYTES else json.loads(line)
+    except json.JSONDecodeError:
+        warnings["invalid_json_lines_skipped"] += 1
+        return None
+    if isinstance(event, dict):
+        return event
+    warnings["non_object_json_lines_skipped"] += 1
+    return None
+
+
+def iter_event_records(
+    path: Path,
+    warnings: Counter[str],
+    start: int = 0,
+    stop: int | None = None,
+    selective: bool = True,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    offset = start
+    with path.open("rb") as handle:
+        handle.seek(start)
+        for raw in handle:
+            if stop is not None and offset >= stop:
+                break
+            start = offset
+            offset += len(raw)
+            event = decode_event_line(raw, warnings, selective)
+            if event is not None:
+                yield start, event
+
+
+def iter_events(path: Path, warnings: Counter[str]) -> Iterator[dict[str, Any]]:
+    # Full events: callers here read request text that the metrics path skips
+    for _, event in iter_event_records(path, warnings, selective=False):
+        yield event
 
 
 def request_options(attrs: dict[str, Any]) -> dict[str, Any]:
@@ -139,22 +293,113 @@ def log_paths(session_dir: Path) -> list[Path]:
     return [path for path in [main, *children] if path.is_file()]
 
 
-def event_identity(event: dict[str, Any]) -> str:
-    attrs = event.get("attrs") if isinstance(event.get("attrs"), dict) else {}
-    identity = {
-        "type": event.get("type"),
-        "name": event.get("name"),
-        "span": event.get("spanId"),
-        "parent": event.get("parentSpanId"),
-        "ts": event.get("ts"),
-        "dur": event.get("dur"),
-        "model": attrs.get("model"),
-        "input": attrs.get("inputTokens"),
-        "output": attrs.get("outputTokens"),
-        "aiu": attrs.get("copilotUsageNanoAiu"),
-    }
-    encoded = json.dumps(identity, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-    return hashlib.sha256(encoded.encode("ascii")).hexdigest()
+def identity_value(value: Any) -> Any:
+    if value is None or type(value) is str or type(value) is int:
+        return value
+    if type(value) is bool or type(value) is float:
+        # true, 1 and 1.0 are distinct identities, as in the JSON encoding
+        return (type(value).__name__, value)
+    return ("json", json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True))
+
+
+def event_key(event: dict[str, Any]) -> tuple[Any, ...]:
+    attrs = event.get("attrs")
+    if not isinstance(attrs, dict):
+        attrs = {}
+    key = (
+        event.get("type"),
+        event.get("name"),
+        event.get("spanId"),
+        event.get("parentSpanId"),
+        event.get("ts"),
+        event.get("dur"),
+        attrs.get("model"),
+        attrs.get("inputTokens"),
+        attrs.get("outputTokens"),
+        attrs.get("copilotUsageNanoAiu"),
+    )
+    for value in key:
+        if value is not None and type(value) is not str and type(value) is not int:
+            return tuple(identity_value(item) for item in key)
+    return key
+
+
+def stable_hash64(key: tuple[Any, ...]) -> int:
+    # Process-independent, unlike hash(): used when dedup state is cached on disk
+    digest = hashlib.blake2b(repr(key).encode("utf-8", errors="backslashreplace"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class EventDeduper:
+    """Session-wide duplicate detector over event_key identities.
+
+    exact: keeps every identity tuple.
+    compact: keeps only the 64-bit tuple hash and first-seen line location per
+    event; the first hash hit is verified by re-reading that line (so a collision
+    never drops a distinct event), and only keys that do repeat are kept.
+    """
+
+    def __init__(self, mode: str = "compact", hasher: Callable[[tuple[Any, ...]], int] = hash) -> None:
+        if mode not in DEDUP_MODES:
+            raise ValueError(f"unknown dedup mode: {mode}")
+        self.mode = mode
+        self.hasher = hasher
+        self.collisions = 0
+        self._keys: set[tuple[Any, ...]] = set()
+        self._first: dict[int, int] = {}
+        self._paths: list[Path] = []
+
+    def add_file(self, path: Path) -> int:
+        self._paths.append(path)
+        return len(self._paths) - 1
+
+    def is_duplicate(self, key: tuple[Any, ...], file_index: int = 0, offset: int = 0) -> bool:
+        if self.mode == "exact":
+            if key in self._keys:
+                return True
+            self._keys.add(key)
+            return False
+        digest = self.hasher(key)
+        location = self._first.get(digest)
+        if location is None:
+            self._first[digest] = (file_index << LOCATION_OFFSET_BITS) | offset
+            return False
+        if key in self._keys:
+            return True
+        if self._key_at(location) == key:
+            # Verified once; later copies of this event compare in memory
+            self._keys.add(key)
+            return True
+        # Distinct event sharing a hash: fall back to exact keys for this hash
+        self.collisions += 1
+        self._keys.add(key)
+        return False
+
+    def state(self) -> dict[str, Any]:
+        return {"mode": self.mode, "first": self._first, "keys": list(self._keys), "collisions": self.collisions}
+
+    @classmethod
+    def from_state(
+        cls,
+        state: dict[str, Any],
+        paths: list[Path],
+        hasher: Callable[[tuple[Any, ...]], int] = hash,
+    ) -> EventDeduper:
+        deduper = cls(state["mode"], hasher)
+        deduper._first = dict(state["first"])
+        deduper._keys = set(state["keys"])
+        deduper.collisions = state["collisions"]
+        deduper._paths = list(paths)
+        return deduper
+
+    def _key_at(self, location: int) -> tuple[Any, ...] | None:
+        path = self._paths[location >> LOCATION_OFFSET_BITS]
+        with path.open("rb") as handle:
+            handle.seek(location & ((1 << LOCATION_OFFSET_BITS) - 1))
+            raw = handle.readline()
+        # Same decoder as the extraction pass, so an oversized first-seen line is re-read selectively
+        event = decode_event_line(raw, Counter())
+        return event_key(event) if event is not None else None
 
 
 def fingerprint(workload: dict[str, Any], measurement_scope: str) -> str:
@@ -178,70 +423,391 @@ def in_window(event: dict[str, Any], after: int | None, before: int | None) -> b
     return (after is None or timestamp >= after) and (before is None or timestamp <= before)
 
 
+def new_file_state() -> dict[str, Any]:
+    return {
+        "usage": defaultdict(Counter),
+        "llm_errors": 0,
+        "tool_calls": 0,
+        "tool_errors": 0,
+        "aiu_present_calls": 0,
+        "aiu_missing_calls": 0,
+        "first_main_request": None,
+        "last_main_response": None,
+        "first_main_event": None,
+        "spans": [],
+        "warnings": Counter(),
+    }
+
+
+def accumulate(
+    state: dict[str, Any],
+    role: str,
+    records: Iterable[tuple[int, dict[str, Any]]],
+    deduper: EventDeduper,
+    file_index: int,
+    after: int | None,
+    before: int | None,
+) -> None:
+    warnings = state["warnings"]
+    usage = state["usage"]
+    for offset, event in records:
+        if not in_window(event, after, before):
+            continue
+        if deduper.is_duplicate(event_key(event), file_index, offset):
+            warnings["duplicate_events_skipped"] += 1
+            continue
+        event_type = event.get("type")
+        attrs = event.get("attrs") if isinstance(event.get("attrs"), dict) else {}
+        timestamp = event.get("ts")
+        if isinstance(timestamp, int):
+            if role == "orchestrator" and (state["first_main_event"] is None or timestamp < state["first_main_event"]):
+                state["first_main_event"] = timestamp
+            if event_type in SPAN_KINDS:
+                duration = event.get("dur")
+                state["spans"].append((
+                    timestamp,
+                    duration if isinstance(duration, int) and duration > 0 else 0,
+                    str(event["spanId"]) if event.get("spanId") else None,
+                    str(event["parentSpanId"]) if event.get("parentSpanId") else None,
+                    SPAN_KINDS[event_type],
+                    str(attrs.get("model") or "unknown") if event_type == "llm_request" else "",
+                ))
+        if event_type == "llm_request":
+            model = str(attrs.get("model") or "unknown")
+            effort = reasoning_effort(attrs)
+            bucket = usage[(model, effort)]
+            bucket["llm_calls"] += 1
+            bucket["input_tokens"] += int(attrs.get("inputTokens") or 0)
+            bucket["output_tokens"] += int(attrs.get("outputTokens") or 0)
+            bucket["cached_tokens"] += int(attrs.get("cachedTokens") or 0)
+            bucket["duration_ms"] += int(event.get("dur") or 0)
+            if "copilotUsageNanoAiu" in attrs and attrs.get("copilotUsageNanoAiu") is not None:
+                bucket["nano_aiu"] += int(attrs.get("copilotUsageNanoAiu") or 0)
+                state["aiu_present_calls"] += 1
+            else:
+                state["aiu_missing_calls"] += 1
+            if model == "unknown":
+                warnings["llm_requests_missing_model"] += 1
+            if event.get("status") == "error":
+                state["llm_errors"] += 1
+            if role == "orchestrator" and isinstance(event.get("ts"), int):
+                state["first_main_request"] = min(state["first_main_request"] or event["ts"], event["ts"])
+        elif event_type == "agent_response" and role == "orchestrator" and isinstance(event.get("ts"), int):
+            state["last_main_response"] = max(state["last_main_response"] or event["ts"], event["ts"])
+        elif event_type == "tool_call":
+            state["tool_calls"] += 1
+            if event.get("status") == "error":
+                state["tool_errors"] += 1
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        cuts = ordered * 99
+    else:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+    summary = {f"p{rank}_seconds": round(cuts[rank - 1] / 1000, 3) for rank in LATENCY_PERCENTILES}
+    summary["max_seconds"] = round(ordered[-1] / 1000, 3)
+    return summary
+
+
+def critical_path(
+    starts: list[int],
+    ends: list[int],
+    children: list[list[int]],
+    labels: list[tuple[str, str, str]],
+) -> dict[tuple[str, str, str], list[float]]:
+    # Walk back from each span's end: the child that finishes last before the cursor is on the path,
+    # anything uncovered between those children is the span's own time. Iterative: traces can nest deeply.
+    totals: dict[tuple[str, str, str], list[float]] = defaultdict(lambda: [0.0, 0])
+
+    def frame(node: int, limit: int) -> list[Any]:
+        pending = sorted(children[node], key=ends.__getitem__, reverse=True)
+        return [node, min(ends[node], limit), iter(pending), 0]
+
+    stack = [frame(0, ends[0])]
+    while stack:
+        current = stack[-1]
+        node = current[0]
+        for child in current[2]:
+            cursor = current[1]
+            if starts[child] >= cursor or cursor <= starts[node]:
+                continue
+            child_end = min(ends[child], cursor)
+            current[3] += cursor - child_end
+            current[1] = max(starts[child], starts[node])
+            stack.append(frame(child, child_end))
+            break
+        else:
+            stack.pop()
+            own = current[3] + max(0, current[1] - starts[node])
+            if own > 0:
+                bucket = totals[labels[node]]
+                bucket[0] += own
+                bucket[1] += 1
+    return totals
+
+
+def span_analysis(file_states: list[tuple[str, dict[str, Any]]], last_main_response: int | None) -> dict[str, Any]:
+    # Index 0 is the session root; each subagent log gets a virtual root of its own
+    starts, ends, labels = [0], [0], [("orchestrator", "idle", "")]
+    parent_ids: list[str | None] = [None]
+    by_id: dict[str, int] = {}
+    file_ranges = []
+    durations: dict[str, list[int]] = defaultdict(list)
+    for role, state in file_states:
+        first = len(starts)
+        for start, duration, span_id, parent_id, kind, model in state["spans"]:
+            if span_id is not None:
+                by_id.setdefault(span_id, len(starts))
+            starts.append(start)
+            ends.append(start + duration)
+            labels.append((role, kind, model))
+            parent_ids.append(parent_id)
+            if kind == "llm":
+                durations[model].append(duration)
+        file_ranges.append((role, first, len(starts)))
+    if not durations:
+        return {}
+
+    span_count = len(starts) - 1
+    first_events = [state["first_main_event"] for _, state in file_states if state["first_main_event"] is not None]
+    starts[0] = min(min(starts[1:]), *first_events) if first_events else min(starts[1:])
+    ends[0] = max(max(ends), last_main_response or 0)
+    children: list[list[int]] = [[] for _ in starts]
+    main_tools = [
+        index for role, first, stop in file_ranges[:1] if role == "orchestrator"
+        for index in range(first, stop) if labels[index][1] == "tool"
+    ]
+    orphans = 0
+    for role, first, stop in file_ranges:
+        file_root = 0
+        if stop > first and role != "orchestrator":
+            # A subagent log hangs under the tightest main tool call enclosing it, else under the session
+            file_root = len(starts)
+            starts.append(min(starts[first:stop]))
+            ends.append(max(ends[first:stop]))
+            labels.append((role, "idle", ""))
+            children.append([])
+            enclosing = [tool for tool in main_tools if starts[tool] <= starts[file_root] and ends[tool] >= ends[file_root]]
+            children[max(enclosing, key=starts.__getitem__) if enclosing else 0].append(file_root)
+        for index in range(first, stop):
+            parent_id = parent_ids[index]
+            parent = by_id.get(parent_id, -1) if parent_id else -1
+            if parent < 0 or parent == index:
+                orphans += parent_id is not None
+                parent = file_root
+            children[parent].append(index)
+    totals = critical_path(starts, ends, children, labels)
+
+    gaps = []
+    covered_until = None
+    for start, end in sorted(zip(starts[1:span_count + 1], ends[1:span_count + 1])):
+        if covered_until is not None and start > covered_until:
+            gaps.append(start - covered_until)
+        covered_until = end if covered_until is None else max(covered_until, end)
+
+    first_llm = min(starts[index] for index in range(1, span_count + 1) if labels[index][1] == "llm")
+    return {
+        "llm_by_model": [
+            {"model": model, "llm_calls": len(values), **percentiles(values)}
+            for model, values in sorted(durations.items())
+        ],
+        "time_to_first_llm_seconds": round((first_llm - starts[0]) / 1000, 3),
+        "idle_gaps": {
+            "count": len(gaps),
+            "total_seconds": round(sum(gaps) / 1000, 3),
+            "longest_seconds": round(max(gaps) / 1000, 3) if gaps else 0.0,
+        },
+        "critical_path": {
+            "seconds": round((ends[0] - starts[0]) / 1000, 3),
+            "components": [
+                {"role": role, "kind": kind, "model": model, "seconds": round(seconds / 1000, 3), "spans": spans}
+                for (role, kind, model), (seconds, spans) in sorted(totals.items(), key=lambda item: (-item[1][0], item[0]))
+            ],
+        },
+        "span_tree": {"spans": span_count, "unresolved_parents": orphans},
+    }
+
+
+def complete_length(path: Path, size: int) -> int:
+    # End of the last newline-terminated line; a live writer may still be appending the rest
+    with path.open("rb") as handle:
+        position = size
+        while position > 0:
+            chunk_start = max(0, position - 65536)
+            handle.seek(chunk_start)
+            chunk = handle.read(position - chunk_start)
+            newline = chunk.rfind(b"\n")
+            if newline >= 0:
+                return chunk_start + newline + 1
+            position = chunk_start
+    return 0
+
+
+def prefix_digest(path: Path, offset: int) -> str:
+    with path.open("rb") as handle:
+        handle.seek(max(0, offset - CACHE_DIGEST_BYTES))
+        data = handle.read(min(offset, CACHE_DIGEST_BYTES))
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_file(cache_dir: Path, session_dir: Path, after: int | None, before: int | None, dedup: str) -> Path:
+    # The absolute session path only enters as a hash; cache files never store paths
+    identity = json.dumps([str(session_dir), after, before, dedup], ensure_ascii=True)
+    digest = hashlib.sha256(identity.encode("ascii")).hexdigest()[:16]
+    return cache_dir.expanduser() / f"{session_dir.name[:64]}-{digest}.extract-cache"
+
+
+def dump_file_state(state: dict[str, Any]) -> dict[str, Any]:
+    dumped = dict(state)
+    dumped["usage"] = {bucket: dict(values) for bucket, values in state["usage"].items()}
+    dumped["warnings"] = dict(state["warnings"])
+    return dumped
+
+
+def load_file_state(dumped: dict[str, Any]) -> dict[str, Any]:
+    state = dict(dumped)
+    state["usage"] = defaultdict(Counter, {bucket: Counter(values) for bucket, values in dumped["usage"].items()})
+    state["warnings"] = Counter(dumped["warnings"])
+    return state
+
+
+def entry_is_current(entry: dict[str, Any], session_dir: Path) -> bool:
+    for name, cached in entry["files"].items():
+        try:
+            stat = (session_dir / name).stat()
+        except OSError:
+            return False
+        if stat.st_ino != cached["inode"] or stat.st_size < cached["offset"]:
+            return False
+        if (stat.st_size, stat.st_mtime_ns) != (cached["size"], cached["mtime_ns"]):
+            # Appended or rewritten: only an untouched prefix may be reused
+            if prefix_digest(session_dir / name, cached["offset"]) != cached["prefix_digest"]:
+                return False
+    return True
+
+
+def load_cache_entry(cache_path: Path, session_dir: Path) -> dict[str, Any] | None:
+    try:
+        entry = marshal.loads(cache_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, dict) or entry.get("format") != CACHE_FORMAT:
+        return None
+    if not entry_is_current(entry, session_dir):
+        return None
+    for cached in entry["files"].values():
+        cached["state"] = load_file_state(cached["state"])
+    return entry
+
+
+def save_cache_entry(cache_path: Path, entry: dict[str, Any]) -> None:
+    dumped = dict(entry)
+    dumped["files"] = {
+        name: {**cached, "state": dump_file_state(cached["state"])}
+        for name, cached in entry["files"].items()
+    }
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(marshal.dumps(dumped))
+    os.replace(temporary, cache_path)
+
+
 def extract_session(
     session_dir: Path,
     *,
     after: int | None = None,
     before: int | None = None,
     workload: dict[str, Any] | None = None,
+    dedup: str = "compact",
+    cache_dir: Path | None = None,
+    live: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     session_dir = session_dir.resolve()
     paths = log_paths(session_dir)
     if not paths or paths[0].name != "main.jsonl":
         raise ValueError(f"main.jsonl not found: {session_dir}")
 
-    warnings: Counter[str] = Counter()
-    seen: set[str] = set()
-    aggregates: dict[tuple[str, str, str], Counter[str]] = defaultdict(Counter)
-    first_main_request: int | None = None
-    last_main_response: int | None = None
-    llm_errors = 0
-    tool_calls = 0
-    tool_errors = 0
-    aiu_present_calls = 0
-    aiu_missing_calls = 0
+    cache_path = cache_file(Path(cache_dir), session_dir, after, before, dedup) if cache_dir else None
+    incremental = cache_path is not None or live is not None
+    entry = load_cache_entry(cache_path, session_dir) if cache_path else None
+    deduper = None
+    if live is not None:
+        # Follow mode keeps the entry and deduper in memory between updates
+        live["rewritten"] = "entry" in live and not entry_is_current(live["entry"], session_dir)
+        if "entry" in live and not live["rewritten"]:
+            entry, deduper = live["entry"], live["deduper"]
+    if entry is None:
+        entry = {"format": CACHE_FORMAT, "order": [], "files": {}, "dedup": None}
+    hasher = stable_hash64 if cache_path else hash
+    if deduper is None and entry["dedup"] is not None:
+        deduper = EventDeduper.from_state(entry["dedup"], [session_dir / name for name in entry["order"]], hasher)
+    elif deduper is None:
+        deduper = EventDeduper(dedup, hasher)
 
+    partial_lines: list[tuple[Path, str, int, int]] = []
     for path in paths:
         role = role_for(path)
-        for event in iter_events(path, warnings):
-            if not in_window(event, after, before):
-                continue
-            identity = event_identity(event)
-            if identity in seen:
-                warnings["duplicate_events_skipped"] += 1
-                continue
-            seen.add(identity)
-            event_type = event.get("type")
-            attrs = event.get("attrs") if isinstance(event.get("attrs"), dict) else {}
-            if event_type == "llm_request":
-                model = str(attrs.get("model") or "unknown")
-                effort = reasoning_effort(attrs)
-                bucket = aggregates[(role, model, effort)]
-                bucket["llm_calls"] += 1
-                bucket["input_tokens"] += int(attrs.get("inputTokens") or 0)
-                bucket["output_tokens"] += int(attrs.get("outputTokens") or 0)
-                bucket["cached_tokens"] += int(attrs.get("cachedTokens") or 0)
-                bucket["duration_ms"] += int(event.get("dur") or 0)
-                if "copilotUsageNanoAiu" in attrs and attrs.get("copilotUsageNanoAiu") is not None:
-                    bucket["nano_aiu"] += int(attrs.get("copilotUsageNanoAiu") or 0)
-                    aiu_present_calls += 1
-                else:
-                    aiu_missing_calls += 1
-                if model == "unknown":
-                    warnings["llm_requests_missing_model"] += 1
-                if event.get("status") == "error":
-                    llm_errors += 1
-                if role == "orchestrator" and isinstance(event.get("ts"), int):
-                    first_main_request = min(first_main_request or event["ts"], event["ts"])
-            elif event_type == "agent_response" and role == "orchestrator" and isinstance(event.get("ts"), int):
-                last_main_response = max(last_main_response or event["ts"], event["ts"])
-            elif event_type == "tool_call":
-                tool_calls += 1
-                if event.get("status") == "error":
-                    tool_errors += 1
+        stat = path.stat()
+        cached = entry["files"].get(path.name)
+        if cached is None:
+            cached = {"offset": 0, "size": -1, "mtime_ns": -1, "state": new_file_state()}
+            entry["files"][path.name] = cached
+            entry["order"].append(path.name)
+            deduper.add_file(path)
+        file_index = entry["order"].index(path.name)
+        if (stat.st_size, stat.st_mtime_ns) != (cached["size"], cached["mtime_ns"]):
+            stop = complete_length(path, stat.st_size) if incremental else stat.st_size
+            if stop > cached["offset"]:
+                records = iter_event_records(path, cached["state"]["warnings"], cached["offset"], stop)
+                accumulate(cached["state"], role, records, deduper, file_index, after, before)
+            cached.update({
+                "inode": stat.st_ino,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "offset": stop,
+                "prefix_digest": prefix_digest(path, stop) if incremental else "",
+            })
+        if stat.st_size > cached["offset"]:
+            partial_lines.append((path, role, file_index, cached["offset"]))
+
+    if cache_path:
+        entry["dedup"] = deduper.state()
+        try:
+            save_cache_entry(cache_path, entry)
+        except OSError:
+            pass  # Read-only cache directory: the result is still complete
+    if live is not None:
+        # A line still being written is picked up by the next update instead
+        live.update(entry=entry, deduper=deduper)
+        partial_lines = []
+    # An unterminated last line counts for this result only; the next run re-reads it
+    for path, role, file_index, offset in partial_lines:
+        state = entry["files"][path.name]["state"]
+        accumulate(state, role, iter_event_records(path, state["warnings"], offset), deduper, file_index, after, before)
+
+    file_states = [(role_for(path), entry["files"][path.name]["state"]) for path in paths]
+    warnings: Counter[str] = Counter()
+    aggregates: dict[tuple[str, str, str], Counter[str]] = defaultdict(Counter)
+    for role, state in file_states:
+        warnings.update(state["warnings"])
+        for (model, effort), values in state["usage"].items():
+            aggregates[(role, model, effort)].update(values)
+    llm_errors = sum(state["llm_errors"] for _, state in file_states)
+    tool_calls = sum(state["tool_calls"] for _, state in file_states)
+    tool_errors = sum(state["tool_errors"] for _, state in file_states)
+    aiu_present_calls = sum(state["aiu_present_calls"] for _, state in file_states)
+    aiu_missing_calls = sum(state["aiu_missing_calls"] for _, state in file_states)
+    first_requests = [state["first_main_request"] for _, state in file_states if state["first_main_request"] is not None]
+    last_responses = [state["last_main_response"] for _, state in file_states if state["last_main_response"] is not None]
+    first_main_request = min(first_requests) if first_requests else None
+    last_main_response = max(last_responses) if last_responses else None
 
     if not aggregates:
         raise ValueError(f"no llm_request events found: {session_dir}")
+    if deduper.collisions:
+        warnings["dedup_hash_collisions"] += deduper.collisions
 
     usage = []
     for (role, model, effort), values in sorted(aggregates.items()):
@@ -279,6 +845,8 @@ def extract_session(
     }
     workload_payload["fingerprint"] = fingerprint(workload_payload, measurement_scope)
 
+    latency = span_analysis(file_states, last_main_response)
+
     observed = None
     if first_main_request is not None and last_main_response is not None and last_main_response >= first_main_request:
         observed = round((last_main_response - first_main_request) / 1000, 3)
@@ -309,6 +877,7 @@ def extract_session(
                 "complete": complete_aiu,
             },
         },
+        "latency": latency,
         "operations": {
             "llm_calls": total_calls,
             "llm_errors": llm_errors,
@@ -360,6 +929,178 @@ def select_session_dirs(args: argparse.Namespace) -> list[Path]:
     return unique
 
 
+def worker_count(jobs: int, session_count: int) -> int:
+    if jobs < 0:
+        raise ValueError("--jobs must not be negative")
+    return max(1, min(jobs or os.cpu_count() or 1, session_count))
+
+
+def iter_extracted(
+    paths: list[Path],
+    *,
+    jobs: int = 1,
+    ordered: bool = True,
+    after: int | None = None,
+    before: int | None = None,
+    workload: dict[str, Any] | None = None,
+    dedup: str = "compact",
+    cache_dir: Path | None = None,
+) -> Iterator[dict[str, Any]]:
+    extract = partial(
+        extract_session, after=after, before=before, workload=workload, dedup=dedup, cache_dir=cache_dir,
+    )
+    workers = worker_count(jobs, len(paths))
+    if workers == 1:
+        for path in paths:
+            yield extract(path)
+        return
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        if ordered:
+            yield from pool.map(extract, paths)
+        else:
+            pending = iter(paths)
+            in_flight = {pool.submit(extract, path) for path in islice(pending, workers * 2)}
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    next_path = next(pending, None)
+                    if next_path is not None:
+                        in_flight.add(pool.submit(extract, next_path))
+                    yield future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_stored(sessions: Iterable[dict[str, Any]], connection: sqlite3.Connection) -> Iterator[dict[str, Any]]:
+    for session in sessions:
+        metrics_store.append_runs(connection, [normalize_run(session, label=session["session_id"])])
+        yield session
+
+
+def live_counters(session: dict[str, Any]) -> dict[str, Any]:
+    usage = session["usage"]
+    return {
+        "llm_calls": session["operations"]["llm_calls"],
+        "input_tokens": sum(item["input_tokens"] for item in usage),
+        "output_tokens": sum(item["output_tokens"] for item in usage),
+        "cached_tokens": sum(item["cached_tokens"] for item in usage),
+        "nano_aiu": sum(item["nano_aiu"] for item in usage),
+        "llm_calls_missing_aiu": session["cost"]["coverage"]["llm_calls_missing_aiu"],
+        "llm_duration_seconds": session["timing"]["active_llm_seconds"],
+        "llm_errors": session["operations"]["llm_errors"],
+        "tool_calls": session["operations"]["tool_calls"],
+        "tool_errors": session["operations"]["tool_errors"],
+        "log_files": session["operations"]["log_files"],
+    }
+
+
+def live_snapshot(
+    session: dict[str, Any],
+    previous: dict[str, Any] | None,
+    seconds: float,
+    sequence: int,
+    rewritten: bool,
+) -> dict[str, Any]:
+    totals = live_counters(session)
+    interval: dict[str, Any] | None = None
+    # After a rewrite or compaction, counters can drop: report no delta rather than a negative one
+    if previous is not None and not rewritten:
+        delta = {key: round(value - previous[key], 3) for key, value in totals.items()}
+        minutes = seconds / 60 if seconds > 0 else None
+        interval = {
+            "seconds": round(seconds, 3),
+            **delta,
+            "aiu": round(delta["nano_aiu"] / 1_000_000_000, 6),
+            "aiu_per_minute": round(delta["nano_aiu"] / 1_000_000_000 / minutes, 6) if minutes else None,
+            "mean_llm_latency_seconds": (
+                round(delta["llm_duration_seconds"] / delta["llm_calls"], 3) if delta["llm_calls"] > 0 else None
+            ),
+            "error_rate": round(
+                (delta["llm_errors"] + delta["tool_errors"]) / (delta["llm_calls"] + delta["tool_calls"]), 6,
+            ) if delta["llm_calls"] + delta["tool_calls"] > 0 else None,
+        }
+    return {
+        "status": "PASS",
+        "snapshot": sequence,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "session_id": session["session_id"],
+        "primary_model": session["primary_model"],
+        "log_rewritten": rewritten,
+        "totals": {**totals, "total_aiu": session["cost"]["total_aiu"]},
+        "interval": interval,
+        "warnings": session["warnings"],
+    }
+
+
+def follow_session(
+    session_dir: Path,
+    *,
+    interval: float,
+    after: int | None = None,
+    before: int | None = None,
+    workload: dict[str, Any] | None = None,
+    dedup: str = "compact",
+    max_updates: int | None = None,
+    idle_exit: float | None = None,
+    output: Path | None = None,
+    stdout: TextIO | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    stdout = stdout or sys.stdout
+    handle = None
+    if output is not None:
+        output = output.expanduser().resolve()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        handle = output.open("a", encoding="utf-8")
+    live: dict[str, Any] = {}
+    previous: dict[str, Any] | None = None
+    previous_at = time.monotonic()
+    last_growth = previous_at
+    sizes: dict[str, int] = {}
+    sequence = 0
+    try:
+        while max_updates is None or sequence < max_updates:
+            if sequence:
+                sleep(max(0.0, previous_at + interval - time.monotonic()))
+            now = time.monotonic()
+            current = {path.name: path.stat().st_size for path in log_paths(session_dir)}
+            if current != sizes:
+                sizes, last_growth = current, now
+            sequence += 1
+            try:
+                session = extract_session(
+                    session_dir, after=after, before=before, workload=workload, dedup=dedup, live=live,
+                )
+            except ValueError as exc:
+                # The session has not made its first LLM call yet
+                snapshot = {
+                    "status": "WAITING",
+                    "snapshot": sequence,
+                    "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "session_id": session_dir.name,
+                    "message": str(exc),
+                }
+            else:
+                snapshot = live_snapshot(session, previous, now - previous_at, sequence, live["rewritten"])
+                previous = snapshot["totals"]
+            previous_at = now
+            line = json.dumps(snapshot, ensure_ascii=False) + "\n"
+            stdout.write(line)
+            stdout.flush()
+            if handle is not None:
+                handle.write(line)
+                handle.flush()
+            if idle_exit is not None and now - last_growth >= idle_exit:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if handle is not None:
+            handle.close()
+    return sequence
+
+
 def atomic_write_json(path: Path, payload: dict[str, Any]) -> None:
     path = path.expanduser().resolve()
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -368,6 +1109,49 @@ def atomic_write_json(path: Path, payload: dict[str, Any]) -> None:
     os.replace(temporary, path)
 
 
+def stream_jsonl(sessions: Iterable[dict[str, Any]], output: Path | None, stdout: TextIO | None = None) -> dict[str, Any]:
+    stdout = stdout or sys.stdout
+    handle = None
+    temporary = None
+    if output is not None:
+        output = output.expanduser().resolve()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        temporary = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+        handle = temporary.open("w", encoding="utf-8")
+    count = 0
+    summary: dict[str, Any]
+    try:
+        try:
+            for session in sessions:
+                line = json.dumps(session, ensure_ascii=False) + "\n"
+                stdout.write(line)
+                stdout.flush()
+                if handle is not None:
+                    handle.write(line)
+                count += 1
+            summary = {"status": "PASS"}
+        except (OSError, ValueError, json.JSONDecodeError, sqlite3.Error) as exc:
+            summary = {"status": "FAIL", "error": {"type": type(exc).__name__, "message": str(exc)}}
+        summary.update({
+            "schema_version": 1,
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "session_count": count,
+        })
+        line = json.dumps(summary, ensure_ascii=False) + "\n"
+        stdout.write(line)
+        stdout.flush()
+        if handle is not None:
+            handle.write(line)
+            handle.close()
+            handle = None
+            os.replace(temporary, output)
+    finally:
+        if handle is not None:
+            handle.close()
+            temporary.unlink(missing_ok=True)
+    return summary
+
+
 def render(payload: dict[str, Any], json_only: bool) -> None:
     if not json_only:
         print("=== Copilot Session Metrics ===")
@@ -391,10 +1175,33 @@ def main() -> int:
             "workflow_version": args.workflow_version,
             "rubric_version": args.rubric_version,
         }
-        sessions = [
-            extract_session(path, after=after, before=before, workload=workload)
-            for path in select_session_dirs(args)
-        ]
+        paths = select_session_dirs(args)
+        cache_dir = Path(args.cache_dir) if args.cache_dir else None
+        if args.follow:
+            if len(paths) != 1:
+                raise ValueError("--follow needs exactly one session; use --session-dir, --session-id, or --recent 1")
+            if args.jsonl or args.store or cache_dir:
+                raise ValueError("--follow cannot be combined with --jsonl, --store, or --cache-dir")
+            if args.interval <= 0:
+                raise ValueError("--interval must be positive")
+            follow_session(
+                paths[0], interval=args.interval, after=after, before=before, workload=workload, dedup=args.dedup,
+                max_updates=args.max_updates, idle_exit=args.idle_exit,
+                output=Path(args.output_json) if args.output_json else None,
+            )
+            return 0
+        with closing(metrics_store.connect(Path(args.store))) if args.store else nullcontext() as connection:
+            extracted = iter_extracted(
+                paths, jobs=args.jobs, ordered=not args.jsonl, after=after, before=before, workload=workload,
+                dedup=args.dedup, cache_dir=cache_dir,
+            )
+            if connection is not None:
+                extracted = iter_stored(extracted, connection)
+            if args.jsonl:
+                output = Path(args.output_json) if args.output_json else None
+                summary = stream_jsonl(extracted, output)
+                return 1 if summary["status"] == "FAIL" and args.strict_exit_codes else 0
+            sessions = list(extracted)
         payload = {
             "status": "PASS",
             "schema_version": 1,
@@ -406,9 +1213,12 @@ def main() -> int:
             atomic_write_json(Path(args.output_json), payload)
         render(payload, args.json_only)
         return 0
-    except (OSError, ValueError, json.JSONDecodeError) as exc:
+    except (OSError, ValueError, json.JSONDecodeError, sqlite3.Error) as exc:
         payload = {"status": "FAIL", "error": {"type": type(exc).__name__, "message": str(exc)}}
-        render(payload, args.json_only)
+        if args.jsonl or args.follow:
+            print(json.dumps(payload, ensure_ascii=False))
+        else:
+            render(payload, args.json_only)
         return 1 if args.strict_exit_codes else 0
 
 
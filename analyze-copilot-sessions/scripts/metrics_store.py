@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Append-only SQLite store of normalized Copilot session runs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+
+SCHEMA_VERSION = 1
+METRIC_COLUMNS = (
+    "total_aiu",
+    "aiu_per_unit",
+    "elapsed_seconds",
+    "elapsed_seconds_per_unit",
+    "active_llm_seconds",
+    "active_llm_seconds_per_unit",
+    "error_rate",
+    "llm_errors",
+    "tool_errors",
+)
+WORKLOAD_COLUMNS = ("task_kind", "revision", "workflow_version", "rubric_version", "unit_name", "unit_count", "fingerprint")
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_key TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    label TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    source_format TEXT NOT NULL,
+    model TEXT NOT NULL,
+    reasoning_effort TEXT NOT NULL,
+    {", ".join(f"{column} {'INTEGER' if column == 'unit_count' else 'TEXT'}" for column in WORKLOAD_COLUMNS)},
+    measurement_scope TEXT,
+    {", ".join(f"{column} REAL" for column in METRIC_COLUMNS)},
+    quality_level TEXT NOT NULL,
+    quality_passed INTEGER,
+    quality TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_key ON runs(run_key, id);
+CREATE INDEX IF NOT EXISTS idx_runs_group ON runs(model, reasoning_effort);
+CREATE INDEX IF NOT EXISTS idx_runs_workload ON runs(task_kind, fingerprint);
+CREATE VIEW IF NOT EXISTS latest_runs AS
+    SELECT * FROM runs WHERE id IN (SELECT MAX(id) FROM runs GROUP BY run_key);
+"""
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    path = path.expanduser().resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    row = connection.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None:
+        connection.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        connection.commit()
+    elif row[0] != str(SCHEMA_VERSION):
+        connection.close()
+        raise ValueError(f"unsupported metrics store schema {row[0]}: {path.name}")
+    return connection
+
+
+def run_key(run: dict[str, Any]) -> str:
+    # A re-extracted snapshot of the same session and workload supersedes the older row
+    identity = [
+        run["session_id"] or run["label"],
+        run["workload"]["fingerprint"],
+        run["measurement_scope"],
+    ]
+    return hashlib.sha256(json.dumps(identity, sort_keys=True, ensure_ascii=True).encode("ascii")).hexdigest()[:24]
+
+
+def run_row(run: dict[str, Any], ingested_at: str) -> tuple[Any, ...]:
+    record = json.dumps(run, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    quality = run["quality"]
+    scope = run["measurement_scope"]
+    return (
+        run_key(run),
+        hashlib.sha256(record.encode("utf-8")).hexdigest(),
+        ingested_at,
+        run["label"],
+        run["session_id"],
+        run["source_format"],
+        run["primary_model"]["model"],
+        run["primary_model"]["reasoning_effort"],
+        *(run["workload"].get(column) for column in WORKLOAD_COLUMNS),
+        json.dumps(scope, sort_keys=True, ensure_ascii=False) if scope is not None else None,
+        *(run["metrics"].get(column) for column in METRIC_COLUMNS),
+        quality["level"],
+        None if quality["passed"] is None else int(quality["passed"]),
+        json.dumps(quality, sort_keys=True, ensure_ascii=False),
+        record,
+    )
+
+
+def append_runs(connection: sqlite3.Connection, runs: Iterable[dict[str, Any]]) -> int:
+    ingested_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    columns = (
+        "run_key", "content_hash", "ingested_at", "label", "session_id", "source_format", "model",
+        "reasoning_effort", *WORKLOAD_COLUMNS, "measurement_scope", *METRIC_COLUMNS,
+        "quality_level", "quality_passed", "quality", "record",
+    )
+    statement = f"INSERT INTO runs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    inserted = 0
+    with connection:
+        for run in runs:
+            row = run_row(run, ingested_at)
+            # Re-ingesting an unchanged run is a no-op; any other snapshot becomes the latest one
+            latest = connection.execute(
+                "SELECT content_hash FROM runs WHERE run_key = ? ORDER BY id DESC LIMIT 1", (row[0],)
+            ).fetchone()
+            if latest is None or latest[0] != row[1]:
+                connection.execute(statement, row)
+                inserted += 1
+    return inserted
+
+
+def load_runs(
+    connection: sqlite3.Connection,
+    *,
+    task_kind: str | None = None,
+    fingerprint: str | None = None,
+    full: bool = False,
+) -> list[dict[str, Any]]:
+    conditions = []
+    parameters: list[Any] = []
+    if task_kind:
+        conditions.append("task_kind = ?")
+        parameters.append(task_kind)
+    if fingerprint:
+        conditions.append("fingerprint = ?")
+        parameters.append(fingerprint)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    # Superseded runs keep the position of their first ingestion so tie-breaks stay stable
+    order = " ORDER BY (SELECT MIN(first.id) FROM runs AS first WHERE first.run_key = latest_runs.run_key)"
+    if full:
+        rows = connection.execute(f"SELECT record FROM latest_runs{where}{order}", parameters)
+        return [json.loads(record) for (record,) in rows]
+    columns = (
+        "label", "session_id", "model", "reasoning_effort", *WORKLOAD_COLUMNS, "measurement_scope",
+        *METRIC_COLUMNS, "quality",
+    )
+    rows = connection.execute(f"SELECT {', '.join(columns)} FROM latest_runs{where}{order}", parameters)
+    runs = []
+    for row in rows:
+        values = dict(zip(columns, row))
+        runs.append({
+            "label": values["label"],
+            "session_id": values["session_id"],
+            "measurement_scope": json.loads(values["measurement_scope"]) if values["measurement_scope"] is not None else None,
+            "primary_model": {"model": values["model"], "reasoning_effort": values["reasoning_effort"]},
+            "workload": {column: values[column] for column in WORKLOAD_COLUMNS},
+            "metrics": {
+                column: int(values[column]) if column in ("llm_errors", "tool_errors") else values[column]
+                for column in METRIC_COLUMNS
+            },
+            "quality": json.loads(values["quality"]),
+        })
+    return runs
@@ -6,11 +6,13 @@ from __future__ import annotations
 import argparse
 import base64
 import json
+import math
 import os
 import re
 import shutil
 import sqlite3
 import sys
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from urllib.parse import unquote, urlparse
@@ -30,16 +32,56 @@ CHRONICLE_TABLES = (
     ("turns", "session_id"),
     ("sessions", "id"),
 )
+CHRONICLE_BATCH_SIZE = 200
+TEMPORARY_INDEX_PREFIX = "prune_chat_sessions_"
+VACUUM_STEP_PAGES = 256
+
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(value: str) -> int:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*", value, re.IGNORECASE)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid size: {value}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def format_bytes(size: float) -> str:
+    if size < 1024:
+        return f"{int(size)} B"
+    for unit in ("KiB", "MiB", "GiB"):
+        size /= 1024
+        if size < 1024:
+            break
+    return f"{size:.1f} {unit}"
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Dry-run or prune local Copilot Chat sessions for one VS Code workspace.",
+        description="Dry-run or prune local Copilot Chat sessions for one VS Code workspace or every workspace.",
     )
     target = parser.add_mutually_exclusive_group(required=True)
     target.add_argument("--workspace", help="Workspace root or .code-workspace path")
     target.add_argument("--workspace-storage", help="Exact VS Code workspaceStorage child directory")
-    parser.add_argument("--older-than-hours", type=float, required=True, help="Delete sessions older than this age")
+    target.add_argument(
+        "--all-workspaces",
+        action="store_true",
+        help="Plan and apply retention across every workspace storage in one pass",
+    )
+    parser.add_argument(
+        "--storage-root",
+        action="append",
+        default=[],
+        help="workspaceStorage directory for --all-workspaces; repeatable; default: detected VS Code roots",
+    )
+    parser.add_argument("--older-than-hours", type=float, help="Delete sessions older than this age")
+    parser.add_argument(
+        "--max-bytes",
+        type=parse_size,
+        help="Per-workspace byte budget for sessions plus auxiliary directories, e.g. 500M or 2G; "
+        "evicts the largest unprotected sessions first",
+    )
     parser.add_argument(
         "--protect-session-id",
         action="append",
@@ -48,6 +90,17 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--keep-latest", type=int, default=1, help="Always retain this many newest sessions")
     parser.add_argument("--apply", action="store_true", help="Apply deletion; default is dry-run")
+    parser.add_argument(
+        "--chronicle-batch-size",
+        type=int,
+        default=CHRONICLE_BATCH_SIZE,
+        help="Session IDs deleted per Chronicle transaction",
+    )
+    parser.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="Return freed Chronicle pages to disk with an incremental VACUUM when the database supports it",
+    )
     parser.add_argument("--json", action="store_true", help="Emit JSON")
     return parser.parse_args()
 
@@ -101,6 +154,51 @@ def workspace_paths(storage: Path) -> set[Path]:
     return paths
 
 
+def discover_storages(roots: list[Path]) -> list[Path]:
+    storages = []
+    for root in roots:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                storage = Path(entry.path)
+                if (storage / "workspace.json").is_file() and (storage / "chatSessions").is_dir():
+                    storages.append(storage.resolve())
+    return sorted(set(storages))
+
+
+def scan_session_files(session_root: Path) -> list[tuple[Path, float, int]]:
+    # One stat per session file, newest first; callers reuse these mtimes and sizes instead of re-stating
+    sessions = []
+    with os.scandir(session_root) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.name.endswith(".jsonl") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            sessions.append((Path(entry.path), stat.st_mtime, stat.st_size))
+    sessions.sort(key=lambda item: item[1], reverse=True)
+    return sessions
+
+
+def tree_size(root: Path) -> int:
+    total = 0
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(Path(entry.path))
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except FileNotFoundError:
+                        continue
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return total
+
+
 def newest_session_mtime(storage: Path) -> float | None:
     session_root = storage / "chatSessions"
     mtimes = [path.stat().st_mtime for path in session_root.glob("*.jsonl")]
@@ -287,62 +385,165 @@ def update_state_metadata(storage: Path, session_ids: set[str]) -> dict:
         connection.close()
 
 
-def delete_chronicle_rows(storage: Path, session_ids: set[str]) -> int:
-    database = chronicle_database(storage)
-    if not database.is_file() or not session_ids:
+def used_pages(connection: sqlite3.Connection) -> int:
+    page_count = connection.execute("PRAGMA page_count").fetchone()[0]
+    return page_count - connection.execute("PRAGMA freelist_count").fetchone()[0]
+
+
+def column_indexed(connection: sqlite3.Connection, table: str, column: str) -> bool:
+    # An INTEGER PRIMARY KEY is the rowid itself; any other key column needs a leading index column
+    columns = list(connection.execute(f"PRAGMA table_info({table})"))
+    primary_key = [row for row in columns if row[5] > 0]
+    if len(primary_key) == 1 and primary_key[0][1] == column and primary_key[0][2].upper() == "INTEGER":
+        return True
+    for row in list(connection.execute(f"PRAGMA index_list({table})")):
+        # A leftover index from an interrupted run is rebuilt by IF NOT EXISTS and dropped again
+        if row[1].startswith(TEMPORARY_INDEX_PREFIX):
+            continue
+        leading = connection.execute(f'PRAGMA index_info("{row[1]}")').fetchone()
+        if leading is not None and leading[2] == column:
+            return True
+    return False
+
+
+def create_temporary_indexes(connection: sqlite3.Connection, tables: list[tuple[str, str]]) -> list[str]:
+    # Without an index every chunk's DELETE scans the whole table; one index build is cheaper
+    created = []
+    for table, column in tables:
+        name = f"{TEMPORARY_INDEX_PREFIX}{table}_{column}"
+        if column_indexed(connection, table, column):
+            continue
+        with connection:
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({column})")
+        created.append(name)
+    return created
+
+
+def incremental_vacuum(connection: sqlite3.Connection) -> int:
+    # Only auto_vacuum=INCREMENTAL databases can shrink without a full VACUUM rewrite holding the lock
+    if connection.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
         return 0
+    page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+    before = connection.execute("PRAGMA page_count").fetchone()[0]
+    free_pages = connection.execute("PRAGMA freelist_count").fetchone()[0]
+    while free_pages:
+        connection.execute(f"PRAGMA incremental_vacuum({VACUUM_STEP_PAGES})").fetchall()
+        remaining = connection.execute("PRAGMA freelist_count").fetchone()[0]
+        if remaining >= free_pages:
+            break
+        free_pages = remaining
+    return (before - connection.execute("PRAGMA page_count").fetchone()[0]) * page_size
+
+
+def delete_chronicle_batches(
+    database: Path,
+    batches: list[set[str]],
+    batch_size: int = CHRONICLE_BATCH_SIZE,
+    vacuum: bool = False,
+) -> dict:
+    # Rows, freed bytes, and transactions are attributed to each batch; each chunk of session IDs
+    # commits on its own so a running VS Code never waits long for the write lock.
+    result = {
+        "rows": [0 for _ in batches],
+        "bytes": [0 for _ in batches],
+        "transactions": [0 for _ in batches],
+        "temporary_indexes": 0,
+        "vacuumed_bytes": 0,
+    }
+    if not database.is_file() or not any(batches):
+        return result
     connection = sqlite3.connect(database, timeout=30)
     try:
         connection.execute("PRAGMA busy_timeout = 30000")
-        existing_tables = {
-            row[0]
-            for row in connection.execute(
-                "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')"
+        schema = {
+            name: (kind, sql or "")
+            for name, kind, sql in connection.execute(
+                "SELECT name, type, sql FROM sqlite_master WHERE type IN ('table', 'view')"
             )
         }
-        parameters = [(session_id,) for session_id in session_ids]
-        with connection:
-            for table, column in CHRONICLE_TABLES:
-                if table in existing_tables:
-                    connection.executemany(
-                        f"DELETE FROM {table} WHERE {column} = ?", parameters
-                    )
-        return connection.total_changes
+        tables = [(table, column) for table, column in CHRONICLE_TABLES if table in schema]
+        chunks = sum(-(-len(session_ids) // batch_size) for session_ids in batches)
+        indexable = [
+            (table, column)
+            for table, column in tables
+            if schema[table][0] == "table" and not schema[table][1].lstrip().upper().startswith("CREATE VIRTUAL")
+        ]
+        temporary = create_temporary_indexes(connection, indexable) if chunks > 1 else []
+        try:
+            page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+            for position, session_ids in enumerate(batches):
+                ordered = sorted(session_ids)
+                before_changes = connection.total_changes
+                before_pages = used_pages(connection)
+                for start in range(0, len(ordered), batch_size):
+                    chunk = ordered[start:start + batch_size]
+                    placeholders = ", ".join("?" * len(chunk))
+                    with connection:
+                        for table, column in tables:
+                            connection.execute(f"DELETE FROM {table} WHERE {column} IN ({placeholders})", chunk)
+                    result["transactions"][position] += 1
+                result["rows"][position] = connection.total_changes - before_changes
+                result["bytes"][position] = max(0, before_pages - used_pages(connection)) * page_size
+        finally:
+            for name in temporary:
+                with connection:
+                    connection.execute(f"DROP INDEX IF EXISTS {name}")
+        result["temporary_indexes"] = len(temporary)
+        if vacuum:
+            result["vacuumed_bytes"] = incremental_vacuum(connection)
+        return result
     finally:
         connection.close()
 
 
-def build_plan(
-    storage: Path,
-    older_than_hours: float,
+def delete_chronicle_rows(storage: Path, session_ids: set[str]) -> int:
+    return delete_chronicle_batches(chronicle_database(storage), [session_ids])["rows"][0]
+
+
+def validate_policy(
+    older_than_hours: float | None,
     protected_ids: set[str],
     keep_latest: int,
-    now: datetime | None = None,
-) -> dict:
-    if older_than_hours <= 0:
+    max_bytes: int | None = None,
+) -> None:
+    if older_than_hours is None and max_bytes is None:
+        raise ValueError("use --older-than-hours, --max-bytes, or both")
+    if older_than_hours is not None and older_than_hours <= 0:
         raise ValueError("older-than-hours must be greater than zero")
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError("max-bytes must not be negative")
     if keep_latest < 0:
         raise ValueError("keep-latest must not be negative")
-    current_time = now or datetime.now(timezone.utc)
-    cutoff = current_time - timedelta(hours=older_than_hours)
-    cutoff_timestamp = cutoff.timestamp()
-    session_root = storage / "chatSessions"
-    session_files = sorted(session_root.glob("*.jsonl"), key=lambda path: path.stat().st_mtime, reverse=True)
     invalid_protected = sorted(session_id for session_id in protected_ids if not SESSION_ID_PATTERN.fullmatch(session_id))
     if invalid_protected:
         raise ValueError(f"invalid protected session IDs: {', '.join(invalid_protected)}")
 
+
+def build_plan(
+    storage: Path,
+    older_than_hours: float | None,
+    protected_ids: set[str],
+    keep_latest: int,
+    now: datetime | None = None,
+    max_bytes: int | None = None,
+) -> dict:
+    validate_policy(older_than_hours, protected_ids, keep_latest, max_bytes)
+    current_time = now or datetime.now(timezone.utc)
+    cutoff = current_time - timedelta(hours=older_than_hours) if older_than_hours is not None else None
+    cutoff_timestamp = cutoff.timestamp() if cutoff is not None else float("-inf")
+    scanned = scan_session_files(storage / "chatSessions")
+    session_files = [path for path, _, _ in scanned]
+
     metadata = load_state_metadata(storage)
     effective_protected = set(protected_ids) | metadata["pinned_ids"]
     effective_protected.update(path.stem for path in session_files[:keep_latest])
-    session_candidates = [
-        path
-        for path in session_files
+    deletion_limits = {
+        path.stem: cutoff_timestamp
+        for path, modified, _ in scanned
         if SESSION_ID_PATTERN.fullmatch(path.stem)
         and path.stem not in effective_protected
-        and path.stat().st_mtime < cutoff_timestamp
-    ]
-    candidate_ids = {path.stem for path in session_candidates}
+        and modified < cutoff_timestamp
+    }
     existing_ids = {path.stem for path in session_files}
     stale_index_ids = {
         session_id
@@ -356,17 +557,66 @@ def build_plan(
         and entry["lastMessageDate"] < cutoff_timestamp * 1000
     }
 
-    auxiliary_candidates: list[Path] = []
+    auxiliary_dirs: list[tuple[Path, float]] = []
     for root in auxiliary_roots(storage):
         if not root.is_dir():
             continue
-        for path in root.iterdir():
-            if not path.is_dir() or not SESSION_ID_PATTERN.fullmatch(path.name):
-                continue
-            linked = path.name in candidate_ids
-            old_orphan = path.name not in existing_ids and path.stat().st_mtime < cutoff_timestamp
-            if path.name not in effective_protected and (linked or old_orphan):
-                auxiliary_candidates.append(path)
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if SESSION_ID_PATTERN.fullmatch(entry.name) and entry.is_dir():
+                    auxiliary_dirs.append((Path(entry.path), entry.stat().st_mtime))
+
+    item_bytes: dict[Path, int] = {}
+    size_evicted: list[str] = []
+    workspace_bytes = None
+    if max_bytes is not None:
+        # Budget policy: account every session with its auxiliary directories, then evict the
+        # largest unprotected sessions until the workspace fits
+        for path, _ in auxiliary_dirs:
+            item_bytes[path] = tree_size(path)
+        for path, _, size in scanned:
+            item_bytes[path] = size
+        workspace_bytes = sum(item_bytes.values())
+        session_bytes: dict[str, int] = defaultdict(int)
+        for path, size in item_bytes.items():
+            session_bytes[path.stem if path.suffix == ".jsonl" else path.name] += size
+        orphan_bytes = sum(
+            item_bytes[path] for path, modified in auxiliary_dirs
+            if path.name not in existing_ids and path.name not in effective_protected and modified < cutoff_timestamp
+        )
+        remaining = workspace_bytes - orphan_bytes - sum(session_bytes[session_id] for session_id in deletion_limits)
+        evictable = sorted(
+            (
+                (session_bytes[path.stem], path.stem, modified)
+                for path, modified, _ in scanned
+                if SESSION_ID_PATTERN.fullmatch(path.stem)
+                and path.stem not in effective_protected
+                and path.stem not in deletion_limits
+            ),
+            key=lambda item: (-item[0], item[1]),
+        )
+        for size, session_id, modified in evictable:
+            if remaining <= max_bytes:
+                break
+            # Deleted only if the file is not modified after planning
+            deletion_limits[session_id] = math.nextafter(modified, math.inf)
+            size_evicted.append(session_id)
+            remaining -= size
+
+    session_candidates = [path for path in session_files if path.stem in deletion_limits]
+    candidate_ids = set(deletion_limits)
+    auxiliary_candidates = [
+        path
+        for path, modified in auxiliary_dirs
+        if path.name not in effective_protected
+        and (path.name in candidate_ids or (path.name not in existing_ids and modified < cutoff_timestamp))
+    ]
+    for path, _, size in scanned:
+        if path.stem in candidate_ids:
+            item_bytes[path] = size
+    for path in auxiliary_candidates:
+        if path not in item_bytes:
+            item_bytes[path] = tree_size(path)
 
     metadata_cleanup_ids = candidate_ids | stale_index_ids | {
         path.name for path in auxiliary_candidates
@@ -376,8 +626,13 @@ def build_plan(
         "storage": storage,
         "workspace_storage_id": storage.name,
         "cutoff": cutoff,
+        "deletion_limits": deletion_limits,
         "session_files": session_candidates,
         "auxiliary_dirs": auxiliary_candidates,
+        "size_evicted_ids": size_evicted,
+        "item_bytes": item_bytes,
+        "max_bytes": max_bytes,
+        "workspace_bytes": workspace_bytes,
         "protected_ids": effective_protected,
         "pinned_ids": metadata["pinned_ids"],
         "metadata_cleanup_ids": metadata_cleanup_ids,
@@ -386,22 +641,24 @@ def build_plan(
     }
 
 
-def apply_plan(plan: dict) -> dict[str, int]:
-    metadata_deleted = update_state_metadata(
-        plan["storage"], plan["metadata_cleanup_ids"]
-    )
+def modified_before(path: Path, timestamp: float) -> bool:
+    # Re-checked at deletion time so a session touched after planning survives
+    try:
+        return path.stat().st_mtime < timestamp
+    except FileNotFoundError:
+        return False
+
+
+def delete_plan_files(plan: dict, metadata_deleted: dict, chronicle: dict[str, int]) -> dict[str, int]:
     eligible_ids = metadata_deleted["eligible_ids"]
-    chronicle_rows = delete_chronicle_rows(plan["storage"], eligible_ids)
     deleted_session_ids: set[str] = set()
-    cutoff_timestamp = plan["cutoff"].timestamp()
+    deleted_bytes = 0
+    cutoff_timestamp = plan["cutoff"].timestamp() if plan["cutoff"] is not None else float("-inf")
     for path in plan["session_files"]:
-        if (
-            path.stem in eligible_ids
-            and path.is_file()
-            and path.stat().st_mtime < cutoff_timestamp
-        ):
+        if path.stem in eligible_ids and modified_before(path, plan["deletion_limits"][path.stem]):
             path.unlink()
             deleted_session_ids.add(path.stem)
+            deleted_bytes += plan["item_bytes"].get(path, 0)
 
     deleted_auxiliary = 0
     for path in plan["auxiliary_dirs"]:
@@ -409,24 +666,88 @@ def apply_plan(plan: dict) -> dict[str, int]:
             continue
         linked_session = path.name in deleted_session_ids
         old_orphan = not (plan["storage"] / "chatSessions" / f"{path.name}.jsonl").exists()
-        if path.is_dir() and (linked_session or (old_orphan and path.stat().st_mtime < cutoff_timestamp)):
-            shutil.rmtree(path)
-            deleted_auxiliary += 1
+        if linked_session or (old_orphan and modified_before(path, cutoff_timestamp)):
+            if path.is_dir():
+                shutil.rmtree(path)
+                deleted_auxiliary += 1
+                deleted_bytes += plan["item_bytes"].get(path, 0)
     return {
         "session_files": len(deleted_session_ids),
         "auxiliary_dirs": deleted_auxiliary,
+        "bytes": deleted_bytes,
         "index_entries": metadata_deleted["index_entries"],
         "state_entries": metadata_deleted["state_entries"],
-        "chronicle_rows": chronicle_rows,
+        "chronicle_rows": chronicle["rows"],
+        "chronicle_bytes": chronicle["bytes"],
+        "chronicle_vacuumed_bytes": chronicle["vacuumed_bytes"],
+        "chronicle_transactions": chronicle["transactions"],
         "race_protected": len(metadata_deleted["race_protected_ids"]),
     }
 
 
+def apply_plans(
+    plans: list[dict],
+    errors: dict[int, str] | None = None,
+    batch_size: int = CHRONICLE_BATCH_SIZE,
+    vacuum: bool = False,
+) -> list[dict[str, int] | None]:
+    # Without an errors map the first failure propagates; with one, a failing workspace is
+    # recorded and skipped so the rest of the fleet is still pruned.
+    def guarded(position: int, action, *args):
+        if errors is None:
+            return action(*args)
+        try:
+            return action(*args)
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            errors.setdefault(position, str(exc))
+            return None
+
+    metadata = [
+        guarded(position, update_state_metadata, plan["storage"], plan["metadata_cleanup_ids"])
+        for position, plan in enumerate(plans)
+    ]
+    by_database: dict[Path, list[int]] = defaultdict(list)
+    for position, plan in enumerate(plans):
+        if metadata[position] is not None:
+            by_database[chronicle_database(plan["storage"])].append(position)
+    chronicle: list[dict[str, int] | None] = [
+        {"rows": 0, "bytes": 0, "vacuumed_bytes": 0, "transactions": 0} for _ in plans
+    ]
+    for database, positions in by_database.items():
+        result = guarded(
+            positions[0], delete_chronicle_batches, database,
+            [metadata[position]["eligible_ids"] for position in positions], batch_size, vacuum,
+        )
+        for offset, position in enumerate(positions):
+            if result is None:
+                chronicle[position] = None
+                if errors is not None:
+                    errors.setdefault(position, errors[positions[0]])
+                continue
+            # The database shrinks once, so its vacuumed bytes belong to the first workspace sharing it
+            chronicle[position] = {
+                "rows": result["rows"][offset],
+                "bytes": result["bytes"][offset],
+                "vacuumed_bytes": result["vacuumed_bytes"] if offset == 0 else 0,
+                "transactions": result["transactions"][offset],
+            }
+    return [
+        guarded(position, delete_plan_files, plan, metadata[position], chronicle[position])
+        if metadata[position] is not None and chronicle[position] is not None
+        else None
+        for position, plan in enumerate(plans)
+    ]
+
+
+def apply_plan(plan: dict, batch_size: int = CHRONICLE_BATCH_SIZE, vacuum: bool = False) -> dict[str, int]:
+    return apply_plans([plan], batch_size=batch_size, vacuum=vacuum)[0]
+
+
 def report(plan: dict, mode: str, deleted: dict[str, int] | None = None) -> dict:
     return {
         "mode": mode,
         "workspace_storage_id": plan["workspace_storage_id"],
-        "cutoff_utc": plan["cutoff"].isoformat(),
+        "cutoff_utc": plan["cutoff"].isoformat() if plan["cutoff"] is not None else None,
         "sessions_scanned": plan["session_count"],
         "protected_count": len(plan["protected_ids"]),
         "pinned_protected_count": len(plan["pinned_ids"]),
@@ -434,6 +755,12 @@ def report(plan: dict, mode: str, deleted: dict[str, int] | None = None) -> dict
         "candidate_auxiliary_count": len(plan["auxiliary_dirs"]),
         "candidate_metadata_count": len(plan["metadata_cleanup_ids"]),
         "candidate_session_ids": sorted(path.stem for path in plan["session_files"]),
+        "size_evicted_session_ids": sorted(plan["size_evicted_ids"]),
+        "reclaimable_bytes": sum(
+            plan["item_bytes"].get(path, 0) for path in [*plan["session_files"], *plan["auxiliary_dirs"]]
+        ),
+        "workspace_bytes": plan["workspace_bytes"],
+        "max_bytes": plan["max_bytes"],
         "remaining_candidate_session_count": sum(path.exists() for path in plan["session_files"]),
         "remaining_candidate_auxiliary_count": sum(path.exists() for path in plan["auxiliary_dirs"]),
         "state_database_present": plan["state_database_present"],
@@ -444,16 +771,96 @@ def report(plan: dict, mode: str, deleted: dict[str, int] | None = None) -> dict
         or {
             "session_files": 0,
             "auxiliary_dirs": 0,
+            "bytes": 0,
             "index_entries": 0,
             "state_entries": 0,
             "chronicle_rows": 0,
+            "chronicle_bytes": 0,
+            "chronicle_vacuumed_bytes": 0,
+            "chronicle_transactions": 0,
             "race_protected": 0,
         },
     }
 
 
+def prune_fleet(
+    storages: list[Path],
+    older_than_hours: float,
+    protected_ids: set[str],
+    keep_latest: int,
+    apply: bool,
+    now: datetime | None = None,
+    max_bytes: int | None = None,
+    batch_size: int = CHRONICLE_BATCH_SIZE,
+    vacuum: bool = False,
+) -> dict:
+    validate_policy(older_than_hours, protected_ids, keep_latest, max_bytes)
+    if batch_size < 1:
+        raise ValueError("--chronicle-batch-size must be at least 1")
+    current_time = now or datetime.now(timezone.utc)
+    mode = "apply" if apply else "dry-run"
+    plans: list[dict] = []
+    failures: list[dict] = []
+    for storage in storages:
+        try:
+            plan = build_plan(
+                storage, older_than_hours, protected_ids, keep_latest, now=current_time, max_bytes=max_bytes,
+            )
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            failures.append({"workspace_storage_id": storage.name, "error": str(exc)})
+            continue
+        if apply and not plan["state_database_present"]:
+            failures.append({
+                "workspace_storage_id": storage.name,
+                "error": "state.vscdb is required for apply so pinned sessions can be protected",
+            })
+            continue
+        plans.append(plan)
+
+    errors: dict[int, str] = {}
+    deleted = apply_plans(plans, errors, batch_size, vacuum) if apply else [None] * len(plans)
+    workspaces = []
+    for position, plan in enumerate(plans):
+        result = report(plan, mode, deleted[position])
+        if position in errors:
+            result["error"] = errors[position]
+        workspaces.append(result)
+    workspaces.extend(failures)
+    workspaces.sort(key=lambda item: item["workspace_storage_id"])
+
+    summed = (
+        "sessions_scanned", "candidate_session_count", "candidate_auxiliary_count", "candidate_metadata_count",
+        "reclaimable_bytes",
+    )
+    totals = {key: sum(item.get(key, 0) for item in workspaces) for key in summed}
+    totals["deleted"] = {
+        key: sum(item["deleted"][key] for item in workspaces if "deleted" in item)
+        for key in (
+            "session_files", "auxiliary_dirs", "bytes", "index_entries", "state_entries", "chronicle_rows",
+            "chronicle_bytes", "chronicle_vacuumed_bytes", "chronicle_transactions", "race_protected",
+        )
+    }
+    return {
+        "mode": mode,
+        "cutoff_utc": (
+            (current_time - timedelta(hours=older_than_hours)).isoformat() if older_than_hours is not None else None
+        ),
+        "max_bytes": max_bytes,
+        "workspace_count": len(workspaces),
+        "error_count": sum("error" in item for item in workspaces),
+        "reload_window_required": any(item.get("reload_window_required") for item in workspaces),
+        "totals": totals,
+        "workspaces": workspaces,
+    }
+
+
 def main() -> int:
     args = parse_args()
+    if args.all_workspaces:
+        return fleet_main(args)
+    if args.storage_root:
+        print("ERROR: --storage-root requires --all-workspaces", file=sys.stderr)
+        return 1
     try:
         storage = validate_storage(
             Path(args.workspace_storage)
@@ -465,10 +872,13 @@ def main() -> int:
             args.older_than_hours,
             set(args.protect_session_id),
             args.keep_latest,
+            max_bytes=args.max_bytes,
         )
         if args.apply and not plan["state_database_present"]:
             raise ValueError("state.vscdb is required for apply so pinned sessions can be protected")
-        deleted = apply_plan(plan) if args.apply else None
+        if args.chronicle_batch_size < 1:
+            raise ValueError("--chronicle-batch-size must be at least 1")
+        deleted = apply_plan(plan, args.chronicle_batch_size, args.vacuum) if args.apply else None
         result = report(plan, "apply" if args.apply else "dry-run", deleted)
     except (OSError, ValueError) as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
@@ -485,14 +895,27 @@ def main() -> int:
         print(f"Pinned protected: {result['pinned_protected_count']}")
         print(f"Auxiliary candidates: {result['candidate_auxiliary_count']}")
         print(f"Metadata candidates: {result['candidate_metadata_count']}")
+        if result["max_bytes"] is not None:
+            print(
+                f"Size budget: {format_bytes(result['workspace_bytes'])} used, {format_bytes(result['max_bytes'])} allowed, "
+                f"{len(result['size_evicted_session_ids'])} largest sessions evicted"
+            )
+        print(f"Reclaimable: {format_bytes(result['reclaimable_bytes'])}")
         if args.apply:
             print(
                 "Deleted: "
                 f"{result['deleted']['session_files']} sessions, "
                 f"{result['deleted']['auxiliary_dirs']} auxiliary directories, "
+                f"{format_bytes(result['deleted']['bytes'])}, "
                 f"{result['deleted']['index_entries']} index entries, "
                 f"{result['deleted']['chronicle_rows']} Chronicle rows"
             )
+            print(
+                "Chronicle: "
+                f"{format_bytes(result['deleted']['chronicle_bytes'])} freed in "
+                f"{result['deleted']['chronicle_transactions']} transactions, "
+                f"{format_bytes(result['deleted']['chronicle_vacuumed_bytes'])} returned to disk"
+            )
             print(
                 "Remaining candidates: "
                 f"{result['remaining_candidate_session_count']} sessions, "
@@ -503,5 +926,66 @@ def main() -> int:
     return 0
 
 
+def fleet_main(args: argparse.Namespace) -> int:
+    try:
+        roots = [Path(value).expanduser().resolve() for value in args.storage_root] or workspace_storage_roots()
+        if not roots:
+            raise ValueError("no VS Code workspaceStorage directory found; use --storage-root")
+        result = prune_fleet(
+            discover_storages(roots),
+            args.older_than_hours,
+            set(args.protect_session_id),
+            args.keep_latest,
+            args.apply,
+            max_bytes=args.max_bytes,
+            batch_size=args.chronicle_batch_size,
+            vacuum=args.vacuum,
+        )
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=True))
+    else:
+        totals = result["totals"]
+        print(f"Mode: {result['mode']}")
+        print(f"Cutoff UTC: {result['cutoff_utc']}")
+        print(f"Workspaces: {result['workspace_count']} scanned, {result['error_count']} errors")
+        for item in result["workspaces"]:
+            if "error" in item and "sessions_scanned" not in item:
+                print(f"  {item['workspace_storage_id']}: ERROR {item['error']}")
+                continue
+            line = f"  {item['workspace_storage_id']}: {item['candidate_session_count']}/{item['sessions_scanned']} sessions"
+            line += f", {format_bytes(item['reclaimable_bytes'])} reclaimable"
+            if args.apply:
+                line += f", deleted {item['deleted']['session_files']}"
+            if "error" in item:
+                line += f", ERROR {item['error']}"
+            print(line)
+        print(f"Sessions: {totals['sessions_scanned']} scanned, {totals['candidate_session_count']} candidates")
+        print(f"Auxiliary candidates: {totals['candidate_auxiliary_count']}")
+        print(f"Metadata candidates: {totals['candidate_metadata_count']}")
+        print(f"Reclaimable: {format_bytes(totals['reclaimable_bytes'])}")
+        if args.apply:
+            deleted = totals["deleted"]
+            print(
+                "Deleted: "
+                f"{deleted['session_files']} sessions, "
+                f"{deleted['auxiliary_dirs']} auxiliary directories, "
+                f"{format_bytes(deleted['bytes'])}, "
+                f"{deleted['index_entries']} index entries, "
+                f"{deleted['chronicle_rows']} Chronicle rows"
+            )
+            print(
+                "Chronicle: "
+                f"{format_bytes(deleted['chronicle_bytes'])} freed in {deleted['chronicle_transactions']} transactions, "
+                f"{format_bytes(deleted['chronicle_vacuumed_bytes'])} returned to disk"
+            )
+            if result["reload_window_required"]:
+                print("Reload open VS Code windows now so their in-memory session indexes cannot restore deleted entries.")
+    return 1 if result["error_count"] else 0
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
\ No newline at end of file
@@ -10,6 +10,12 @@ SPEC = importlib.util.spec_from_file_location("analyze_session_metrics", MODULE_
 MODULE = importlib.util.module_from_spec(SPEC)
 assert SPEC.loader is not None
 SPEC.loader.exec_module(MODULE)
+BENCHMARK_SPEC = importlib.util.spec_from_file_location(
+    "benchmark_compare_runs", Path(__file__).with_name("benchmark_compare_runs.py")
+)
+BENCHMARK = importlib.util.module_from_spec(BENCHMARK_SPEC)
+assert BENCHMARK_SPEC.loader is not None
+BENCHMARK_SPEC.loader.exec_module(BENCHMARK)
 
 
 class CompareSessionMetricsTests(unittest.TestCase):
@@ -183,6 +189,47 @@ class CompareSessionMetricsTests(unittest.TestCase):
         self.assertEqual(weighted_result["weighted_ranking"]["status"], "AVAILABLE")
         self.assertIn(weighted_result["weighted_ranking"]["ranking"][0]["label"], {"run-0", "run-1", "run-2", "run-3"})
 
+    def test_metrics_store_dedupes_supersedes_and_matches_in_memory_summary(self):
+        runs = []
+        for index, aiu in enumerate((10, 20, 30, 40, 400)):
+            payload = self.payload(f"model-{index % 2}", "high", aiu=aiu, elapsed=aiu * 3, active=aiu,
+                                   unit_count=10, fingerprint="same")
+            payload["session_id"] = f"session-{index}"
+            runs.append(MODULE.normalize_run(payload, label=f"run-{index}", quality=self.quality()))
+        weights = {"cost": 1.0, "time": 1.0, "quality": 0.0}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = Path(tmpdir) / "runs.sqlite"
+            with MODULE.closing(MODULE.metrics_store.connect(store)) as connection:
+                self.assertEqual(MODULE.metrics_store.append_runs(connection, runs[:4]), 4)
+                self.assertEqual(MODULE.metrics_store.append_runs(connection, runs), 1)
+                stale = json.loads(json.dumps(runs[0]))
+                stale["metrics"]["aiu_per_unit"] = 99.0
+                self.assertEqual(MODULE.metrics_store.append_runs(connection, [stale, runs[0]]), 2)
+                full = MODULE.metrics_store.load_runs(connection, full=True)
+                light = MODULE.metrics_store.load_runs(connection, task_kind="review")
+                self.assertEqual(MODULE.metrics_store.load_runs(connection, task_kind="other"), [])
+
+        expected = MODULE.compare_runs(runs, weights)
+        summary = MODULE.analyze_runs(light, weights, summary_only=True)["comparison"]
+        self.assertEqual(sorted(run["label"] for run in full), [run["label"] for run in runs])
+        self.assertNotIn("runs", summary)
+        for key in ("groups", "pareto_frontier", "weighted_ranking", "winners", "comparability"):
+            self.assertEqual(summary[key], expected[key], key)
+
+    def test_skyline_and_single_pass_groups_match_pairwise_reference(self):
+        for seed in range(20):
+            runs = BENCHMARK.synthetic_runs(60, seed)
+            self.assertEqual(MODULE.pareto_frontier(runs), BENCHMARK.pareto_frontier_pairwise(runs), seed)
+            self.assertEqual(MODULE.grouped_summary(runs), BENCHMARK.grouped_summary_reference(runs), seed)
+
+        tied = BENCHMARK.synthetic_runs(4, 0)
+        for run in tied:
+            run["metrics"].update(aiu_per_unit=1.0, elapsed_seconds_per_unit=2.0)
+            run["quality"].update(level="VERIFIED", passed=True)
+        tied[3]["quality"]["level"] = "GATE_SUPPORTED"
+        self.assertEqual(MODULE.pareto_frontier(tied), sorted(run["label"] for run in tied[:3]))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
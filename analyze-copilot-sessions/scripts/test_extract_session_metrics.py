@@ -1,5 +1,8 @@
+import argparse
 import importlib.util
+import io
 import json
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -9,7 +12,12 @@ MODULE_PATH = Path(__file__).with_name("extract_session_metrics.py")
 SPEC = importlib.util.spec_from_file_location("extract_session_metrics", MODULE_PATH)
 MODULE = importlib.util.module_from_spec(SPEC)
 assert SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
 SPEC.loader.exec_module(MODULE)
+SUITE_SPEC = importlib.util.spec_from_file_location("benchmark_suite", Path(__file__).with_name("benchmark_suite.py"))
+SUITE = importlib.util.module_from_spec(SUITE_SPEC)
+assert SUITE_SPEC.loader is not None
+SUITE_SPEC.loader.exec_module(SUITE)
 
 
 class ExtractSessionMetricsTests(unittest.TestCase):
@@ -142,6 +150,324 @@ class ExtractSessionMetricsTests(unittest.TestCase):
 
             self.assertEqual(selected, [second.resolve()])
 
+    def test_event_key_keeps_json_identity_semantics(self):
+        base = {"type": "llm_request", "spanId": "a", "ts": 1, "attrs": {"model": "m", "inputTokens": 1}}
+        variants = [
+            base,
+            {**base, "ts": 1.0},
+            {**base, "ts": True},
+            {**base, "attrs": {"model": "m", "inputTokens": "1"}},
+            {**base, "attrs": {"model": {"id": "m"}, "inputTokens": 1}},
+        ]
+
+        keys = [MODULE.event_key(event) for event in variants]
+
+        # 1, 1.0, true, "1" and an object are distinct JSON values, so distinct identities
+        self.assertEqual(len(set(keys)), len(variants))
+        self.assertEqual(MODULE.event_key(json.loads(json.dumps(base))), keys[0])
+        self.assertEqual(MODULE.event_key({**base, "status": "error", "attrs": {**base["attrs"], "args": "x"}}), keys[0])
+        self.assertEqual(
+            MODULE.event_key({**base, "attrs": {"model": {"id": "m"}, "inputTokens": 1}}),
+            MODULE.event_key(json.loads(json.dumps(variants[4]))),
+        )
+
+    def test_compact_dedup_verifies_hash_collisions(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "main.jsonl"
+            first = {"type": "llm_request", "spanId": "x", "ts": -1}
+            second = {"type": "llm_request", "spanId": "x", "ts": -2}
+            for event in (first, second, first, second):
+                self.write_event(path, event)
+            self.assertEqual(hash(MODULE.event_key(first)), hash(MODULE.event_key(second)))
+
+            deduper = MODULE.EventDeduper("compact")
+            file_index = deduper.add_file(path)
+            duplicates = [
+                deduper.is_duplicate(MODULE.event_key(event), file_index, offset)
+                for offset, event in MODULE.iter_event_records(path, MODULE.Counter())
+            ]
+
+            self.assertEqual(duplicates, [False, False, True, True])
+            self.assertEqual(deduper.collisions, 1)
+
+    def test_compact_dedup_rereads_oversized_lines_selectively(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "main.jsonl"
+            event = {"type": "llm_request", "spanId": "big", "ts": 1, "attrs": {"model": "m", "request": "x" * 4096}}
+            for _ in range(3):
+                self.write_event(path, event)
+            full_decodes = []
+            original = (MODULE.orjson, MODULE.SELECTIVE_LINE_BYTES, MODULE.json.loads)
+
+            def loads(text, *args, **kwargs):
+                full_decodes.append(len(text))
+                return original[2](text, *args, **kwargs)
+
+            MODULE.orjson, MODULE.SELECTIVE_LINE_BYTES, MODULE.json.loads = None, 1024, loads
+            try:
+                deduper = MODULE.EventDeduper("compact")
+                file_index = deduper.add_file(path)
+                duplicates = [
+                    deduper.is_duplicate(MODULE.event_key(record), file_index, offset)
+                    for offset, record in MODULE.iter_event_records(path, MODULE.Counter())
+                ]
+            finally:
+                MODULE.orjson, MODULE.SELECTIVE_LINE_BYTES, MODULE.json.loads = original
+
+        self.assertEqual(duplicates, [False, True, True])
+        self.assertEqual(full_decodes, [])
+
+    def test_cache_parses_only_appended_tail_and_matches_full_extraction(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            session = self.create_session(root)
+            cache_dir = root / "cache"
+            MODULE.extract_session(session, cache_dir=cache_dir)
+            main = session / "main.jsonl"
+            prefix = main.stat().st_size
+            self.write_event(main, {
+                "ts": 7000, "dur": 500, "type": "llm_request", "status": "error", "spanId": "main-2",
+                "attrs": {"model": "gpt-5.6-sol", "inputTokens": 7, "copilotUsageNanoAiu": 1_000_000_000},
+            })
+            self.write_event(main, {"ts": 5000, "dur": 100, "type": "tool_call", "status": "error", "spanId": "tool-1"})
+            with main.open("ab") as handle:
+                handle.write(b'{"ts": 8000, "type": "tool_call"')  # Still being written
+
+            starts = []
+            original = MODULE.iter_event_records
+
+            def recording(path, warnings, start=0, stop=None):
+                starts.append((path.name, start))
+                return original(path, warnings, start, stop)
+
+            MODULE.iter_event_records = recording
+            try:
+                cached = MODULE.extract_session(session, cache_dir=cache_dir)
+            finally:
+                MODULE.iter_event_records = original
+            full = MODULE.extract_session(session)
+
+            self.assertEqual(cached, full)
+            self.assertEqual(cached["operations"]["llm_calls"], 3)
+            self.assertTrue(all(name == "main.jsonl" and start >= prefix for name, start in starts))
+
+            with main.open("ab") as handle:
+                handle.write(b', "spanId": "tool-2"}\n')
+            self.assertEqual(MODULE.extract_session(session, cache_dir=cache_dir), MODULE.extract_session(session))
+
+    def test_cache_is_discarded_when_a_log_is_rewritten(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            session = self.create_session(root)
+            cache_dir = root / "cache"
+            MODULE.extract_session(session, cache_dir=cache_dir)
+            child = next(session.glob("runSubagent-*.jsonl"))
+            text = child.read_text(encoding="utf-8").replace('"inputTokens": 80', '"inputTokens": 90')
+            child.write_text(text, encoding="utf-8")
+
+            cached = MODULE.extract_session(session, cache_dir=cache_dir)
+
+            self.assertEqual(cached, MODULE.extract_session(session))
+            self.assertNotIn(str(root), "".join(path.read_bytes().decode("latin-1") for path in cache_dir.iterdir()))
+
+    def test_process_pool_matches_serial_extraction_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            sessions = [
+                self.create_session(root, f"{index}1111111-1111-4111-8111-111111111111")
+                for index in range(3)
+            ]
+
+            serial = list(MODULE.iter_extracted(sessions, jobs=1))
+            parallel = list(MODULE.iter_extracted(sessions, jobs=2))
+
+            self.assertEqual(parallel, serial)
+            self.assertEqual([item["session_id"] for item in parallel], [path.name for path in sessions])
+
+    def test_jsonl_stream_writes_session_lines_then_summary(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            good = self.create_session(root)
+            broken = root / "22222222-2222-4222-8222-222222222222"
+            broken.mkdir()
+            output = root / "out" / "metrics.jsonl"
+            stdout = io.StringIO()
+
+            summary = MODULE.stream_jsonl(MODULE.iter_extracted([good, broken]), output, stdout)
+
+            lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+            self.assertEqual(lines[0]["session_id"], good.name)
+            self.assertEqual(lines[-1]["status"], "FAIL")
+            self.assertEqual(lines[-1]["session_count"], 1)
+            self.assertEqual(summary, lines[-1])
+            self.assertEqual(output.read_text(encoding="utf-8"), stdout.getvalue())
+
+    def test_store_appends_each_session_once_per_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            session = self.create_session(root)
+            store = root / "runs.sqlite"
+
+            with MODULE.closing(MODULE.metrics_store.connect(store)) as connection:
+                first = list(MODULE.iter_stored(MODULE.iter_extracted([session]), connection))
+                list(MODULE.iter_stored(MODULE.iter_extracted([session]), connection))
+                self.write_event(session / "main.jsonl", {"ts": 7000, "dur": 5, "type": "tool_call", "spanId": "tool-2"})
+                list(MODULE.iter_stored(MODULE.iter_extracted([session]), connection))
+                row_count = connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+                runs = MODULE.metrics_store.load_runs(connection, full=True)
+
+            self.assertEqual(row_count, 2)
+            self.assertEqual([run["label"] for run in runs], [first[0]["session_id"]])
+            self.assertEqual(runs[0]["metrics"]["tool_errors"], 1)
+            self.assertEqual(runs[0]["quality"]["level"], "UNMEASURED")
+
+    def test_follow_emits_rolling_deltas_and_picks_up_new_child_logs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session = self.create_session(Path(tmpdir))
+            child = session / "runSubagent-Late Reviewer-call_XYZ.jsonl"
+            main = session / "main.jsonl"
+
+            def append_raw(data: bytes) -> None:
+                with main.open("ab") as handle:
+                    handle.write(data)
+
+            append_raw(b'{"ts": 9000, "type": "llm_request", "attrs": {"model": "gpt')
+            steps = iter([
+                lambda: self.write_event(child, {
+                    "ts": 8000, "dur": 4000, "type": "llm_request", "status": "error", "spanId": "late-1",
+                    "attrs": {"model": "gpt-5.6-terra", "inputTokens": 5, "outputTokens": 1, "copilotUsageNanoAiu": 500_000_000},
+                }),
+                lambda: append_raw(
+                    b'-5.6-sol", "inputTokens": 7, "copilotUsageNanoAiu": 250000000}, "dur": 1000, "spanId": "main-9"}\n'
+                ),
+            ])
+            stdout = io.StringIO()
+
+            count = MODULE.follow_session(session, interval=60, max_updates=3, stdout=stdout, sleep=lambda _: next(steps)())
+
+            snapshots = [json.loads(line) for line in stdout.getvalue().splitlines()]
+            self.assertEqual(count, 3)
+            self.assertEqual([item["totals"]["llm_calls"] for item in snapshots], [2, 3, 4])
+            self.assertIsNone(snapshots[0]["interval"])
+            self.assertEqual(snapshots[1]["totals"]["log_files"], 3)
+            self.assertEqual(snapshots[1]["interval"]["aiu"], 0.5)
+            self.assertEqual(snapshots[1]["interval"]["llm_errors"], 1)
+            self.assertEqual(snapshots[1]["interval"]["mean_llm_latency_seconds"], 4.0)
+            self.assertEqual(snapshots[2]["interval"]["input_tokens"], 7)
+            self.assertEqual(snapshots[2]["totals"]["total_aiu"], 3.75)
+            self.assertFalse(any(item["log_rewritten"] for item in snapshots))
+            self.assertNotIn("secret", stdout.getvalue())
+
+    def test_span_tree_reports_percentiles_idle_gaps_and_critical_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session = Path(tmpdir) / "33333333-3333-4333-8333-333333333333"
+            session.mkdir()
+            main = session / "main.jsonl"
+            llm = {"type": "llm_request", "status": "ok", "attrs": {"model": "sol", "copilotUsageNanoAiu": 1}}
+            self.write_event(main, {"ts": 0, "dur": 0, "type": "user_message", "spanId": "start"})
+            self.write_event(main, {**llm, "ts": 1000, "dur": 1000, "spanId": "m1"})
+            self.write_event(main, {"ts": 2000, "dur": 6000, "type": "tool_call", "spanId": "t1", "attrs": {"name": "runSubagent"}})
+            self.write_event(main, {**llm, "ts": 8000, "dur": 1000, "spanId": "m2"})
+            self.write_event(main, {**llm, "ts": 10000, "dur": 500, "spanId": "m3"})
+            self.write_event(main, {"ts": 10500, "dur": 0, "type": "agent_response", "spanId": "end"})
+            slow = session / "runSubagent-Slow-call_A.jsonl"
+            child = {"type": "llm_request", "status": "ok", "attrs": {"model": "terra", "copilotUsageNanoAiu": 1}}
+            self.write_event(slow, {**child, "ts": 2500, "dur": 2500, "spanId": "s1"})
+            self.write_event(slow, {**child, "ts": 5000, "dur": 2500, "spanId": "s2"})
+            self.write_event(slow, {"ts": 6000, "dur": 1000, "type": "tool_call", "spanId": "s2-tool", "parentSpanId": "s2"})
+            fast = session / "runSubagent-Fast-call_B.jsonl"
+            self.write_event(fast, {**child, "ts": 2600, "dur": 1400, "spanId": "f1"})
+
+            latency = MODULE.extract_session(session)["latency"]
+
+        by_model = {item["model"]: item for item in latency["llm_by_model"]}
+        self.assertEqual(by_model["sol"]["llm_calls"], 3)
+        self.assertEqual((by_model["sol"]["p50_seconds"], by_model["sol"]["max_seconds"]), (1.0, 1.0))
+        self.assertEqual((by_model["terra"]["p50_seconds"], by_model["terra"]["p99_seconds"]), (2.5, 2.5))
+        self.assertEqual(latency["time_to_first_llm_seconds"], 1.0)
+        self.assertEqual(latency["idle_gaps"], {"count": 1, "total_seconds": 1.0, "longest_seconds": 1.0})
+        components = {(item["role"], item["kind"], item["model"]): item["seconds"] for item in latency["critical_path"]["components"]}
+        self.assertEqual(latency["critical_path"]["seconds"], 10.5)
+        self.assertEqual(sum(components.values()), 10.5)
+        self.assertEqual(components[("Slow", "llm", "terra")], 4.0)
+        self.assertEqual(components[("Slow", "tool", "")], 1.0)
+        self.assertEqual(components[("orchestrator", "tool", "")], 1.0)
+        self.assertNotIn(("Fast", "llm", "terra"), components)
+        self.assertEqual(latency["span_tree"], {"spans": 8, "unresolved_parents": 0})
+
+    def test_selective_parser_skips_payloads_and_matches_full_extraction(self):
+        event = {
+            "ts": 1000,
+            "type": "llm_request",
+            "attrs": {
+                "request": {"messages": [{"content": 'say "hi"\n\\ ]}' * 50, "parts": [[], {}, [1.5, None]]}] * 20},
+                "mod\u0065l": "ignored-escaped-key",
+                "model": "gpt-5.6-sol",
+                "copilotUsageNanoAiu": 5,
+            },
+            "payload": ["x" * 1000, {"nested": True}],
+            "dur": 40,
+            "spanId": "é-1",
+        }
+        line = json.dumps(event, ensure_ascii=False)
+        parsed = MODULE.parse_event_fields(line)
+        self.assertEqual(parsed, {
+            "ts": 1000,
+            "type": "llm_request",
+            "attrs": {"model": "gpt-5.6-sol", "copilotUsageNanoAiu": 5},
+            "dur": 40,
+            "spanId": "é-1",
+        })
+        for damaged in (line[:-1], line[: len(line) // 2], line + " x", '{"type": "a",}', '{"type" 1}', '{"a": [}'):
+            with self.assertRaises(json.JSONDecodeError):
+                MODULE.parse_event_fields(damaged)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session = self.create_session(Path(tmpdir))
+            main = session / "main.jsonl"
+            self.write_event(main, {**event, "ts": 7000, "spanId": "main-big"})
+            self.write_event(main, {**event, "ts": 7000, "spanId": "main-big"})
+            with main.open("ab") as handle:
+                handle.write(line[: len(line) // 2].encode("utf-8") + b"\n")
+            expected = json.loads(json.dumps(MODULE.extract_session(session)))
+            original = (MODULE.orjson, MODULE.SELECTIVE_LINE_BYTES)
+            MODULE.orjson, MODULE.SELECTIVE_LINE_BYTES = None, 0
+            try:
+                selective = MODULE.extract_session(session)
+            finally:
+                MODULE.orjson, MODULE.SELECTIVE_LINE_BYTES = original
+
+        self.assertEqual(selective, expected)
+        self.assertEqual(selective["operations"]["llm_calls"], 3)
+        warnings = {item["code"]: item["count"] for item in selective["warnings"]}
+        self.assertEqual(warnings["duplicate_events_skipped"], 1)
+        self.assertEqual(warnings["invalid_json_lines_skipped"], 1)
+
+    def test_benchmark_suite_generates_consistent_trees_and_gates_regressions(self):
+        args = argparse.Namespace(
+            sessions=2, subagents=2, duplicate_ratio=0.05, corrupt_ratio=0.02, repeat=1, seed=3, payload_bytes=0,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            extract = SUITE.bench_extract(Path(tmpdir), 2, args)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            prune_plan = SUITE.bench_prune_plan(Path(tmpdir), 1, args)
+
+        self.assertTrue(extract["consistent"])
+        self.assertGreater(extract["duplicates"], 0)
+        self.assertGreater(extract["corrupt_lines"], 0)
+        self.assertTrue(prune_plan["consistent"])
+        baseline = {"results": {"extract": {"10x": {"units": 100, "seconds": 1.0}, "100x": {"units": 999, "seconds": 1.0}}}}
+        results = {"extract": {
+            "10x": {"units": 100, "seconds": 1.2},
+            "100x": {"units": 1000, "seconds": 9.0},
+        }}
+        self.assertEqual(SUITE.find_regressions(results, baseline, 0.25), [])
+        results["extract"]["10x"]["seconds"] = 1.5
+        self.assertEqual(
+            SUITE.find_regressions(results, baseline, 0.25),
+            [{"workload": "extract", "scale": "10x", "baseline_seconds": 1.0, "seconds": 1.5, "slowdown": 0.5}],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -17,8 +17,8 @@ SPEC.loader.exec_module(MODULE)
 
 
 class PruneChatSessionsTests(unittest.TestCase):
-    def create_storage(self, root: Path, workspace: Path) -> Path:
-        storage = root / "workspaceStorage" / "storage-id"
+    def create_storage(self, root: Path, workspace: Path, storage_id: str = "storage-id") -> Path:
+        storage = root / "workspaceStorage" / storage_id
         (storage / "chatSessions").mkdir(parents=True)
         uri = workspace.as_uri()
         (storage / "workspace.json").write_text(json.dumps({"workspace": uri}), encoding="utf-8")
@@ -69,17 +69,17 @@ class PruneChatSessionsTests(unittest.TestCase):
 
     def create_chronicle_database(self, storage: Path, session_id: str) -> Path:
         database = MODULE.chronicle_database(storage)
-        database.parent.mkdir(parents=True)
+        database.parent.mkdir(parents=True, exist_ok=True)
         connection = sqlite3.connect(database)
         try:
             connection.executescript(
                 """
-                CREATE TABLE sessions (id TEXT PRIMARY KEY);
-                CREATE TABLE turns (session_id TEXT);
-                CREATE TABLE checkpoints (session_id TEXT);
-                CREATE TABLE session_files (session_id TEXT);
-                CREATE TABLE session_refs (session_id TEXT);
-                CREATE TABLE search_index (session_id TEXT);
+                CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY);
+                CREATE TABLE IF NOT EXISTS turns (session_id TEXT);
+                CREATE TABLE IF NOT EXISTS checkpoints (session_id TEXT);
+                CREATE TABLE IF NOT EXISTS session_files (session_id TEXT);
+                CREATE TABLE IF NOT EXISTS session_refs (session_id TEXT);
+                CREATE TABLE IF NOT EXISTS search_index (session_id TEXT);
                 """
             )
             for table in ("turns", "checkpoints", "session_files", "session_refs", "search_index"):
@@ -200,6 +200,117 @@ class PruneChatSessionsTests(unittest.TestCase):
                 chronicle_connection.close()
             self.assertEqual(remaining, 0)
 
+    def test_fleet_applies_every_workspace_and_isolates_a_broken_one(self):
+        now = datetime(2026, 7, 31, tzinfo=timezone.utc)
+        old = now - timedelta(hours=72)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            storages = []
+            for index in range(3):
+                workspace = root / f"repo-{index}"
+                workspace.mkdir()
+                storage = self.create_storage(root, workspace, f"storage-{index}")
+                old_id = f"{index}1111111-1111-4111-8111-111111111111"
+                self.create_session(storage, old_id, old)
+                self.create_session(storage, f"{index}2222222-2222-4222-8222-222222222222", now)
+                self.create_state_database(storage, {old_id: {"lastMessageDate": old.timestamp() * 1000}}, [])
+                self.create_chronicle_database(storage, old_id)
+                storages.append(storage)
+            connection = sqlite3.connect(storages[1] / "state.vscdb")
+            with connection:
+                connection.execute("UPDATE ItemTable SET value = 'not json' WHERE key = ?", (MODULE.STATE_KEY,))
+            connection.close()
+
+            discovered = MODULE.discover_storages([root / "workspaceStorage"])
+            result = MODULE.prune_fleet(discovered, 36, set(), keep_latest=1, apply=True, now=now)
+
+            self.assertEqual(discovered, [storage.resolve() for storage in storages])
+            self.assertEqual(result["workspace_count"], 3)
+            self.assertEqual(result["error_count"], 1)
+            self.assertIn("invalid JSON", result["workspaces"][1]["error"])
+            self.assertEqual(result["totals"]["deleted"]["session_files"], 2)
+            self.assertEqual(result["totals"]["deleted"]["chronicle_rows"], 12)
+            self.assertEqual([item["deleted"]["chronicle_rows"] for item in result["workspaces"][::2]], [6, 6])
+            self.assertTrue(result["reload_window_required"])
+            self.assertFalse((storages[0] / "chatSessions" / "01111111-1111-4111-8111-111111111111.jsonl").exists())
+            self.assertTrue((storages[1] / "chatSessions" / "11111111-1111-4111-8111-111111111111.jsonl").exists())
+
+    def test_chronicle_deletes_in_chunks_with_temporary_index_and_incremental_vacuum(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            database = Path(tmpdir) / "session-store.db"
+            connection = sqlite3.connect(database)
+            try:
+                connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                connection.executescript(
+                    """
+                    CREATE TABLE sessions (id TEXT PRIMARY KEY);
+                    CREATE TABLE turns (session_id TEXT, body TEXT);
+                    """
+                )
+                ids = [f"{index}1111111-1111-4111-8111-111111111111" for index in range(4)]
+                for session_id in ids:
+                    connection.execute("INSERT INTO sessions (id) VALUES (?)", (session_id,))
+                    connection.executemany(
+                        "INSERT INTO turns (session_id, body) VALUES (?, ?)",
+                        [(session_id, "x" * 2000) for _ in range(50)],
+                    )
+                connection.commit()
+            finally:
+                connection.close()
+            size_before = database.stat().st_size
+
+            result = MODULE.delete_chronicle_batches(
+                database, [{ids[0], ids[1]}, {ids[2]}], batch_size=1, vacuum=True,
+            )
+
+            self.assertEqual(result["rows"], [102, 51])
+            self.assertEqual(result["transactions"], [2, 1])
+            self.assertEqual(result["temporary_indexes"], 1)
+            self.assertGreater(result["bytes"][0], result["bytes"][1])
+            self.assertGreater(result["bytes"][1], 0)
+            self.assertGreaterEqual(result["vacuumed_bytes"], sum(result["bytes"]))
+            self.assertLess(database.stat().st_size, size_before - sum(result["bytes"]) // 2)
+            connection = sqlite3.connect(database)
+            try:
+                indexes = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+                remaining = connection.execute("SELECT DISTINCT session_id FROM turns").fetchall()
+            finally:
+                connection.close()
+            self.assertFalse(any(name.startswith(MODULE.TEMPORARY_INDEX_PREFIX) for (name,) in indexes))
+            self.assertEqual(remaining, [(ids[3],)])
+
+    def test_byte_budget_evicts_largest_sessions_with_auxiliary_bytes(self):
+        now = datetime(2026, 7, 31, tzinfo=timezone.utc)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            workspace = root / "repo"
+            workspace.mkdir()
+            storage = self.create_storage(root, workspace)
+            ids = [f"{index}1111111-1111-4111-8111-111111111111" for index in range(5)]
+            sizes = (100, 3000, 200, 5000, 400)
+            for index, (session_id, size) in enumerate(zip(ids, sizes)):
+                path = self.create_session(storage, session_id, now - timedelta(hours=index + 1))
+                path.write_bytes(b"x" * size)
+                os.utime(path, ((now - timedelta(hours=index + 1)).timestamp(),) * 2)
+            resources = self.create_auxiliary(storage, "chat-session-resources", ids[2], now)
+            (resources / "nested").mkdir()
+            (resources / "nested" / "blob.bin").write_bytes(b"y" * 4000)
+            self.create_state_database(storage, {}, [{"resource": self.local_resource(ids[3]), "pinned": True}])
+
+            plan = MODULE.build_plan(storage, None, set(), keep_latest=1, now=now, max_bytes=6000)
+            dry_run = MODULE.report(plan, "dry-run")
+            deleted = MODULE.apply_plan(plan)
+
+            self.assertEqual(dry_run["workspace_bytes"], 12700)
+            self.assertEqual(plan["size_evicted_ids"], [ids[2], ids[1]])
+            self.assertEqual(dry_run["reclaimable_bytes"], 7200)
+            self.assertIsNone(dry_run["cutoff_utc"])
+            self.assertEqual(deleted["bytes"], 7200)
+            self.assertEqual(deleted["auxiliary_dirs"], 1)
+            self.assertFalse(resources.exists())
+            self.assertTrue((storage / "chatSessions" / f"{ids[3]}.jsonl").exists())
+            self.assertTrue((storage / "chatSessions" / f"{ids[0]}.jsonl").exists())
+
     def test_resolves_workspace_root_for_code_workspace_metadata(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
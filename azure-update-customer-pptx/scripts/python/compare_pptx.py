@@ -4,37 +4,136 @@ from __future__ import annotations
 
 import argparse
 import json
+import posixpath
 import re
 import sys
+import xml.etree.ElementTree as ET
 import zipfile
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from pptx import Presentation
-
 P14_NS = "http://schemas.microsoft.com/office/powerpoint/2010/main"
+P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+SHAPE_TAGS = {f"{P}{tag}" for tag in ("sp", "pic", "graphicFrame", "grpSp", "cxnSp", "contentPart")}
+
+
+@dataclass
+class Shape:
+    """Top-level slide shape, reduced to what the snapshot compares."""
+
+    name: str = ""
+    ph_type: str | None = None
+    ph_idx: int | None = None
+    has_text_frame: bool = False
+    text: str = ""
+    link_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Rel:
+    reltype: str
+    target: str
+    partname: str
+    external: bool
+
+
+def part_rels(archive: zipfile.ZipFile, partname: str) -> dict[str, Rel]:
+    base, name = posixpath.split(partname)
+    try:
+        xml = archive.read(f"{base}/_rels/{name}.rels".lstrip("/"))
+    except KeyError:
+        return {}
+    rels = {}
+    for element in ET.fromstring(xml).iter(PKG_REL):
+        target = element.get("Target", "")
+        external = element.get("TargetMode") == "External"
+        resolved = target if external else posixpath.normpath(posixpath.join(base, target))
+        rels[element.get("Id")] = Rel(element.get("Type", "").rsplit("/", 1)[-1], target, resolved, external)
+    return rels
+
+
+def paragraph_text(paragraph: ET.Element) -> str:
+    pieces = []
+    for child in paragraph:
+        if child.tag in (f"{A}r", f"{A}fld"):
+            pieces.append(child.findtext(f"{A}t") or "")
+        elif child.tag == f"{A}br":
+            pieces.append("\v")
+    return "".join(pieces)
+
+
+def read_shape(element: ET.Element) -> Shape:
+    shape = Shape()
+    properties = element[0] if len(element) else None
+    if properties is not None:
+        c_nv_pr = properties.find(f"{P}cNvPr")
+        if c_nv_pr is not None:
+            shape.name = c_nv_pr.get("name", "")
+            click = c_nv_pr.find(f"{A}hlinkClick")
+            if click is not None and click.get(R_ID):
+                shape.link_ids.append(click.get(R_ID))
+        placeholder = properties.find(f"{P}nvPr/{P}ph")
+        if placeholder is not None:
+            shape.ph_type = placeholder.get("type", "obj")
+            shape.ph_idx = int(placeholder.get("idx", 0))
+    if element.tag == f"{P}sp":
+        shape.has_text_frame = True
+        paragraphs = element.findall(f"{P}txBody/{A}p")
+        shape.text = "\n".join(paragraph_text(paragraph) for paragraph in paragraphs)
+        for run_link in element.iterfind(f"{P}txBody/{A}p/{A}r/{A}rPr/{A}hlinkClick"):
+            if run_link.get(R_ID):
+                shape.link_ids.append(run_link.get(R_ID))
+    return shape
 
 
-def hyperlinks(slide) -> list[str]:
+def read_part(archive: zipfile.ZipFile, partname: str) -> tuple[dict[str, str], str, list[Shape]]:
+    """Stream a slide-like part: (root attributes, p:cSld name, top-level shapes)."""
+    root_attrs: dict[str, str] = {}
+    name = ""
+    shapes = []
+    stack: list[str] = []
+    with archive.open(partname.lstrip("/")) as stream:
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                if not stack:
+                    root_attrs = dict(element.attrib)
+                elif element.tag == f"{P}cSld":
+                    name = element.get("name", "")
+                stack.append(element.tag)
+                continue
+            stack.pop()
+            if element.tag in SHAPE_TAGS and stack and stack[-1] == f"{P}spTree":
+                shapes.append(read_shape(element))
+                element.clear()
+    return root_attrs, name, shapes
+
+
+def notes_text(archive: zipfile.ZipFile, partname: str) -> str:
+    _, _, shapes = read_part(archive, partname)
+    body = next((shape for shape in shapes if shape.ph_type == "body"), None)
+    return body.text if body is not None else ""
+
+
+def hyperlinks(shapes: list[Shape], rels: dict[str, Rel], partname: str) -> list[str]:
     values = []
-    for shape in slide.shapes:
-        try:
-            address = shape.click_action.hyperlink.address
-            if address:
-                values.append(address)
-        except Exception:
-            pass
-        if not getattr(shape, "has_text_frame", False):
-            continue
-        for paragraph in shape.text_frame.paragraphs:
-            values.extend(run.hyperlink.address for run in paragraph.runs if run.hyperlink.address)
-    return sorted(set(values))
-
-
-def title(slide) -> str:
-    if slide.shapes.title and slide.shapes.title.text.strip():
-        return slide.shapes.title.text.strip()
-    for shape in slide.shapes:
-        if getattr(shape, "has_text_frame", False) and shape.text.strip():
+    for shape in shapes:
+        for rid in shape.link_ids:
+            rel = rels.get(rid)
+            if rel is None:
+                continue
+            values.append(rel.target if rel.external else posixpath.relpath(rel.partname, posixpath.dirname(partname)))
+    return sorted(set(value for value in values if value))
+
+
+def title(shapes: list[Shape]) -> str:
+    title_shape = next((shape for shape in shapes if shape.ph_idx == 0), None)
+    if title_shape and title_shape.text.strip():
+        return title_shape.text.strip()
+    for shape in shapes:
+        if shape.has_text_frame and shape.text.strip():
             return shape.text.strip().splitlines()[0]
     return ""
 
@@ -64,24 +163,48 @@ def section_snapshot(path: Path) -> list[dict]:
     return sections
 
 
+def slide_partnames(archive: zipfile.ZipFile) -> list[str]:
+    rels = part_rels(archive, "/ppt/presentation.xml")
+    partnames = []
+    with archive.open("ppt/presentation.xml") as stream:
+        for _, element in ET.iterparse(stream):
+            if element.tag == f"{P}sldId":
+                partnames.append(rels[element.get(R_ID)].partname)
+            elif element.tag == f"{P}sldIdLst":
+                break
+    return partnames
+
+
 def snapshot(path: Path) -> dict:
-    prs = Presentation(path)
+    """Read the compared fields straight from the package XML, one slide at a time.
+
+    Read-only: unlike python-pptx's slide.notes_slide, a missing notes slide is
+    reported as absent rather than created.
+    """
     slides = []
-    for index, slide in enumerate(prs.slides, 1):
-        texts = [shape.text.strip() for shape in slide.shapes if getattr(shape, "has_text_frame", False) and shape.text.strip()]
-        slides.append({
-            "index": index,
-            "title": normalized_title(title(slide)),
-            "layout": slide.slide_layout.name,
-            "hidden": slide._element.get("show") == "0",
-            "notesPresent": bool(slide.notes_slide.notes_text_frame and slide.notes_slide.notes_text_frame.text.strip()),
-            "hyperlinks": hyperlinks(slide),
-            "regionTexts": sorted(
-                shape.text.strip()
-                for shape in slide.shapes
-                if shape.name.startswith("RegionStamp") and getattr(shape, "has_text_frame", False) and shape.text.strip()
-            ),
-        })
+    layout_names: dict[str, str] = {}
+    with zipfile.ZipFile(path) as archive:
+        names = set(archive.namelist())
+        for index, partname in enumerate(slide_partnames(archive), 1):
+            root_attrs, _, shapes = read_part(archive, partname)
+            rels = part_rels(archive, partname)
+            layout = next((rel.partname for rel in rels.values() if rel.reltype == "slideLayout"), None)
+            if layout and layout not in layout_names:
+                layout_names[layout] = read_part(archive, layout)[1]
+            notes = next((rel.partname for rel in rels.values() if rel.reltype == "notesSlide"), None)
+            slides.append({
+                "index": index,
+                "title": normalized_title(title(shapes)),
+                "layout": layout_names.get(layout, ""),
+                "hidden": root_attrs.get("show") == "0",
+                "notesPresent": bool(notes and notes.lstrip("/") in names and notes_text(archive, notes).strip()),
+                "hyperlinks": hyperlinks(shapes, rels, partname),
+                "regionTexts": sorted(
+                    shape.text.strip()
+                    for shape in shapes
+                    if shape.name.startswith("RegionStamp") and shape.has_text_frame and shape.text.strip()
+                ),
+            })
     return {"slideCount": len(slides), "slides": slides, "sections": section_snapshot(path)}
 
 
@@ -41,6 +41,30 @@ class PythonEngineTests(unittest.TestCase):
             BUILDER.add_region_stamp(slide, status, style)
             self.assertEqual(slide.shapes[-1].text, style["regionStamp"]["styles"][status]["text"])
 
+    def test_snapshot_matches_python_pptx(self):
+        with tempfile.TemporaryDirectory(prefix="azure-python-compare-test-") as temp:
+            deck = Path(temp) / "deck.pptx"
+            prs = Presentation(SKILL_ROOT / "assets" / "template" / "azure-update-template.pptx")
+            style = BUILDER.load_json(SKILL_ROOT / "assets" / "render-style.v1.json")
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            BUILDER.add_region_stamp(slide, "グローバル", style)
+            link = slide.shapes.add_textbox(0, 0, 914400, 914400).text_frame.paragraphs[0].add_run()
+            link.text = "Learn"
+            link.hyperlink.address = "https://learn.microsoft.com/azure/example"
+            slide._element.set("show", "0")
+            prs.save(deck)
+
+            snapshot = COMPARER.snapshot(deck)
+            prs = Presentation(deck)
+            self.assertEqual(snapshot["slideCount"], len(prs.slides))
+            for entry, slide in zip(snapshot["slides"], prs.slides):
+                self.assertEqual(entry["layout"], slide.slide_layout.name)
+                self.assertEqual(entry["hidden"], slide._element.get("show") == "0")
+                notes = slide.has_notes_slide and slide.notes_slide.notes_text_frame
+                self.assertEqual(entry["notesPresent"], bool(notes and notes.text.strip()))
+            self.assertEqual(snapshot["slides"][-1]["hyperlinks"], ["https://learn.microsoft.com/azure/example"])
+            self.assertEqual(snapshot["slides"][-1]["regionTexts"], [style["regionStamp"]["styles"]["グローバル"]["text"]])
+
     def test_contract_build(self):
         with tempfile.TemporaryDirectory(prefix="azure-python-engine-test-") as temp:
             root = Path(temp)
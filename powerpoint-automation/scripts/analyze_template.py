@@ -13,7 +13,10 @@ This script inspects the slide master layouts in a template and creates
 a JSON configuration file that maps slide types to appropriate layouts.
 
 Usage:
-    python scripts/analyze_template.py <template.pptx> [output.json]
+    python scripts/analyze_template.py <template.pptx> [output.json] [--no-cache]
+
+Results are cached per template content (see template_cache.py); pass
+--no-cache to force a fresh analysis.
 
 Examples:
     python scripts/analyze_template.py templates/sample-ppf.pptx
@@ -192,8 +195,11 @@ def generate_layout_mapping(layouts_info: list) -> dict:
 
 def analyze_template(template_path: str) -> dict:
     """Analyze a PowerPoint template and return full analysis."""
-    prs = Presentation(template_path)
-    
+    return analyze_presentation(Presentation(template_path), template_path)
+
+
+def analyze_presentation(prs, template_path: str) -> dict:
+    """Analyze an already loaded Presentation (no re-read of the PPTX file)."""
     result = {
         'template': str(Path(template_path).name),
         'template_path': str(template_path),
@@ -277,8 +283,14 @@ def main():
         print(__doc__)
         sys.exit(1)
     
-    template_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    use_cache = '--no-cache' not in sys.argv
+    argv = [arg for arg in sys.argv[1:] if arg != '--no-cache']
+    if not argv:
+        print(__doc__)
+        sys.exit(1)
+    
+    template_path = argv[0]
+    output_path = argv[1] if len(argv) > 1 else None
     
     # Auto-generate output path if not specified
     if output_path is None:
@@ -287,7 +299,11 @@ def main():
     
     # Analyze
     print(f"Analyzing: {template_path}")
-    analysis = analyze_template(template_path)
+    if use_cache:
+        from template_cache import get_analysis
+        analysis = get_analysis(template_path)
+    else:
+        analysis = analyze_template(template_path)
     
     # Print summary
     print_analysis(analysis)
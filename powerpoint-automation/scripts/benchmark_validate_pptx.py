@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Ag-ppt-create - AI-powered PPTX generation pipeline
+# https://github.com/aktsmm/Ag-ppt-create
+#
+# Copyright (c) aktsmm. Licensed under CC BY-NC-SA 4.0.
+# DO NOT MODIFY THIS HEADER BLOCK.
+# =============================================================================
+"""
+Benchmark validate_pptx.py's single-pass inspection against the old three-parse flow.
+
+Builds a synthetic deck (300 slides by default: title, bullets, speaker notes,
+an image on every 10th slide, signature on first/last) plus a matching
+content.json, then times:
+    three_pass   the pre-inspect_pptx validate_pptx flow (slide info, slide
+                 count and text overflow each parse the package; kept here as
+                 legacy_* functions)
+    single_pass  validate_pptx(), which parses the package once
+
+Usage:
+    python scripts/benchmark_validate_pptx.py
+    python scripts/benchmark_validate_pptx.py --slides 300 --repeat 5 --json
+    python scripts/benchmark_validate_pptx.py --template assets/template.pptx
+"""
+
+import argparse
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.util import Inches
+
+import validate_pptx as validator
+
+
+def build_benchmark_deck(deck_path: str, content_path: str, slides: int,
+                         template: Optional[str] = None) -> None:
+    """Write a synthetic deck and the content.json it was built from."""
+    prs = Presentation(template) if template else Presentation()
+    layout = prs.slide_layouts[1] if len(prs.slide_layouts) > 1 else prs.slide_layouts[0]
+    image = _tiny_png()
+    content = {"slides": []}
+
+    for idx in range(1, slides + 1):
+        items = [f"Point {idx}.{n}: " + "detail " * (n * 4) for n in range(1, 7)]
+        notes = f"Talking points for slide {idx}. " * 4
+        if idx == 1:
+            notes = f"📌 Generated by: https://example.invalid/repo\n\n{notes}"
+        elif idx == slides:
+            notes = f"{notes}\n\n---\n🔧 This presentation was created using Ag-ppt-create"
+
+        slide = prs.slides.add_slide(layout)
+        if slide.shapes.title is not None:
+            slide.shapes.title.text = f"Slide {idx}"
+        body = next((ph for ph in slide.placeholders if ph.placeholder_format.idx == 1), None)
+        if body is not None:
+            body.text_frame.text = "\n".join(items)
+        slide.notes_slide.notes_text_frame.text = notes
+
+        entry = {"type": "content", "title": f"Slide {idx}", "items": items, "notes": notes}
+        if idx % 10 == 0 and image is not None:
+            slide.shapes.add_picture(io.BytesIO(image), Inches(8), Inches(2), Inches(1))
+            entry["image"] = {"path": "bench.png"}
+        content["slides"].append(entry)
+
+    prs.save(deck_path)
+    with open(content_path, 'w', encoding='utf-8') as f:
+        json.dump(content, f, ensure_ascii=False)
+
+
+def _tiny_png() -> Optional[bytes]:
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), (40, 90, 160)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def legacy_count_pptx_slides(pptx_path: str) -> int:
+    """Slide count parse (validate_pptx before inspect_pptx)."""
+    prs = Presentation(pptx_path)
+    return len(prs.slides)
+
+
+def legacy_get_slide_info(pptx_path: str) -> List[Dict[str, Any]]:
+    """Slide info parse (validate_pptx before inspect_pptx)."""
+    prs = Presentation(pptx_path)
+    slides_info = []
+    
+    for idx, slide in enumerate(prs.slides, 1):
+        info = {
+            "slide_number": idx,
+            "has_notes": False,
+            "notes_length": 0,
+            "notes_text": "",
+            "has_images": False,
+            "image_count": 0,
+            "has_title": False,
+            "title_text": "",
+            "shape_count": len(slide.shapes)
+        }
+        
+        if slide.has_notes_slide:
+            notes_text = slide.notes_slide.notes_text_frame.text.strip()
+            if notes_text:
+                info["has_notes"] = True
+                info["notes_length"] = len(notes_text)
+                info["notes_text"] = notes_text
+        
+        for shape in slide.shapes:
+            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                info["has_images"] = True
+                info["image_count"] += 1
+            
+            if shape.has_text_frame:
+                if hasattr(shape, 'is_placeholder') and shape.is_placeholder:
+                    ph_type = shape.placeholder_format.type
+                    if str(ph_type) in ['TITLE (1)', 'CENTER_TITLE (3)']:
+                        info["has_title"] = True
+                        info["title_text"] = shape.text_frame.text[:50]
+        
+        slides_info.append(info)
+    
+    return slides_info
+
+
+def legacy_text_overflow(pptx_path: str) -> Tuple[List[int], List[int]]:
+    """Text overflow parse (validate_pptx before inspect_pptx)."""
+    prs = Presentation(pptx_path)
+    overflow_slides = []
+    long_text_slides = []
+    
+    for slide_idx, slide in enumerate(prs.slides, 1):
+        for shape in slide.shapes:
+            if not hasattr(shape, "text_frame") or not shape.has_text_frame:
+                continue
+            text_frame = shape.text_frame
+            if len(text_frame.text) > 800:
+                long_text_slides.append(slide_idx)
+            if len(text_frame.paragraphs) > 15:
+                overflow_slides.append(slide_idx)
+            for para in text_frame.paragraphs:
+                if len(para.text) > 120 and slide_idx not in overflow_slides:
+                    overflow_slides.append(slide_idx)
+    
+    return overflow_slides, long_text_slides
+
+
+def three_pass(deck_path: str, content_path: str) -> None:
+    """The pre-inspect_pptx flow: three independent parses of the same package."""
+    result = validator.ValidationResult()
+    slides_info = legacy_get_slide_info(deck_path)
+    content = validator.load_content_json(content_path)
+    validator.validate_slide_count(result, {"slide_count": legacy_count_pptx_slides(deck_path)}, content)
+    validator.validate_notes(result, slides_info, content)
+    validator.validate_images(result, slides_info, content)
+    legacy_text_overflow(deck_path)
+
+
+def single_pass(deck_path: str, content_path: str) -> None:
+    validator.validate_pptx(deck_path, content_path)
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest wall time of `repeat` runs."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(slides: int, repeat: int, template: Optional[str] = None) -> Dict[str, Any]:
+    """Build the deck in a temp directory and time both flows."""
+    with tempfile.TemporaryDirectory() as tmp:
+        deck_path = str(Path(tmp) / "bench.pptx")
+        content_path = str(Path(tmp) / "bench_content.json")
+        build_benchmark_deck(deck_path, content_path, slides, template)
+
+        status = validator.validate_pptx(deck_path, content_path).status
+        three = best_of(lambda: three_pass(deck_path, content_path), repeat)
+        single = best_of(lambda: single_pass(deck_path, content_path), repeat)
+
+        return {
+            "slides": slides,
+            "repeat": repeat,
+            "deck_bytes": Path(deck_path).stat().st_size,
+            "validation_status": status,
+            "three_pass_seconds": round(three, 4),
+            "single_pass_seconds": round(single, 4),
+            "speedup": round(three / single, 2) if single else None,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass PPTX validation")
+    parser.add_argument("--slides", type=int, default=300, help="Slides in the synthetic deck (default: 300)")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions (default: 3)")
+    parser.add_argument("--template", help="Template PPTX to build the deck from (default: python-pptx default)")
+    parser.add_argument("--json", action="store_true", help="Output result as JSON")
+
+    args = parser.parse_args()
+    if args.slides < 1:
+        parser.error("--slides must be at least 1")
+
+    result = run_benchmark(args.slides, args.repeat, args.template)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"\n📊 validate_pptx benchmark: {result['slides']} slides ({result['deck_bytes'] / 1024:.0f} KB)")
+        print(f"   three-pass:  {result['three_pass_seconds']:.3f}s")
+        print(f"   single-pass: {result['single_pass_seconds']:.3f}s")
+        print(f"   speedup:     {result['speedup']}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
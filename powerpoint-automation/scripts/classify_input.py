@@ -45,6 +45,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, Tuple
 
+import pptx_reader
+
 # Fix Windows console encoding issues
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
@@ -106,19 +108,12 @@ def detect_pptx_language(pptx_path: str) -> Tuple[str, float]:
         Tuple of (language_code, confidence)
         language_code: 'en' for English, 'ja' for Japanese, 'unknown'
     """
-    try:
-        from pptx import Presentation
-    except ImportError:
-        print("Warning: python-pptx not installed. Cannot detect PPTX language.")
-        return ("unknown", 0.0)
-    
-    prs = Presentation(pptx_path)
     all_text = []
     
-    # Extract text from all slides
-    for slide in prs.slides:
-        for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text:
+    # Extract text from all slides (auto shapes/placeholders, as slide.shapes[i].text did)
+    for slide in pptx_reader.iter_slides(pptx_path, notes=False):
+        for shape in slide.top_level_shapes:
+            if shape.kind == "sp" and shape.text:
                 all_text.append(shape.text)
     
     combined_text = " ".join(all_text)
@@ -208,9 +203,7 @@ def detect_input_type(input_path: str) -> Dict[str, Any]:
 def get_slide_count(pptx_path: str) -> int:
     """Get the number of slides in a PPTX file."""
     try:
-        from pptx import Presentation
-        prs = Presentation(pptx_path)
-        return len(prs.slides)
+        return pptx_reader.slide_count(pptx_path)
     except Exception:
         return 0
 
@@ -43,6 +43,10 @@ except ImportError as e:
     print("Install with: pip install python-pptx lxml")
     sys.exit(1)
 
+# Bump whenever clean_presentation() output changes; template_cache.py keys
+# cached clean templates on it so stale entries are never reused.
+CLEANER_VERSION = "1"
+
 
 def analyze_layout(layout, slide_height: float) -> Dict[str, Any]:
     """Analyze a single layout for potential issues."""
@@ -340,6 +344,35 @@ def create_clean_template(
     results = {
         "source": source_path,
         "output": output_path,
+        **clean_presentation(
+            prs,
+            remove_backgrounds=remove_backgrounds,
+            remove_decorations=remove_decorations,
+            fix_positions=fix_positions,
+            fix_contrast=fix_contrast,
+        ),
+    }
+    
+    # Save the clean template
+    output_dir = Path(output_path).parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    prs.save(output_path)
+    
+    results["success"] = True
+    print(f"\n✅ Created clean template: {output_path}")
+    
+    return results
+
+
+def clean_presentation(
+    prs: Presentation,
+    remove_backgrounds: bool = False,
+    remove_decorations: bool = True,
+    fix_positions: bool = True,
+    fix_contrast: bool = True
+) -> Dict[str, Any]:
+    """Clean an already loaded Presentation in place; the caller decides where to save it."""
+    results = {
         "slide_size": f"{prs.slide_width.inches:.2f} x {prs.slide_height.inches:.2f}",
         "original_layouts": len(prs.slide_layouts),
         "actions": []
@@ -376,14 +409,6 @@ def create_clean_template(
         if count > 0:
             results["actions"].append(f"Fixed {count} text colors for better contrast")
     
-    # Save the clean template
-    output_dir = Path(output_path).parent
-    output_dir.mkdir(parents=True, exist_ok=True)
-    prs.save(output_path)
-    
-    results["success"] = True
-    print(f"\n✅ Created clean template: {output_path}")
-    
     return results
 
 
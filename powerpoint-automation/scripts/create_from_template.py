@@ -13,11 +13,14 @@ Inherits design (colors, fonts, backgrounds) from template.
 Usage:
     python scripts/create_from_template.py <template.pptx> <content.json> <output.pptx> [--config <layouts.json>]
     python scripts/create_from_template.py <template.pptx> --list-layouts
+    python scripts/create_from_template.py <template.pptx> --batch <content.json>... [--output-dir <dir>] [--workers N]
 
 Options:
     --config <layouts.json>   Use pre-analyzed layout mapping file
                               (Generated by: python scripts/analyze_template.py <template.pptx>)
     --no-signature            Disable auto-signature in speaker notes
+    --batch <content.json>... Build one deck per content file from a single loaded template,
+                              in parallel, and write <output-dir>/batch_manifest.json
 
 Supports image embedding:
     "image": {"path": "images/foo.png", "position": "right", "width_percent": 45}
@@ -50,13 +53,18 @@ from pptx.dml.color import RGBColor
 from pptx.oxml.ns import qn
 from lxml import etree
 import json
+import os
 import sys
+import time
 import argparse
+import contextlib
+import io
 import urllib.request
 import tempfile
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 try:
     from PIL import Image
@@ -1026,8 +1034,13 @@ def create_pptx_from_template(template_path: str, content_path: str, output_path
     Args:
         add_signature: Add repository signature to first/last slide notes (default: True)
     """
-    
-    # Load template
+    prs = load_base_template(template_path)
+    layout_map = detect_layout_map(prs, config_path)
+    build_deck(prs, content_path, output_path, layout_map, force=force, add_signature=add_signature)
+
+
+def load_base_template(template_path: str) -> Presentation:
+    """Load template and remove its existing slides, keeping masters and layouts."""
     print(f"\nLoading template: {template_path}")
     prs = Presentation(template_path)
     
@@ -1045,30 +1058,16 @@ def create_pptx_from_template(template_path: str, content_path: str, output_path
         del prs.slides._sldIdLst[0]
     print("Cleared existing slides from template.\n")
     
-    # Load content
-    print(f"Loading content: {content_path}")
-    with open(content_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    slides_data = data.get('slides', data) if isinstance(data, dict) else data
-    if isinstance(slides_data, dict):
-        slides_data = [slides_data]
-    
-    # Validate and auto-fix content issues
-    print("[*] Validating content...")
-    slides_data, has_critical_errors = validate_and_fix_content(slides_data)
-    
-    if has_critical_errors and not force:
-        print("\n[!] CRITICAL: Content validation failed!")
-        print("   Found slides with type='content' but no items/bullets.")
-        print("   Please fix the content.json before generating PPTX.")
-        print("   (Use --force to ignore this check)")
-        sys.exit(1)
-    elif has_critical_errors and force:
-        print("\n[!] WARNING: Content validation found issues but continuing due to --force flag.")
-    
-    print(f"Creating {len(slides_data)} slides...\n")
+    return prs
+
+
+def detect_layout_map(prs: Presentation, config_path: Optional[str] = None) -> dict:
+    """
+    Resolve slide type → layout index mapping.
     
+    Uses the layout config (from analyze_template.py) if given, otherwise
+    matches keywords against the template's layout names.
+    """
     # Load layout mapping from config file if provided
     layout_map = None
     if config_path and Path(config_path).exists():
@@ -1132,6 +1131,46 @@ def create_pptx_from_template(template_path: str, content_path: str, output_path
         print(f"   Auto-detected: title={title_layout}, content={content_layout}, section={section_layout}, title_only={title_only_layout}\n")
         print("[?] Tip: Run 'python scripts/analyze_template.py <template.pptx>' for accurate layout mapping.\n")
     
+    return layout_map
+
+
+def build_deck(prs: Presentation, content_path: str, output_path: str, layout_map: dict,
+               force: bool = False, add_signature: bool = True, repo_url: Optional[str] = None) -> int:
+    """
+    Fill a cleared template with slides from content JSON and save it.
+    
+    Args:
+        prs: Template from load_base_template() (slides are appended to it)
+        layout_map: Mapping from detect_layout_map()
+        repo_url: Signature URL (default: looked up with get_repo_info())
+    
+    Returns:
+        Number of slides written
+    """
+    # Load content
+    print(f"Loading content: {content_path}")
+    with open(content_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    slides_data = data.get('slides', data) if isinstance(data, dict) else data
+    if isinstance(slides_data, dict):
+        slides_data = [slides_data]
+    
+    # Validate and auto-fix content issues
+    print("[*] Validating content...")
+    slides_data, has_critical_errors = validate_and_fix_content(slides_data)
+    
+    if has_critical_errors and not force:
+        print("\n[!] CRITICAL: Content validation failed!")
+        print("   Found slides with type='content' but no items/bullets.")
+        print("   Please fix the content.json before generating PPTX.")
+        print("   (Use --force to ignore this check)")
+        sys.exit(1)
+    elif has_critical_errors and force:
+        print("\n[!] WARNING: Content validation found issues but continuing due to --force flag.")
+    
+    print(f"Creating {len(slides_data)} slides...\n")
+    
     # Create slides
     first_slide = None
     last_slide = None
@@ -1220,7 +1259,7 @@ def create_pptx_from_template(template_path: str, content_path: str, output_path
     
     # Add signature to first and last slides (unless --no-signature)
     if add_signature and len(prs.slides) > 0:
-        repo_url = get_repo_info()
+        repo_url = repo_url or get_repo_info()
         sig_first = f"📌 Generated by: {repo_url}"
         sig_last = f"---\n🔧 This presentation was created using Ag-ppt-create\n{repo_url}"
         
@@ -1262,69 +1301,164 @@ def create_pptx_from_template(template_path: str, content_path: str, output_path
     
     print(f"\n✅ Created: {output_path}")
     print(f"   Total slides: {len(prs.slides)}")
+    
+    return len(prs.slides)
+
+
+# Per-process batch state, set once per worker by _init_batch_worker()
+_BATCH_BASE: Optional[bytes] = None
+_BATCH_LAYOUT_MAP: Optional[dict] = None
 
 
-def _auto_clean_template(template_path: str) -> str:
+def _init_batch_worker(base: bytes, layout_map: dict) -> None:
+    global _BATCH_BASE, _BATCH_LAYOUT_MAP
+    _BATCH_BASE = base
+    _BATCH_LAYOUT_MAP = layout_map
+
+
+def _build_batch_deck(content_path: str, output_path: str, force: bool,
+                      add_signature: bool, repo_url: Optional[str]) -> dict:
+    """Build one deck from the in-memory base template; never raises."""
+    started = time.perf_counter()
+    record = {'content': content_path, 'output': output_path}
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            prs = Presentation(io.BytesIO(_BATCH_BASE))
+            slides = build_deck(prs, content_path, output_path, _BATCH_LAYOUT_MAP,
+                                force=force, add_signature=add_signature, repo_url=repo_url)
+        record.update(status='success', slides=slides)
+    except SystemExit:
+        record.update(status='failed', error='Content validation failed (use --force to ignore)')
+    except Exception as e:
+        record.update(status='failed', error=f"{type(e).__name__}: {e}")
+    record['seconds'] = round(time.perf_counter() - started, 3)
+    if record['status'] != 'success':
+        record['log'] = log.getvalue()[-2000:]
+    return record
+
+
+def build_batch(template_path: str, content_paths: list, output_dir: str,
+                config_path: Optional[str] = None, force: bool = False,
+                add_signature: bool = True, workers: Optional[int] = None,
+                manifest_path: Optional[str] = None) -> dict:
     """
-    Automatically clean template if it has issues (dark backgrounds, decorations, etc.).
-    Creates a cleaned version in output_manifest/ and returns the path.
+    Build one deck per content JSON from a single loaded template.
+    
+    The template is loaded, cleared and layout-detected once; the cleared base
+    is kept as in-memory PPTX bytes that each worker process re-opens per deck.
+    Decks are written to <output_dir>/<content stem>.pptx.
     
     Args:
-        template_path: Path to original template
+        workers: Worker processes (default: CPU count, capped at deck count)
+        manifest_path: Manifest JSON path (default: <output_dir>/batch_manifest.json)
     
     Returns:
-        Path to cleaned template (or original if no cleaning needed)
+        Manifest dict with per-deck 'status' ('success' or 'failed') and totals
     """
-    import subprocess
+    started = time.perf_counter()
+    outputs = [str(Path(output_dir) / f"{Path(c).stem}.pptx") for c in content_paths]
+    duplicates = sorted({o for o in outputs if outputs.count(o) > 1})
+    if duplicates:
+        raise ValueError(f"Content files map to the same output: {', '.join(duplicates)}")
+    
+    prs = load_base_template(template_path)
+    layout_map = detect_layout_map(prs, config_path)
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    base = buffer.getvalue()
+    repo_url = get_repo_info() if add_signature else None
+    
+    workers = max(1, min(workers or os.cpu_count() or 1, len(content_paths)))
+    print(f"[*] Building {len(content_paths)} decks with {workers} worker(s)...")
+    
+    records = {}
+    
+    def report(record: dict) -> None:
+        records[record['output']] = record
+        name = Path(record['output']).name
+        if record['status'] == 'success':
+            print(f"  ✅ {name} ({record['slides']} slides, {record['seconds']}s)")
+        else:
+            print(f"  ❌ {name}: {record['error']}")
+    
+    if workers == 1:
+        _init_batch_worker(base, layout_map)
+        for content_path, output_path in zip(content_paths, outputs):
+            report(_build_batch_deck(content_path, output_path, force, add_signature, repo_url))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(base, layout_map)) as pool:
+            futures = {
+                pool.submit(_build_batch_deck, content_path, output_path,
+                            force, add_signature, repo_url): (content_path, output_path)
+                for content_path, output_path in zip(content_paths, outputs)
+            }
+            for future in as_completed(futures):
+                content_path, output_path = futures[future]
+                try:
+                    record = future.result()
+                except Exception as e:  # e.g. a worker process died
+                    record = {'content': content_path, 'output': output_path,
+                              'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+                report(record)
+    
+    decks = [records[o] for o in outputs]
+    succeeded = sum(1 for d in decks if d['status'] == 'success')
+    manifest = {
+        'template': template_path,
+        'config': config_path,
+        'layout_mapping': layout_map,
+        'workers': workers,
+        'total': len(decks),
+        'succeeded': succeeded,
+        'failed': len(decks) - succeeded,
+        'seconds': round(time.perf_counter() - started, 3),
+        'decks': decks,
+    }
+    
+    manifest_path = manifest_path or str(Path(output_dir) / 'batch_manifest.json')
+    Path(manifest_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    
+    print(f"\n{'✅' if not manifest['failed'] else '⚠️'} Batch: {succeeded}/{len(decks)} decks built in {manifest['seconds']}s")
+    print(f"   Manifest: {manifest_path}")
+    return manifest
+
+
+def _auto_clean_template(template_path: str) -> Tuple[str, Optional[str]]:
+    """
+    Automatically clean template if it has issues (dark backgrounds, decorations, etc.).
+    Results are kept in the content-addressed template cache (template_cache.py),
+    so repeat builds from the same template skip diagnose/clean/analyze entirely.
     
-    template_stem = Path(template_path).stem
-    clean_path = f"output_manifest/{template_stem}_auto_clean.pptx"
+    Args:
+        template_path: Path to original template
     
-    # Run diagnose to check if cleaning is needed
-    try:
-        result = subprocess.run(
-            ["python", "scripts/diagnose_template.py", template_path, "--json"],
-            capture_output=True, text=True, timeout=60
-        )
-        
-        if result.returncode == 0:
-            import json
-            diag = json.loads(result.stdout)
-            issues = diag.get("total_issues", 0)
-            
-            if issues == 0:
-                print(f"[i] Template is clean, no auto-cleaning needed")
-                return template_path
-            
-            print(f"[!] Template has {issues} issues, auto-cleaning...")
-    except Exception as e:
-        print(f"[!] Diagnose failed ({e}), proceeding with auto-clean")
+    Returns:
+        (template path, layout config path) - the cleaned template and its
+        config, or the original template and None if no cleaning was needed
+    """
+    from template_cache import get_clean_template
     
-    # Run clean_template
     try:
-        result = subprocess.run(
-            ["python", "scripts/create_clean_template.py", template_path, clean_path, "--all"],
-            capture_output=True, text=True, timeout=120
-        )
-        
-        if result.returncode == 0 and Path(clean_path).exists():
-            print(f"[+] Auto-cleaned template: {clean_path}")
-            
-            # Also run analyze_template for the clean version
-            subprocess.run(
-                ["python", "scripts/analyze_template.py", clean_path],
-                capture_output=True, text=True, timeout=60
-            )
-            
-            return clean_path
-        else:
-            print(f"[!] Auto-clean failed, using original template")
-            if result.stderr:
-                print(f"    Error: {result.stderr[:200]}")
-            return template_path
+        entry = get_clean_template(template_path)
     except Exception as e:
         print(f"[!] Auto-clean failed ({e}), using original template")
-        return template_path
+        return template_path, None
+    
+    if entry['diagnosis']['clean']:
+        print(f"[i] Template is clean, no auto-cleaning needed")
+        return template_path, None
+    
+    issues = entry['diagnosis']['summary']['issues_found']
+    if entry['cached']:
+        print(f"[+] Using cached clean template ({issues} issues fixed): {entry['template']}")
+    else:
+        print(f"[!] Template had {issues} issues, auto-cleaned: {entry['template']}")
+    
+    return entry['template'], entry['config']
 
 
 def main():
@@ -1348,6 +1482,10 @@ Examples:
 
   # Auto-detect layouts (no config):
   python scripts/create_from_template.py templates/sample.pptx content.json output.pptx
+
+  # Batch: one deck per content file, template loaded once, parallel workers:
+  python scripts/create_from_template.py templates/sample.pptx --batch content/*.json \\
+      --output-dir output_ppt --workers 4
 '''
     )
     
@@ -1360,25 +1498,35 @@ Examples:
     parser.add_argument('--no-signature', action='store_true', help='Disable repository signature in speaker notes')
     parser.add_argument('--auto-clean', action='store_true', 
                         help='Auto-clean template (remove dark backgrounds, decorations, fix positions)')
+    parser.add_argument('--batch', nargs='+', metavar='CONTENT',
+                        help='Build one deck per content JSON (output: <output-dir>/<content stem>.pptx)')
+    parser.add_argument('--output-dir', default='output_ppt', help='Batch output directory (default: output_ppt)')
+    parser.add_argument('--workers', type=int, help='Batch worker processes (default: CPU count)')
+    parser.add_argument('--manifest', help='Batch manifest path (default: <output-dir>/batch_manifest.json)')
     
     args = parser.parse_args()
     
     # List layouts mode
-    if args.list_layouts or not args.content:
+    if args.list_layouts or not (args.content or args.batch):
         list_layouts(args.template)
         return
     
     # Validate arguments
-    if not args.output:
+    if args.batch and args.content:
+        parser.error("--batch takes the content files; do not pass content/output positionally")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if not args.batch and not args.output:
         parser.error("Output path is required")
     
     # Auto-clean template if requested
     template_path = args.template
+    clean_config = None
     if args.auto_clean:
-        template_path = _auto_clean_template(args.template)
+        template_path, clean_config = _auto_clean_template(args.template)
     
     # Auto-find config if not specified
-    config_path = args.config
+    config_path = args.config or clean_config
     if not config_path:
         # Try to find matching config file (check cleaned template first)
         template_stem = Path(template_path).stem
@@ -1394,6 +1542,17 @@ Examples:
                 config_path = str(auto_config)
                 print(f"[+] Auto-found config: {config_path}")
     
+    if args.batch:
+        try:
+            manifest = build_batch(
+                template_path, args.batch, args.output_dir, config_path,
+                force=args.force, add_signature=not args.no_signature,
+                workers=args.workers, manifest_path=args.manifest
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        sys.exit(1 if manifest['failed'] else 0)
+    
     create_pptx_from_template(
         template_path, args.content, args.output, config_path,
         force=args.force, add_signature=not args.no_signature
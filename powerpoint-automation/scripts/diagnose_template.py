@@ -10,7 +10,7 @@
 Diagnose PPTX template for potential issues before using it.
 
 Usage:
-    python scripts/diagnose_template.py <template.pptx>
+    python scripts/diagnose_template.py <template.pptx> [--json] [--no-cache]
 
 Checks for:
     - Background images in slide masters (decorative graphics)
@@ -20,7 +20,8 @@ Checks for:
     - Excessive number of slide masters
 
 Output:
-    Prints diagnosis report to console.
+    Prints diagnosis report to console. Reports are cached per template
+    content (see template_cache.py) unless --no-cache is given.
     Returns exit code 0 if clean, 1 if issues found.
 """
 
@@ -92,6 +93,37 @@ def check_master_count(prs) -> list:
     return issues
 
 
+def view_props_issues(content: str) -> list:
+    """Return issues for a viewProps.xml document."""
+    issues = []
+    if 'lastView="sldMasterView"' in content:
+        issues.append({
+            'type': 'master_view_default',
+            'severity': 'warning',
+            'description': 'Template opens in Slide Master view instead of Normal view',
+            'recommendation': 'Generated PPTX will open in Master view. Will be auto-fixed during generation.'
+        })
+    elif 'lastView="sldSorterView"' in content:
+        issues.append({
+            'type': 'sorter_view_default',
+            'severity': 'info',
+            'description': 'Template opens in Slide Sorter view',
+            'recommendation': 'Consider if this is intentional'
+        })
+    return issues
+
+
+def check_presentation_view_props(prs) -> list:
+    """Check view settings from an already loaded Presentation's package parts."""
+    for part in prs.part.package.iter_parts():
+        if str(part.partname) == '/ppt/viewProps.xml':
+            try:
+                return view_props_issues(part.blob.decode('utf-8'))
+            except UnicodeDecodeError:
+                return []
+    return []
+
+
 def check_view_props(template_path: str) -> list:
     """Check if template has non-standard view settings (e.g., sldMasterView)."""
     import zipfile
@@ -101,20 +133,7 @@ def check_view_props(template_path: str) -> list:
         with zipfile.ZipFile(template_path, 'r') as z:
             if 'ppt/viewProps.xml' in z.namelist():
                 content = z.read('ppt/viewProps.xml').decode('utf-8')
-                if 'lastView="sldMasterView"' in content:
-                    issues.append({
-                        'type': 'master_view_default',
-                        'severity': 'warning',
-                        'description': 'Template opens in Slide Master view instead of Normal view',
-                        'recommendation': 'Generated PPTX will open in Master view. Will be auto-fixed during generation.'
-                    })
-                elif 'lastView="sldSorterView"' in content:
-                    issues.append({
-                        'type': 'sorter_view_default',
-                        'severity': 'info',
-                        'description': 'Template opens in Slide Sorter view',
-                        'recommendation': 'Consider if this is intentional'
-                    })
+                issues = view_props_issues(content)
     except Exception as e:
         pass  # Silently ignore if can't read viewProps
     
@@ -128,8 +147,16 @@ def diagnose_template(template_path: str) -> dict:
     Returns:
         dict with 'issues', 'summary', 'clean' keys
     """
-    prs = Presentation(template_path)
+    return diagnose_presentation(Presentation(template_path), template_path)
+
+
+def diagnose_presentation(prs, template_path: str) -> dict:
+    """
+    Diagnose an already loaded Presentation (no re-read of the PPTX file).
     
+    Returns:
+        dict with 'issues', 'summary', 'clean' keys
+    """
     all_issues = []
     
     # Check for background images in masters
@@ -145,7 +172,7 @@ def diagnose_template(template_path: str) -> dict:
     all_issues.extend(master_count_issues)
     
     # Check view properties (viewProps.xml)
-    view_prop_issues = check_view_props(template_path)
+    view_prop_issues = check_presentation_view_props(prs)
     all_issues.extend(view_prop_issues)
     
     # Calculate totals
@@ -246,6 +273,7 @@ def main():
     parser = argparse.ArgumentParser(description='Diagnose PPTX template for potential issues')
     parser.add_argument('template', help='Path to template PPTX file')
     parser.add_argument('--json', action='store_true', help='Output as JSON (for scripting)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-diagnose instead of using the template cache')
     
     args = parser.parse_args()
     
@@ -257,14 +285,18 @@ def main():
             print(f"Error: File not found: {args.template}")
         sys.exit(1)
     
-    report = diagnose_template(args.template)
+    if args.no_cache:
+        report = diagnose_template(args.template)
+    else:
+        from template_cache import get_diagnosis
+        report = get_diagnosis(args.template)
     
     if args.json:
         import json
         # Output JSON for scripting
         output = {
             "clean": report['clean'],
-            "total_issues": report['summary']['total'],
+            "total_issues": report['summary']['issues_found'],
             "summary": report['summary'],
             "issues": report['issues']
         }
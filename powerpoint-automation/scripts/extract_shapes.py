@@ -12,7 +12,8 @@ Extract structured text content from PowerPoint presentations.
 This module provides functionality to:
 - Extract all text content from PowerPoint shapes
 - Preserve paragraph formatting (alignment, bullets, fonts, spacing)
-- Handle nested GroupShapes recursively with correct absolute positions
+- Handle nested GroupShapes with correct absolute positions
+- Stream slide XML directly (pptx_reader) instead of loading the object model
 - Sort shapes by visual position on slides
 - Export to JSON with clean, structured data
 
@@ -31,10 +32,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from pptx import Presentation
-from pptx.enum.text import PP_ALIGN
-from pptx.shapes.base import BaseShape
-from pptx.util import Emu, Inches
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.text import MSO_UNDERLINE
+from pptx.util import Centipoints
+
+from pptx_reader import ParagraphInfo, PptxReader, ShapeInfo, SlideInfo
 
 # Constants for EMU (English Metric Units) conversion
 EMU_PER_INCH = 914400
@@ -94,76 +97,55 @@ class ParagraphData:
     theme_color: Optional[str] = None
     
     @classmethod
-    def from_paragraph(cls, paragraph: Any) -> "ParagraphData":
-        """Create ParagraphData from a PowerPoint paragraph object.
+    def from_info(cls, paragraph: ParagraphInfo) -> "ParagraphData":
+        """Create ParagraphData from a streamed pptx_reader paragraph.
         
         Args:
-            paragraph: The PowerPoint paragraph object.
+            paragraph: ParagraphInfo from PptxReader.
             
         Returns:
             ParagraphData instance with extracted properties.
         """
         data = cls()
-        # Clean text: remove vertical tabs (soft line breaks) and other control characters
         text = paragraph.text.strip()
         # Replace vertical tab (\x0B) with space - this is PowerPoint's soft line break
-        text = text.replace('\x0b', ' ').replace('\u000b', ' ')
-        data.text = text
-        
-        # Extract bullet properties
-        pPr = paragraph._p.get_or_add_pPr()
-        buChar = pPr.find(".//{http://schemas.openxmlformats.org/drawingml/2006/main}buChar")
-        buAutoNum = pPr.find(".//{http://schemas.openxmlformats.org/drawingml/2006/main}buAutoNum")
+        data.text = text.replace('\x0b', ' ')
         
-        if buChar is not None or buAutoNum is not None:
+        if paragraph.bullet:
             data.bullet = True
-            data.level = paragraph.level if paragraph.level else 0
+            data.level = paragraph.level
         
-        # Extract alignment
-        if paragraph.alignment:
-            alignment_map = {
-                PP_ALIGN.LEFT: "LEFT",
-                PP_ALIGN.CENTER: "CENTER",
-                PP_ALIGN.RIGHT: "RIGHT",
-                PP_ALIGN.JUSTIFY: "JUSTIFY",
-            }
-            data.alignment = alignment_map.get(paragraph.alignment)
+        alignment_map = {"l": "LEFT", "ctr": "CENTER", "r": "RIGHT", "just": "JUSTIFY"}
+        data.alignment = alignment_map.get(paragraph.alignment)
         
-        # Extract spacing
         if paragraph.space_before:
-            data.space_before = paragraph.space_before.pt
+            data.space_before = Centipoints(paragraph.space_before).pt
         if paragraph.space_after:
-            data.space_after = paragraph.space_after.pt
-        if paragraph.line_spacing:
-            data.line_spacing = paragraph.line_spacing
+            data.space_after = Centipoints(paragraph.space_after).pt
+        if paragraph.line_spacing_lines:
+            data.line_spacing = paragraph.line_spacing_lines
+        elif paragraph.line_spacing_points:
+            data.line_spacing = Centipoints(paragraph.line_spacing_points)
         
-        # Extract font properties from first run
+        # Font properties from first run
         if paragraph.runs:
             run = paragraph.runs[0]
-            font = run.font
-            
-            if font.size:
-                data.font_size = font.size.pt
-            if font.name:
-                data.font_name = font.name
-            if font.bold is not None:
-                data.bold = font.bold
-            if font.italic is not None:
-                data.italic = font.italic
-            if font.underline is not None:
-                data.underline = font.underline
-                
-            # Extract color (handle different color types safely)
-            try:
-                if font.color.type is not None:
-                    color_type = str(font.color.type)
-                    if "RGB" in color_type and font.color.rgb:
-                        data.color = str(font.color.rgb)
-                    elif font.color.theme_color:
-                        data.theme_color = str(font.color.theme_color).replace("MSO_THEME_COLOR.", "")
-            except AttributeError:
-                # Color might be inherited or undefined
-                pass
+            if run.size:
+                data.font_size = Centipoints(run.size).pt
+            if run.font_name:
+                data.font_name = run.font_name
+            data.bold = run.bold
+            data.italic = run.italic
+            if run.underline == "none":
+                data.underline = False
+            elif run.underline == "sng":
+                data.underline = True
+            elif run.underline is not None:
+                data.underline = MSO_UNDERLINE.from_xml(run.underline)
+            if run.color_rgb:
+                data.color = run.color_rgb
+            elif run.color_scheme:
+                data.theme_color = str(MSO_THEME_COLOR.from_xml(run.color_scheme)).replace("MSO_THEME_COLOR.", "")
         
         return data
     
@@ -257,25 +239,31 @@ def emu_to_inches(emu: int) -> float:
     return emu / EMU_PER_INCH
 
 
-def get_placeholder_type_name(placeholder) -> Optional[str]:
+def get_placeholder_type_name(ph_type: Optional[str]) -> Optional[str]:
     """Get the placeholder type as a string.
     
     Args:
-        placeholder: The placeholder format object.
+        ph_type: The p:ph type attribute (e.g. "title", "body"), or None.
         
     Returns:
         String name of the placeholder type, or None.
     """
-    if placeholder and placeholder.type:
-        return str(placeholder.type).replace("PLACEHOLDER_TYPE.", "")
+    if ph_type:
+        return str(PP_PLACEHOLDER.from_xml(ph_type)).replace("PLACEHOLDER_TYPE.", "")
     return None
 
 
-def extract_shape_text(shape: BaseShape, offset_left: int = 0, offset_top: int = 0) -> Optional[ShapeData]:
+def extract_shape_text(
+    shape: ShapeInfo,
+    position: Tuple[Optional[int], Optional[int], Optional[int], Optional[int]],
+    offset_left: int = 0,
+    offset_top: int = 0
+) -> Optional[ShapeData]:
     """Extract text content from a shape.
     
     Args:
-        shape: The PowerPoint shape object.
+        shape: ShapeInfo from PptxReader.
+        position: (left, top, width, height) in EMUs, inherited for placeholders.
         offset_left: X offset for grouped shapes (in EMUs).
         offset_top: Y offset for grouped shapes (in EMUs).
         
@@ -286,38 +274,34 @@ def extract_shape_text(shape: BaseShape, offset_left: int = 0, offset_top: int =
     if not shape.has_text_frame:
         return None
     
-    text_frame = shape.text_frame
-    
     # Skip empty text frames
-    if not text_frame.text.strip():
+    if not shape.text.strip():
         return None
     
     # Skip slide numbers and footer placeholders
-    if shape.is_placeholder:
-        placeholder = shape.placeholder_format
-        ph_type = str(placeholder.type) if placeholder.type else ""
-        if "SLIDE_NUMBER" in ph_type or "FOOTER" in ph_type or "DATE" in ph_type:
-            return None
+    if shape.is_placeholder and shape.ph_type in ("sldNum", "ftr", "dt"):
+        return None
     
     # Calculate absolute position
-    abs_left = (shape.left or 0) + offset_left
-    abs_top = (shape.top or 0) + offset_top
+    left, top, width, height = position
+    abs_left = (left or 0) + offset_left
+    abs_top = (top or 0) + offset_top
     
     shape_data = ShapeData(
         left=emu_to_inches(abs_left),
         top=emu_to_inches(abs_top),
-        width=emu_to_inches(shape.width or 0),
-        height=emu_to_inches(shape.height or 0),
+        width=emu_to_inches(width or 0),
+        height=emu_to_inches(height or 0),
     )
     
     # Get placeholder type
     if shape.is_placeholder:
-        shape_data.placeholder_type = get_placeholder_type_name(shape.placeholder_format)
+        shape_data.placeholder_type = get_placeholder_type_name(shape.ph_type)
     
     # Extract paragraphs
-    for paragraph in text_frame.paragraphs:
+    for paragraph in shape.paragraphs:
         if paragraph.text.strip():
-            para_data = ParagraphData.from_paragraph(paragraph)
+            para_data = ParagraphData.from_info(paragraph)
             shape_data.paragraphs.append(para_data)
             
             # Track default font size
@@ -327,37 +311,33 @@ def extract_shape_text(shape: BaseShape, offset_left: int = 0, offset_top: int =
     return shape_data if shape_data.paragraphs else None
 
 
-def extract_shapes_recursive(
-    shapes, 
-    offset_left: int = 0, 
-    offset_top: int = 0
-) -> List[Tuple[ShapeData, int, int]]:
-    """Recursively extract text from shapes including group shapes.
+def extract_slide_shapes(reader: PptxReader, slide: SlideInfo) -> List[Tuple[ShapeData, int, int]]:
+    """Extract text from a slide's shapes, including shapes nested in groups.
     
     Args:
-        shapes: Collection of shapes to process.
-        offset_left: X offset for nested shapes (in EMUs).
-        offset_top: Y offset for nested shapes (in EMUs).
+        reader: Open PptxReader the slide came from.
+        slide: Slide yielded by reader.iter_slides().
         
     Returns:
         List of tuples containing (ShapeData, absolute_left, absolute_top).
     """
     results: List[Tuple[ShapeData, int, int]] = []
     
-    for shape in shapes:
-        # Handle group shapes recursively
-        if shape.shape_type == 6:  # MSO_SHAPE_TYPE.GROUP
-            group_left = (shape.left or 0) + offset_left
-            group_top = (shape.top or 0) + offset_top
-            results.extend(extract_shapes_recursive(
-                shape.shapes, group_left, group_top
-            ))
+    # slide.shapes lists group members (with accumulated group offsets) in
+    # document order, followed by the group itself
+    for shape in slide.shapes:
+        if shape.kind == "grpSp" or not shape.has_text_frame:
+            continue
+        if shape.group_depth == 0:
+            position = reader.effective_position(slide, shape)
         else:
-            shape_data = extract_shape_text(shape, offset_left, offset_top)
-            if shape_data:
-                abs_left = (shape.left or 0) + offset_left
-                abs_top = (shape.top or 0) + offset_top
-                results.append((shape_data, abs_left, abs_top))
+            # Grouped placeholders do not inherit positions (python-pptx semantics)
+            position = (shape.left, shape.top, shape.width, shape.height)
+        shape_data = extract_shape_text(shape, position, shape.group_left, shape.group_top)
+        if shape_data:
+            abs_left = (position[0] or 0) + shape.group_left
+            abs_top = (position[1] or 0) + shape.group_top
+            results.append((shape_data, abs_left, abs_top))
     
     return results
 
@@ -420,43 +400,47 @@ def extract_text_inventory(
     Returns:
         Dictionary mapping slide IDs to shape IDs to shape data.
     """
-    prs = Presentation(pptx_path)
     inventory: Dict[str, Dict[str, Dict[str, Any]]] = {}
     
-    for slide_idx, slide in enumerate(prs.slides):
-        slide_key = f"slide-{slide_idx}"
-        
-        # Extract all text shapes from this slide
-        shapes_with_positions = extract_shapes_recursive(slide.shapes)
-        
-        # Detect overlaps
-        detect_overlaps(shapes_with_positions)
-        
-        # Sort by visual position (top to bottom, left to right)
-        shapes_with_positions.sort(key=lambda x: (x[0].top, x[0].left))
-        
-        # Build slide inventory
-        slide_shapes: Dict[str, Dict[str, Any]] = {}
-        
-        for shape_idx, (shape_data, _, _) in enumerate(shapes_with_positions):
-            # Filter by issues if requested
-            if issues_only:
-                has_issues = (
-                    shape_data.overlap is not None or 
-                    shape_data.overflow_bottom is not None
-                )
-                if not has_issues:
-                    continue
-            
-            shape_key = f"shape-{shape_idx}"
-            slide_shapes[shape_key] = shape_data.to_dict()
-        
-        if slide_shapes:
-            inventory[slide_key] = slide_shapes
+    with PptxReader(pptx_path) as reader:
+        for slide in reader.iter_slides(notes=False):
+            slide_shapes = _slide_inventory(reader, slide, issues_only)
+            if slide_shapes:
+                inventory[f"slide-{slide.number - 1}"] = slide_shapes
     
     return inventory
 
 
+def _slide_inventory(reader: PptxReader, slide: SlideInfo, issues_only: bool) -> Dict[str, Dict[str, Any]]:
+    """Build the shape inventory for one streamed slide."""
+    # Extract all text shapes from this slide
+    shapes_with_positions = extract_slide_shapes(reader, slide)
+    
+    # Detect overlaps
+    detect_overlaps(shapes_with_positions)
+    
+    # Sort by visual position (top to bottom, left to right)
+    shapes_with_positions.sort(key=lambda x: (x[0].top, x[0].left))
+    
+    # Build slide inventory
+    slide_shapes: Dict[str, Dict[str, Any]] = {}
+    
+    for shape_idx, (shape_data, _, _) in enumerate(shapes_with_positions):
+        # Filter by issues if requested
+        if issues_only:
+            has_issues = (
+                shape_data.overlap is not None or 
+                shape_data.overflow_bottom is not None
+            )
+            if not has_issues:
+                continue
+        
+        shape_key = f"shape-{shape_idx}"
+        slide_shapes[shape_key] = shape_data.to_dict()
+    
+    return slide_shapes
+
+
 def save_inventory(inventory: Dict[str, Dict[str, Dict[str, Any]]], output_path: Path) -> None:
     """Save inventory data to JSON file.
     
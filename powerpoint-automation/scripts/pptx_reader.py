@@ -0,0 +1,533 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Ag-ppt-create - AI-powered PPTX generation pipeline
+# https://github.com/aktsmm/Ag-ppt-create
+#
+# Copyright (c) aktsmm. Licensed under CC BY-NC-SA 4.0.
+# DO NOT MODIFY THIS HEADER BLOCK.
+# =============================================================================
+"""
+Lightweight read-only PPTX reader (stdlib only, no python-pptx object graph).
+
+Slide, layout, master and notes parts are streamed straight from the zip with
+ElementTree.iterparse. Each shape is turned into a small dataclass when its
+closing tag is reached and its XML subtree is then cleared, so memory stays
+proportional to one shape rather than the whole deck.
+
+Yields per slide: shapes (kind, name, placeholder type/idx, own position,
+text paragraphs with runs and first-run formatting, click hyperlink), notes
+text and relationships. Values are kept in their raw XML form (e.g. placeholder
+type 'ctrTitle', font size in centipoints); callers that need python-pptx
+enums convert them with the enum's from_xml().
+
+Text semantics match python-pptx: paragraph text joins a:r/a:fld text and a:br
+as a vertical tab; shapes are the direct children of p:spTree (groups listed
+after their children, with group_depth > 0 for the children); the title is
+the first top-level placeholder with idx 0; notes text is the first 'body'
+placeholder of the notes slide.
+
+Usage:
+    from pptx_reader import PptxReader
+
+    with PptxReader("deck.pptx") as reader:
+        print(reader.slide_count)
+        for slide in reader.iter_slides():
+            print(slide.number, slide.title, slide.notes)
+"""
+
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def _p(tag: str) -> str:
+    return f"{{{NS_P}}}{tag}"
+
+
+def _a(tag: str) -> str:
+    return f"{{{NS_A}}}{tag}"
+
+
+R_ID = f"{{{NS_R}}}id"
+SP_TREE = _p("spTree")
+GRP_SP = _p("grpSp")
+GRP_SP_PR = _p("grpSpPr")
+C_SLD = _p("cSld")
+SHAPE_TAGS = {_p("sp"), _p("pic"), _p("graphicFrame"), _p("grpSp"), _p("cxnSp"), _p("contentPart")}
+SHAPE_PARENTS = {SP_TREE, GRP_SP}
+
+# Layout placeholder type -> master placeholder type it inherits from (python-pptx rules)
+MASTER_PH_TYPE = {
+    'body': 'body', 'chart': 'body', 'clipArt': 'body', 'ctrTitle': 'title',
+    'dgm': 'body', 'dt': 'dt', 'ftr': 'ftr', 'media': 'body', 'obj': 'body',
+    'pic': 'body', 'sldNum': 'sldNum', 'subTitle': 'body', 'tbl': 'body',
+    'title': 'title',
+}
+
+GRAPHIC_URI_TABLE = "http://schemas.openxmlformats.org/drawingml/2006/table"
+GRAPHIC_URI_CHART = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+GRAPHIC_URI_DIAGRAM = "http://schemas.openxmlformats.org/drawingml/2006/diagram"
+GRAPHIC_URI_OLE = "http://schemas.openxmlformats.org/presentationml/2006/ole"
+
+
+@dataclass
+class Relationship:
+    """One entry of a part's .rels file."""
+
+    rid: str
+    reltype: str  # last segment of the relationship type, e.g. 'slideLayout', 'hyperlink'
+    target: str  # address as python-pptx reports it (URL, or ref relative to the source part)
+    partname: Optional[str] = None  # zip member name of an internal target
+    external: bool = False
+
+
+@dataclass
+class RunInfo:
+    """An a:r text run and its directly applied character properties."""
+
+    text: str = ""
+    size: Optional[int] = None  # centipoints (sz="1800" -> 18pt)
+    font_name: Optional[str] = None
+    bold: Optional[bool] = None
+    italic: Optional[bool] = None
+    underline: Optional[str] = None  # ST_TextUnderlineType, e.g. 'sng', 'none'
+    color_rgb: Optional[str] = None  # 'RRGGBB' from a:solidFill/a:srgbClr
+    color_scheme: Optional[str] = None  # e.g. 'accent1' from a:solidFill/a:schemeClr
+    hyperlink_rid: Optional[str] = None
+
+
+@dataclass
+class ParagraphInfo:
+    """An a:p paragraph: full text plus directly applied paragraph properties."""
+
+    text: str = ""
+    runs: List[RunInfo] = field(default_factory=list)
+    level: int = 0
+    alignment: Optional[str] = None  # ST_TextAlignType, e.g. 'l', 'ctr'
+    bullet: bool = False
+    space_before: Optional[int] = None  # centipoints (a:spcPts only)
+    space_after: Optional[int] = None
+    line_spacing_lines: Optional[float] = None  # a:lnSpc/a:spcPct, 1.0 = single
+    line_spacing_points: Optional[int] = None  # a:lnSpc/a:spcPts, centipoints
+
+
+@dataclass
+class ShapeInfo:
+    """A shape from p:spTree (or a nested group) with its text content."""
+
+    kind: str  # 'sp', 'pic', 'graphicFrame', 'grpSp', 'cxnSp' or 'contentPart'
+    shape_id: Optional[int] = None
+    name: str = ""
+    group_depth: int = 0  # 0 = direct child of p:spTree
+    group_left: int = 0  # summed a:off of enclosing groups (EMU)
+    group_top: int = 0
+    ph_type: Optional[str] = None  # ST_PlaceholderType, 'obj' when omitted
+    ph_idx: Optional[int] = None
+    left: Optional[int] = None  # own a:xfrm, EMU; None when inherited/absent
+    top: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    has_text_frame: bool = False  # True for every p:sp, as in python-pptx
+    paragraphs: List[ParagraphInfo] = field(default_factory=list)
+    click_rid: Optional[str] = None
+    graphic_uri: Optional[str] = None
+    is_media: bool = False
+
+    @property
+    def is_placeholder(self) -> bool:
+        return self.ph_type is not None
+
+    @property
+    def text(self) -> str:
+        """Text frame text: paragraphs joined by newlines."""
+        return "\n".join(p.text for p in self.paragraphs)
+
+
+@dataclass
+class SlideInfo:
+    """One slide in presentation order."""
+
+    number: int  # 1-based
+    partname: str
+    hidden: bool = False
+    layout_partname: Optional[str] = None
+    layout_name: str = ""
+    shapes: List[ShapeInfo] = field(default_factory=list)
+    notes: Optional[str] = None  # None when the slide has no notes slide
+    rels: Dict[str, Relationship] = field(default_factory=dict)
+
+    @property
+    def top_level_shapes(self) -> List[ShapeInfo]:
+        """Shapes python-pptx lists in slide.shapes (direct children of p:spTree)."""
+        return [s for s in self.shapes if s.group_depth == 0]
+
+    @property
+    def title_shape(self) -> Optional[ShapeInfo]:
+        """First top-level placeholder with idx 0 (python-pptx slide.shapes.title)."""
+        for shape in self.top_level_shapes:
+            if shape.ph_idx == 0:
+                return shape
+        return None
+
+    @property
+    def title(self) -> str:
+        shape = self.title_shape
+        return shape.text if shape is not None else ""
+
+    def hyperlinks(self) -> List[str]:
+        """Addresses of top-level shape click actions and text-run hyperlinks."""
+        addresses = []
+        for shape in self.top_level_shapes:
+            rids = [shape.click_rid] + [r.hyperlink_rid for p in shape.paragraphs for r in p.runs]
+            for rid in rids:
+                rel = self.rels.get(rid) if rid else None
+                if rel is not None and rel.target:
+                    addresses.append(rel.target)
+        return addresses
+
+
+def _xml_bool(value: Optional[str]) -> Optional[bool]:
+    if value is None:
+        return None
+    return value in ('1', 'true')
+
+
+def _int(value: Optional[str]) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
+def _percent(value: str) -> float:
+    """ST_TextSpacingPercentOrPercentString: '90000' or '90%' -> 0.9."""
+    if value.endswith('%'):
+        return float(value[:-1]) / 100.0
+    return int(value) / 100000.0
+
+
+def _parse_run(r: ET.Element) -> RunInfo:
+    t = r.find(_a('t'))
+    run = RunInfo(text=(t.text or "") if t is not None else "")
+    rPr = r.find(_a('rPr'))
+    if rPr is None:
+        return run
+    run.size = _int(rPr.get('sz'))
+    run.bold = _xml_bool(rPr.get('b'))
+    run.italic = _xml_bool(rPr.get('i'))
+    run.underline = rPr.get('u')
+    latin = rPr.find(_a('latin'))
+    if latin is not None:
+        run.font_name = latin.get('typeface')
+    fill = rPr.find(_a('solidFill'))
+    if fill is not None:
+        srgb = fill.find(_a('srgbClr'))
+        scheme = fill.find(_a('schemeClr'))
+        if srgb is not None:
+            run.color_rgb = srgb.get('val', '').upper()
+        elif scheme is not None:
+            run.color_scheme = scheme.get('val')
+    link = rPr.find(_a('hlinkClick'))
+    if link is not None:
+        run.hyperlink_rid = link.get(R_ID) or None
+    return run
+
+
+def _parse_paragraph(p: ET.Element) -> ParagraphInfo:
+    para = ParagraphInfo()
+    pieces = []
+    for child in p:
+        if child.tag == _a('r'):
+            run = _parse_run(child)
+            para.runs.append(run)
+            pieces.append(run.text)
+        elif child.tag == _a('br'):
+            pieces.append('\v')
+        elif child.tag == _a('fld'):
+            t = child.find(_a('t'))
+            pieces.append((t.text or "") if t is not None else "")
+    para.text = "".join(pieces)
+
+    pPr = p.find(_a('pPr'))
+    if pPr is None:
+        return para
+    para.level = int(pPr.get('lvl', 0))
+    para.alignment = pPr.get('algn')
+    para.bullet = pPr.find(f".//{_a('buChar')}") is not None or pPr.find(f".//{_a('buAutoNum')}") is not None
+    for attr, tag in (('space_before', 'spcBef'), ('space_after', 'spcAft')):
+        pts = pPr.find(f"{_a(tag)}/{_a('spcPts')}")
+        if pts is not None:
+            setattr(para, attr, _int(pts.get('val')))
+    ln_pct = pPr.find(f"{_a('lnSpc')}/{_a('spcPct')}")
+    ln_pts = pPr.find(f"{_a('lnSpc')}/{_a('spcPts')}")
+    if ln_pct is not None:
+        para.line_spacing_lines = _percent(ln_pct.get('val'))
+    elif ln_pts is not None:
+        para.line_spacing_points = _int(ln_pts.get('val'))
+    return para
+
+
+def _parse_shape(elem: ET.Element, group_depth: int, group_left: int, group_top: int) -> ShapeInfo:
+    shape = ShapeInfo(kind=elem.tag.rsplit('}', 1)[1], group_depth=group_depth,
+                      group_left=group_left, group_top=group_top)
+    nv = elem[0] if len(elem) else None  # p:nvSpPr / p:nvPicPr / ...
+    if nv is not None:
+        c_nv_pr = nv.find(_p('cNvPr'))
+        if c_nv_pr is not None:
+            shape.shape_id = _int(c_nv_pr.get('id'))
+            shape.name = c_nv_pr.get('name', '')
+            link = c_nv_pr.find(_a('hlinkClick'))
+            if link is not None:
+                shape.click_rid = link.get(R_ID) or None
+        nv_pr = nv.find(_p('nvPr'))
+        if nv_pr is not None:
+            ph = nv_pr.find(_p('ph'))
+            if ph is not None:
+                shape.ph_type = ph.get('type', 'obj')
+                shape.ph_idx = int(ph.get('idx', 0))
+            shape.is_media = nv_pr.find(_a('videoFile')) is not None
+
+    if shape.kind == 'graphicFrame':
+        xfrm = elem.find(_p('xfrm'))
+        graphic_data = elem.find(f"{_a('graphic')}/{_a('graphicData')}")
+        if graphic_data is not None:
+            shape.graphic_uri = graphic_data.get('uri')
+    elif shape.kind == 'grpSp':
+        xfrm = elem.find(f"{GRP_SP_PR}/{_a('xfrm')}")
+    else:
+        xfrm = elem.find(f"{_p('spPr')}/{_a('xfrm')}")
+    if xfrm is not None:
+        off = xfrm.find(_a('off'))
+        ext = xfrm.find(_a('ext'))
+        if off is not None:
+            shape.left, shape.top = _int(off.get('x')), _int(off.get('y'))
+        if ext is not None:
+            shape.width, shape.height = _int(ext.get('cx')), _int(ext.get('cy'))
+
+    if shape.kind == 'sp':
+        shape.has_text_frame = True
+        tx_body = elem.find(_p('txBody'))
+        if tx_body is not None:
+            shape.paragraphs = [_parse_paragraph(p) for p in tx_body.findall(_a('p'))]
+    return shape
+
+
+class PptxReader:
+    """Read-only streaming view of a .pptx package."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._zip = zipfile.ZipFile(self.path)
+        self._names = set(self._zip.namelist())
+        self._slide_partnames: Optional[List[str]] = None
+        self._slide_size: Tuple[Optional[int], Optional[int]] = (None, None)
+        self._part_cache: Dict[str, Tuple[str, List[ShapeInfo]]] = {}
+        self._rels_cache: Dict[str, Dict[str, Relationship]] = {}
+
+    def __enter__(self) -> "PptxReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._zip.close()
+
+    # -- package structure --------------------------------------------------
+
+    def read_rels(self, partname: str) -> Dict[str, Relationship]:
+        """Relationships of a part (zip member name, e.g. 'ppt/slides/slide1.xml')."""
+        directory, name = posixpath.split(partname)
+        rels_name = posixpath.join(directory, '_rels', f"{name}.rels")
+        rels: Dict[str, Relationship] = {}
+        if rels_name not in self._names:
+            return rels
+        with self._zip.open(rels_name) as stream:
+            for _, elem in ET.iterparse(stream):
+                if elem.tag != f"{{{NS_PKG_REL}}}Relationship":
+                    continue
+                rid, target = elem.get('Id'), elem.get('Target', '')
+                reltype = elem.get('Type', '').rsplit('/', 1)[-1]
+                if elem.get('TargetMode') == 'External':
+                    rels[rid] = Relationship(rid, reltype, target, external=True)
+                    continue
+                if target.startswith('/'):
+                    member = posixpath.normpath(target.lstrip('/'))
+                else:
+                    member = posixpath.normpath(posixpath.join(directory, target))
+                ref = posixpath.relpath(member, directory or '.')
+                rels[rid] = Relationship(rid, reltype, ref, partname=member)
+        return rels
+
+    def _cached_rels(self, partname: str) -> Dict[str, Relationship]:
+        if partname not in self._rels_cache:
+            self._rels_cache[partname] = self.read_rels(partname)
+        return self._rels_cache[partname]
+
+    def _related(self, partname: str, reltype: str) -> Optional[str]:
+        for rel in self._cached_rels(partname).values():
+            if rel.reltype == reltype and rel.partname:
+                return rel.partname
+        return None
+
+    def _load_presentation(self) -> None:
+        if self._slide_partnames is not None:
+            return
+        rels = self.read_rels('ppt/presentation.xml')
+        partnames = []
+        with self._zip.open('ppt/presentation.xml') as stream:
+            for event, elem in ET.iterparse(stream, events=('start',)):
+                if elem.tag == _p('sldId'):
+                    rel = rels.get(elem.get(R_ID))
+                    if rel is not None and rel.partname:
+                        partnames.append(rel.partname)
+                elif elem.tag == _p('sldSz'):
+                    self._slide_size = (_int(elem.get('cx')), _int(elem.get('cy')))
+                elif elem.tag == _p('notesSz'):
+                    break  # sldIdLst and sldSz precede it
+        self._slide_partnames = partnames
+
+    @property
+    def slide_partnames(self) -> List[str]:
+        self._load_presentation()
+        return list(self._slide_partnames)
+
+    @property
+    def slide_count(self) -> int:
+        """Number of slides, read from presentation.xml only."""
+        self._load_presentation()
+        return len(self._slide_partnames)
+
+    @property
+    def slide_size(self) -> Tuple[Optional[int], Optional[int]]:
+        """(width, height) in EMU, or (None, None) if p:sldSz is absent."""
+        self._load_presentation()
+        return self._slide_size
+
+    # -- parts --------------------------------------------------------------
+
+    def parse_part(self, partname: str) -> Tuple[Dict[str, str], str, List[ShapeInfo]]:
+        """Stream one slide/layout/master/notes part.
+
+        Returns:
+            (root element attributes, p:cSld name, shapes in closing-tag order)
+        """
+        root_attrs: Dict[str, str] = {}
+        csld_name = ""
+        shapes: List[ShapeInfo] = []
+        stack: List[str] = []
+        groups: List[List[int]] = []  # [left, top] of each open p:grpSp
+        with self._zip.open(partname) as stream:
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                tag = elem.tag
+                if event == 'start':
+                    if not stack:
+                        root_attrs = dict(elem.attrib)
+                    elif tag == C_SLD:
+                        csld_name = elem.get('name', '')
+                    if tag == GRP_SP and stack and stack[-1] in SHAPE_PARENTS:
+                        groups.append([0, 0])
+                    stack.append(tag)
+                    continue
+
+                stack.pop()
+                if tag == GRP_SP_PR and stack and stack[-1] == GRP_SP and groups:
+                    off = elem.find(f"{_a('xfrm')}/{_a('off')}")
+                    if off is not None:
+                        groups[-1] = [int(off.get('x', 0)), int(off.get('y', 0))]
+                elif tag in SHAPE_TAGS and stack and stack[-1] in SHAPE_PARENTS:
+                    if tag == GRP_SP and groups:
+                        groups.pop()
+                    shapes.append(_parse_shape(
+                        elem, len(groups),
+                        sum(g[0] for g in groups), sum(g[1] for g in groups)))
+                    elem.clear()
+        return root_attrs, csld_name, shapes
+
+    def _layout_or_master(self, partname: str) -> Tuple[str, List[ShapeInfo]]:
+        if partname not in self._part_cache:
+            _, name, shapes = self.parse_part(partname)
+            self._part_cache[partname] = (name, [s for s in shapes if s.group_depth == 0])
+        return self._part_cache[partname]
+
+    def layout_name(self, layout_partname: Optional[str]) -> str:
+        if not layout_partname:
+            return ""
+        return self._layout_or_master(layout_partname)[0]
+
+    def layout_placeholders(self, layout_partname: Optional[str]) -> List[ShapeInfo]:
+        """Top-level placeholders of a slide layout, in document order."""
+        if not layout_partname:
+            return []
+        return [s for s in self._layout_or_master(layout_partname)[1] if s.is_placeholder]
+
+    def _notes_text(self, notes_partname: str) -> str:
+        _, _, shapes = self.parse_part(notes_partname)
+        for shape in shapes:
+            if shape.group_depth == 0 and shape.ph_type == 'body':
+                return shape.text
+        return ""
+
+    def iter_slides(self, notes: bool = True) -> Iterator[SlideInfo]:
+        """Yield slides in presentation order, one part at a time."""
+        for number, partname in enumerate(self.slide_partnames, 1):
+            rels = self.read_rels(partname)
+            root_attrs, _, shapes = self.parse_part(partname)
+            slide = SlideInfo(
+                number=number,
+                partname=partname,
+                hidden=root_attrs.get('show') in ('0', 'false'),
+                shapes=shapes,
+                rels=rels,
+            )
+            for rel in rels.values():
+                if rel.reltype == 'slideLayout' and slide.layout_partname is None:
+                    slide.layout_partname = rel.partname
+                elif rel.reltype == 'notesSlide' and notes and rel.partname in self._names:
+                    slide.notes = self._notes_text(rel.partname)
+            slide.layout_name = self.layout_name(slide.layout_partname)
+            yield slide
+
+    # -- placeholder inheritance --------------------------------------------
+
+    def effective_position(self, slide: SlideInfo, shape: ShapeInfo) -> Tuple[Optional[int], ...]:
+        """(left, top, width, height) with values a placeholder omits taken from
+        its layout placeholder (same idx), then that one's master placeholder."""
+        values = [shape.left, shape.top, shape.width, shape.height]
+        if None not in values or not shape.is_placeholder or not slide.layout_partname:
+            return tuple(values)
+        layout_ph = next((s for s in self.layout_placeholders(slide.layout_partname)
+                          if s.ph_idx == shape.ph_idx), None)
+        if layout_ph is None:
+            return tuple(values)
+        master_ph = None
+        master = self._related(slide.layout_partname, 'slideMaster')
+        master_type = MASTER_PH_TYPE.get(layout_ph.ph_type)
+        if master and master_type:
+            master_ph = next((s for s in self._layout_or_master(master)[1]
+                              if s.ph_type == master_type), None)
+        layout_values = [layout_ph.left, layout_ph.top, layout_ph.width, layout_ph.height]
+        master_values = ([master_ph.left, master_ph.top, master_ph.width, master_ph.height]
+                         if master_ph is not None else [None] * 4)
+        return tuple(
+            own if own is not None else (lay if lay is not None else mas)
+            for own, lay, mas in zip(values, layout_values, master_values)
+        )
+
+
+def slide_count(path: Union[str, Path]) -> int:
+    """Number of slides, reading only ppt/presentation.xml."""
+    with PptxReader(path) as reader:
+        return reader.slide_count
+
+
+def iter_slides(path: Union[str, Path], notes: bool = True) -> Iterator[SlideInfo]:
+    """Yield SlideInfo for each slide of a PPTX file."""
+    with PptxReader(path) as reader:
+        yield from reader.iter_slides(notes=notes)
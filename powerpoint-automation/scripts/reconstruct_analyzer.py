@@ -47,8 +47,16 @@ from dataclasses import dataclass, field
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-from pptx import Presentation
-from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.shapes import PP_PLACEHOLDER
+
+from pptx_reader import (
+    GRAPHIC_URI_CHART,
+    GRAPHIC_URI_DIAGRAM,
+    GRAPHIC_URI_OLE,
+    GRAPHIC_URI_TABLE,
+    PptxReader,
+    SlideInfo,
+)
 
 
 @dataclass
@@ -71,33 +79,35 @@ class SlideContent:
     notes: str = ""
 
 
-def analyze_slide_layout(slide) -> Tuple[str, List[Dict]]:
+def analyze_slide_layout(reader: PptxReader, slide: SlideInfo) -> Tuple[str, List[Dict]]:
     """Analyze the slide's current layout and extract placeholder info.
     
     Args:
-        slide: PowerPoint slide object.
+        reader: Open PptxReader the slide came from.
+        slide: Slide yielded by reader.iter_slides().
         
     Returns:
         Tuple of (layout_name, list of placeholder info dicts).
     """
-    layout_name = slide.slide_layout.name or "Unknown"
+    layout_name = slide.layout_name or "Unknown"
     placeholders = []
     
-    for shape in slide.slide_layout.placeholders:
-        ph_type = str(shape.placeholder_format.type).replace("PLACEHOLDER_TYPE.", "")
+    for shape in reader.layout_placeholders(slide.layout_partname):
+        ph_type = str(PP_PLACEHOLDER.from_xml(shape.ph_type)).replace("PLACEHOLDER_TYPE.", "")
         placeholders.append({
-            "idx": shape.placeholder_format.idx,
+            "idx": shape.ph_idx,
             "type": ph_type,
         })
     
     return layout_name, placeholders
 
 
-def extract_title_and_body(slide) -> Tuple[str, str, List[str], List[int]]:
+def extract_title_and_body(reader: PptxReader, slide: SlideInfo) -> Tuple[str, str, List[str], List[int]]:
     """Extract title, subtitle, and body items from a slide.
     
     Args:
-        slide: PowerPoint slide object.
+        reader: Open PptxReader the slide came from.
+        slide: Slide yielded by reader.iter_slides().
         
     Returns:
         Tuple of (title, subtitle, body_items, bullet_levels).
@@ -107,17 +117,17 @@ def extract_title_and_body(slide) -> Tuple[str, str, List[str], List[int]]:
     body_items = []
     bullet_levels = []
     
-    for shape in slide.shapes:
+    for shape in slide.top_level_shapes:
         if not shape.has_text_frame:
             continue
         
         # Check if this is a placeholder
         if shape.is_placeholder:
-            ph_type = str(shape.placeholder_format.type)
+            ph_type = str(PP_PLACEHOLDER.from_xml(shape.ph_type))
             
             # Handle title placeholders
             if "TITLE" in ph_type or "CENTER_TITLE" in ph_type:
-                text = shape.text_frame.text.strip()
+                text = shape.text.strip()
                 # Clean soft line breaks
                 text = text.replace('\x0b', ' ').replace('\u000b', ' ')
                 title = text
@@ -125,14 +135,14 @@ def extract_title_and_body(slide) -> Tuple[str, str, List[str], List[int]]:
             
             # Handle subtitle
             if "SUBTITLE" in ph_type:
-                text = shape.text_frame.text.strip()
+                text = shape.text.strip()
                 text = text.replace('\x0b', ' ').replace('\u000b', ' ')
                 subtitle = text
                 continue
             
             # Handle body/content placeholders
             if "BODY" in ph_type or "OBJECT" in ph_type or "CONTENT" in ph_type:
-                for paragraph in shape.text_frame.paragraphs:
+                for paragraph in shape.paragraphs:
                     text = paragraph.text.strip()
                     if text:
                         text = text.replace('\x0b', ' ').replace('\u000b', ' ')
@@ -144,16 +154,17 @@ def extract_title_and_body(slide) -> Tuple[str, str, List[str], List[int]]:
                 continue
         
         # Non-placeholder text shapes - add to body if substantial
-        if shape.text_frame.text.strip():
+        if shape.text.strip():
             # Skip slide numbers, footers, etc. (typically small shapes at bottom)
-            if shape.top and shape.height:
+            _, top, _, height = reader.effective_position(slide, shape)
+            if top and height:
                 # Check if it's in the footer area (bottom 15% of slide)
                 # Standard slide height is ~5.625 inches (16:9) = ~5143500 EMU
                 SLIDE_HEIGHT_EMU = 5143500
-                if shape.top > SLIDE_HEIGHT_EMU * 0.85:
+                if top > SLIDE_HEIGHT_EMU * 0.85:
                     continue
             
-            for paragraph in shape.text_frame.paragraphs:
+            for paragraph in shape.paragraphs:
                 text = paragraph.text.strip()
                 if text and len(text) > 3:  # Skip very short text
                     text = text.replace('\x0b', ' ').replace('\u000b', ' ')
@@ -165,11 +176,11 @@ def extract_title_and_body(slide) -> Tuple[str, str, List[str], List[int]]:
     return title, subtitle, body_items, bullet_levels
 
 
-def count_visual_elements(slide) -> Dict[str, int]:
+def count_visual_elements(slide: SlideInfo) -> Dict[str, int]:
     """Count images, tables, charts, and diagrams in a slide.
     
     Args:
-        slide: PowerPoint slide object.
+        slide: Slide yielded by PptxReader.iter_slides().
         
     Returns:
         Dict with counts for each element type.
@@ -182,40 +193,37 @@ def count_visual_elements(slide) -> Dict[str, int]:
         "shapes": 0,
     }
     
-    def count_recursive(shapes):
-        for shape in shapes:
-            # Group shapes
-            if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
-                counts["diagrams"] += 1
-                # Don't recurse into groups - treat as single diagram
-                continue
-            
-            # Pictures
-            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                counts["images"] += 1
-                continue
-            
-            # Tables
-            if shape.has_table:
-                counts["tables"] += 1
-                continue
-            
-            # Charts
-            if shape.has_chart:
-                counts["charts"] += 1
-                continue
-            
-            # SmartArt / Diagrams
-            if hasattr(shape, 'ole_format') or 'SmartArt' in str(type(shape)):
-                counts["diagrams"] += 1
-                continue
-            
-            # Other shapes (excluding placeholders and text boxes)
-            if not shape.is_placeholder and not shape.has_text_frame:
-                if shape.shape_type not in [MSO_SHAPE_TYPE.TEXT_BOX]:
-                    counts["shapes"] += 1
+    for shape in slide.top_level_shapes:
+        # Group shapes
+        if shape.kind == "grpSp":
+            counts["diagrams"] += 1
+            # Don't recurse into groups - treat as single diagram
+            continue
+        
+        # Pictures (picture placeholders and embedded media are not images)
+        if shape.kind == "pic" and not shape.is_placeholder and not shape.is_media:
+            counts["images"] += 1
+            continue
+        
+        # Tables
+        if shape.graphic_uri == GRAPHIC_URI_TABLE:
+            counts["tables"] += 1
+            continue
+        
+        # Charts
+        if shape.graphic_uri == GRAPHIC_URI_CHART:
+            counts["charts"] += 1
+            continue
+        
+        # SmartArt / Diagrams / OLE objects
+        if shape.graphic_uri in (GRAPHIC_URI_DIAGRAM, GRAPHIC_URI_OLE):
+            counts["diagrams"] += 1
+            continue
+        
+        # Other shapes (excluding placeholders and text boxes)
+        if not shape.is_placeholder and not shape.has_text_frame:
+            counts["shapes"] += 1
     
-    count_recursive(slide.shapes)
     return counts
 
 
@@ -334,20 +342,16 @@ def detect_slide_type(content: SlideContent, layout_name: str) -> str:
     return "content"
 
 
-def extract_slide_notes(slide) -> str:
+def extract_slide_notes(slide: SlideInfo) -> str:
     """Extract speaker notes from a slide.
     
     Args:
-        slide: PowerPoint slide object.
+        slide: Slide yielded by PptxReader.iter_slides().
         
     Returns:
         Notes text or empty string.
     """
-    if slide.has_notes_slide:
-        notes_frame = slide.notes_slide.notes_text_frame
-        if notes_frame:
-            return notes_frame.text.strip()
-    return ""
+    return (slide.notes or "").strip()
 
 
 def analyze_presentation(pptx_path: Path) -> List[SlideContent]:
@@ -359,70 +363,71 @@ def analyze_presentation(pptx_path: Path) -> List[SlideContent]:
     Returns:
         List of SlideContent objects.
     """
-    prs = Presentation(pptx_path)
-    slides_content = []
-    
-    for idx, slide in enumerate(prs.slides):
-        # Get layout info
-        layout_name, placeholders = analyze_slide_layout(slide)
-        
-        # Extract text content
-        title, subtitle, body_items, bullet_levels = extract_title_and_body(slide)
-        
-        # Count visual elements
-        counts = count_visual_elements(slide)
-        
-        # Get notes
-        notes = extract_slide_notes(slide)
-        
-        # Create content object
-        content = SlideContent(
-            slide_index=idx,
-            title=title,
-            subtitle=subtitle,
-            body_items=body_items,
-            bullet_levels=bullet_levels,
-            has_image=counts["images"] > 0,
-            image_count=counts["images"],
-            has_table=counts["tables"] > 0,
-            has_chart=counts["charts"] > 0,
-            has_diagram=counts["diagrams"] > 0,
-            shape_count=sum(counts.values()),
-            layout_name=layout_name,
-            notes=notes,
-        )
-        
-        # Detect text density
-        total_text = len(title) + len(subtitle) + sum(len(item) for item in body_items)
-        if total_text < 50:
-            content.text_density = "low"
-        elif total_text > 300:
-            content.text_density = "high"
-        else:
-            content.text_density = "normal"
-        
-        # Detect slide type
-        content.detected_type = detect_slide_type(content, layout_name)
-        
-        # Check for empty slides (notes only, blank)
-        is_empty, reason = is_empty_slide(content)
-        if is_empty:
-            if reason == "notes_only":
-                print(f"  ⚠️  Slide {idx + 1}: EMPTY - only has speaker notes (no visible content)")
-            elif reason == "blank":
-                print(f"  ⚠️  Slide {idx + 1}: BLANK - no content at all")
-            content.detected_type = "_empty"  # Mark for filtering
-        
-        # If title is empty, try to infer from notes
-        if not content.title and content.notes:
-            inferred = infer_title_from_notes(content.notes)
-            if inferred:
-                content.title = inferred
-                print(f"  Slide {idx + 1}: Inferred title from notes: '{inferred[:40]}...'")
-        
-        slides_content.append(content)
+    with PptxReader(pptx_path) as reader:
+        return [_analyze_slide(reader, slide) for slide in reader.iter_slides()]
+
+
+def _analyze_slide(reader: PptxReader, slide: SlideInfo) -> SlideContent:
+    """Build the SlideContent for one streamed slide."""
+    idx = slide.number - 1
+    # Get layout info
+    layout_name, placeholders = analyze_slide_layout(reader, slide)
+    
+    # Extract text content
+    title, subtitle, body_items, bullet_levels = extract_title_and_body(reader, slide)
+    
+    # Count visual elements
+    counts = count_visual_elements(slide)
+    
+    # Get notes
+    notes = extract_slide_notes(slide)
+    
+    # Create content object
+    content = SlideContent(
+        slide_index=idx,
+        title=title,
+        subtitle=subtitle,
+        body_items=body_items,
+        bullet_levels=bullet_levels,
+        has_image=counts["images"] > 0,
+        image_count=counts["images"],
+        has_table=counts["tables"] > 0,
+        has_chart=counts["charts"] > 0,
+        has_diagram=counts["diagrams"] > 0,
+        shape_count=sum(counts.values()),
+        layout_name=layout_name,
+        notes=notes,
+    )
     
-    return slides_content
+    # Detect text density
+    total_text = len(title) + len(subtitle) + sum(len(item) for item in body_items)
+    if total_text < 50:
+        content.text_density = "low"
+    elif total_text > 300:
+        content.text_density = "high"
+    else:
+        content.text_density = "normal"
+    
+    # Detect slide type
+    content.detected_type = detect_slide_type(content, layout_name)
+    
+    # Check for empty slides (notes only, blank)
+    is_empty, reason = is_empty_slide(content)
+    if is_empty:
+        if reason == "notes_only":
+            print(f"  ⚠️  Slide {idx + 1}: EMPTY - only has speaker notes (no visible content)")
+        elif reason == "blank":
+            print(f"  ⚠️  Slide {idx + 1}: BLANK - no content at all")
+        content.detected_type = "_empty"  # Mark for filtering
+    
+    # If title is empty, try to infer from notes
+    if not content.title and content.notes:
+        inferred = infer_title_from_notes(content.notes)
+        if inferred:
+            content.title = inferred
+            print(f"  Slide {idx + 1}: Inferred title from notes: '{inferred[:40]}...'")
+    
+    return content
 
 
 def generate_content_json(
@@ -12,6 +12,7 @@ Resume workflow from a specific phase after escalation.
 Usage:
     python scripts/resume_workflow.py <base_name> --from <phase>
     python scripts/resume_workflow.py <base_name> --from BUILD --skip-validation
+    python scripts/resume_workflow.py <base_name> --from BUILD --auto-clean
 
 Examples:
     # Resume from TRANSLATE phase
@@ -84,7 +85,8 @@ def find_files(base_name: str) -> dict:
 
 
 def run_phase(phase: str, base_name: str, tracer: WorkflowTracer, 
-              skip_validation: bool = False, template: str = None) -> bool:
+              skip_validation: bool = False, template: str = None,
+              auto_clean: bool = False) -> bool:
     """
     Run a specific phase.
     
@@ -172,6 +174,9 @@ def run_phase(phase: str, base_name: str, tracer: WorkflowTracer,
         # Run create_from_template.py
         cmd = ["python", "scripts/create_from_template.py", 
                template_file, content_ja_file, output_file]
+        if auto_clean:
+            # Served from the template cache after the first build
+            cmd.append("--auto-clean")
         result = subprocess.run(cmd, capture_output=True, text=True)
         
         if result.returncode != 0:
@@ -217,6 +222,8 @@ def main():
     parser.add_argument("--skip-validation", action="store_true",
                        help="Skip REVIEW_JSON phase")
     parser.add_argument("--template", help="Template PPTX file path")
+    parser.add_argument("--auto-clean", action="store_true",
+                       help="Auto-clean template before BUILD (cached per template)")
     
     args = parser.parse_args()
     
@@ -255,7 +262,8 @@ def main():
             continue
         
         skip_val = args.skip_validation and phase == "REVIEW_JSON"
-        success = run_phase(phase, base_name, tracer, skip_val, args.template)
+        success = run_phase(phase, base_name, tracer, skip_val, args.template,
+                            args.auto_clean)
         
         if not success:
             print(f"\n❌ Phase {phase} failed. Check trace for details.")
@@ -20,20 +20,21 @@ Options:
     --summary   Show summary only (slide count, issues detected)
 """
 
-from pptx import Presentation
-from pptx.util import Inches
+from pptx_reader import PptxReader, SlideInfo
 import sys
 import argparse
 import json
 import re
 from pathlib import Path
 
+EMU_PER_INCH = 914400
 
-def extract_slide_content(slide, slide_num: int) -> dict:
+
+def extract_slide_content(slide: SlideInfo, slide_num: int) -> dict:
     """Extract content from a single slide.
     
     Args:
-        slide: python-pptx Slide object
+        slide: pptx_reader SlideInfo
         slide_num: 1-based slide number
         
     Returns:
@@ -48,15 +49,16 @@ def extract_slide_content(slide, slide_num: int) -> dict:
     }
     
     # Extract title
-    if slide.shapes.title and slide.shapes.title.text:
-        content["title"] = slide.shapes.title.text.strip()
+    title_shape = slide.title_shape
+    if slide.title:
+        content["title"] = slide.title.strip()
     else:
         content["issues"].append("no_title")
     
     # Extract body text
-    for shape in slide.shapes:
-        if hasattr(shape, 'text') and shape.text:
-            if shape != slide.shapes.title:
+    for shape in slide.top_level_shapes:
+        if shape.has_text_frame and shape.text:
+            if shape is not title_shape:
                 text = shape.text.strip()
                 if text:
                     # Check if it's just a page number
@@ -69,8 +71,8 @@ def extract_slide_content(slide, slide_num: int) -> dict:
         content["issues"].append("empty_body")
     
     # Extract notes
-    if slide.has_notes_slide:
-        notes_text = slide.notes_slide.notes_text_frame.text.strip()
+    if slide.notes is not None:
+        notes_text = slide.notes.strip()
         if notes_text:
             content["notes"] = notes_text
             # Check if notes is source-only
@@ -94,14 +96,15 @@ def review_pptx(path: str, output_format: str = "text") -> dict:
     Returns:
         Dictionary with review results
     """
-    prs = Presentation(path)
+    reader = PptxReader(path)
+    width, height = reader.slide_size
     
     result = {
         "file": path,
-        "slide_count": len(prs.slides),
+        "slide_count": reader.slide_count,
         "size": {
-            "width": round(prs.slide_width.inches, 2),
-            "height": round(prs.slide_height.inches, 2)
+            "width": round(width / EMU_PER_INCH, 2),
+            "height": round(height / EMU_PER_INCH, 2)
         },
         "slides": [],
         "summary": {
@@ -112,19 +115,21 @@ def review_pptx(path: str, output_format: str = "text") -> dict:
         }
     }
     
-    for i, slide in enumerate(prs.slides):
-        slide_content = extract_slide_content(slide, i + 1)
-        result["slides"].append(slide_content)
-        
-        # Update summary
-        if "empty_body" in slide_content["issues"]:
-            result["summary"]["empty_slides"] += 1
-        if "no_notes" in slide_content["issues"] or "empty_notes" in slide_content["issues"]:
-            result["summary"]["missing_notes"] += 1
-        if "source_only_notes" in slide_content["issues"]:
-            result["summary"]["source_only_notes"] += 1
-        if "page_number_only" in slide_content["issues"]:
-            result["summary"]["page_number_only"] += 1
+    # Slides are streamed straight from the zip; only one is held at a time
+    with reader:
+        for slide in reader.iter_slides():
+            slide_content = extract_slide_content(slide, slide.number)
+            result["slides"].append(slide_content)
+            
+            # Update summary
+            if "empty_body" in slide_content["issues"]:
+                result["summary"]["empty_slides"] += 1
+            if "no_notes" in slide_content["issues"] or "empty_notes" in slide_content["issues"]:
+                result["summary"]["missing_notes"] += 1
+            if "source_only_notes" in slide_content["issues"]:
+                result["summary"]["source_only_notes"] += 1
+            if "page_number_only" in slide_content["issues"]:
+                result["summary"]["page_number_only"] += 1
     
     return result
 
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Ag-ppt-create - AI-powered PPTX generation pipeline
+# https://github.com/aktsmm/Ag-ppt-create
+#
+# Copyright (c) aktsmm. Licensed under CC BY-NC-SA 4.0.
+# DO NOT MODIFY THIS HEADER BLOCK.
+# =============================================================================
+"""
+Content-addressed cache of diagnosed, cleaned and analyzed templates.
+
+Entries live in output_manifest/template_cache/<sha256>-v<CLEANER_VERSION>/:
+    diagnosis.json       diagnose_template report of the template
+    layouts.json         analyze_template result for the template itself
+    clean.pptx           auto-cleaned template (only when diagnosis found issues)
+    clean_layouts.json   analyze_template result for clean.pptx
+
+Each artifact is built on first use from a single loaded Presentation and
+reused on every later build of a byte-identical template. Renaming or copying
+a template keeps its entry; editing it (or bumping CLEANER_VERSION) misses.
+
+Usage:
+    python scripts/template_cache.py <template.pptx>          # Warm the cache
+    python scripts/template_cache.py <template.pptx> --json   # Print entry paths
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from pptx import Presentation
+
+from analyze_template import analyze_presentation
+from create_clean_template import CLEANER_VERSION, clean_presentation
+from diagnose_template import diagnose_presentation
+
+
+CACHE_DIR = Path("output_manifest/template_cache")
+
+
+def template_digest(template_path: str) -> str:
+    """Return the SHA-256 hex digest of a template file."""
+    digest = hashlib.sha256()
+    with open(template_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def entry_dir(template_path: str, cache_dir: Path = CACHE_DIR) -> Path:
+    """Return the cache directory for a template (not created)."""
+    return Path(cache_dir) / f"{template_digest(template_path)}-v{CLEANER_VERSION}"
+
+
+def _write_atomic(path: Path, write: Callable[[str], None]) -> None:
+    """Write via a temp file in the same directory, then rename into place.
+
+    Concurrent builds of the same template race harmlessly: readers only ever
+    see complete files, and the last writer wins with identical content.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=path.suffix)
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _load_json(path: Path) -> Optional[dict]:
+    """Load a cached JSON artifact, treating unreadable files as a miss."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_json(path: Path, data: dict) -> None:
+    def write(tmp: str) -> None:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    _write_atomic(path, write)
+
+
+class _Loader:
+    """Parse the template at most once, and only if some artifact is missing."""
+
+    def __init__(self, template_path: str):
+        self.template_path = template_path
+        self._prs = None
+
+    def __call__(self):
+        if self._prs is None:
+            self._prs = Presentation(self.template_path)
+        return self._prs
+
+    @property
+    def loaded(self) -> bool:
+        return self._prs is not None
+
+
+def get_diagnosis(template_path: str, cache_dir: Path = CACHE_DIR) -> dict:
+    """Return the diagnose_template report, computing and caching it on a miss."""
+    return _diagnosis(entry_dir(template_path, cache_dir), _Loader(template_path))
+
+
+def _diagnosis(entry: Path, load: _Loader) -> dict:
+    path = entry / 'diagnosis.json'
+    report = _load_json(path)
+    if report is None:
+        report = diagnose_presentation(load(), load.template_path)
+        _save_json(path, report)
+    report['summary']['template'] = Path(load.template_path).name
+    return report
+
+
+def get_analysis(template_path: str, cache_dir: Path = CACHE_DIR) -> dict:
+    """Return the analyze_template result, computing and caching it on a miss."""
+    path = entry_dir(template_path, cache_dir) / 'layouts.json'
+    analysis = _load_json(path)
+    if analysis is None:
+        analysis = analyze_presentation(Presentation(template_path), template_path)
+        _save_json(path, analysis)
+    # The entry may have been built from a renamed copy of the same bytes
+    analysis['template'] = Path(template_path).name
+    analysis['template_path'] = str(template_path)
+    return analysis
+
+
+def get_clean_template(template_path: str, cache_dir: Path = CACHE_DIR) -> Dict[str, Any]:
+    """
+    Return the template to build from, auto-cleaning it on a cache miss.
+
+    Args:
+        template_path: Path to original template
+        cache_dir: Cache root directory
+
+    Returns:
+        dict with 'template' (clean.pptx, or the original if it was already
+        clean), 'config' (layout JSON for the clean template, or None),
+        'diagnosis' and 'cached' (True when no template work was done)
+    """
+    entry = entry_dir(template_path, cache_dir)
+    load = _Loader(template_path)
+    diagnosis = _diagnosis(entry, load)
+
+    if diagnosis['clean']:
+        return {
+            'template': template_path,
+            'config': None,
+            'diagnosis': diagnosis,
+            'cached': not load.loaded,
+        }
+
+    clean_path = entry / 'clean.pptx'
+    config_path = entry / 'clean_layouts.json'
+    if not (clean_path.exists() and config_path.exists()):
+        # clean_presentation mutates the loaded Presentation; the diagnosis
+        # above has already been taken from it
+        prs = load()
+        clean_presentation(
+            prs,
+            remove_backgrounds=False,
+            remove_decorations=True,
+            fix_positions=True,
+            fix_contrast=True,
+        )
+        _write_atomic(clean_path, prs.save)
+        _save_json(config_path, analyze_presentation(prs, str(clean_path)))
+
+    return {
+        'template': str(clean_path),
+        'config': str(config_path),
+        'diagnosis': diagnosis,
+        'cached': not load.loaded,
+    }
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Warm the template cache for a PPTX template')
+    parser.add_argument('template', help='Path to template PPTX file')
+    parser.add_argument('--json', action='store_true', help='Output entry as JSON (for scripting)')
+
+    args = parser.parse_args()
+
+    if not Path(args.template).exists():
+        print(f"Error: File not found: {args.template}")
+        sys.exit(1)
+
+    entry = get_clean_template(args.template)
+    get_analysis(args.template)
+    cache_path = entry_dir(args.template)
+
+    if args.json:
+        print(json.dumps({
+            'entry': str(cache_path),
+            'template': entry['template'],
+            'config': entry['config'],
+            'clean': entry['diagnosis']['clean'],
+            'cached': entry['cached'],
+        }))
+    else:
+        state = "hit" if entry['cached'] else "built"
+        print(f"[+] Template cache {state}: {cache_path}")
+        print(f"    Template: {entry['template']}")
+        if entry['config']:
+            print(f"    Config:   {entry['config']}")
+
+
+if __name__ == "__main__":
+    main()
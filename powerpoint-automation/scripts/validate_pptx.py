@@ -123,14 +123,19 @@ def load_content_json(content_path: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def count_pptx_slides(pptx_path: str) -> int:
-    """Count slides in PPTX file."""
-    prs = Presentation(pptx_path)
-    return len(prs.slides)
+# Markers written into speaker notes by create_from_template.py / pptx-signature.js
+SIGNATURE_MARKERS = ("Generated by:", "created using")
 
 
-def get_slide_info(pptx_path: str) -> List[Dict[str, Any]]:
-    """Get detailed info about each slide in PPTX."""
+def inspect_pptx(pptx_path: str) -> Dict[str, Any]:
+    """
+    Parse PPTX once and collect everything the validators need.
+    
+    Returns:
+        dict with 'slide_count' and 'slides'; each slide holds notes, image,
+        title and shape-count fields plus 'text_frames' (per shape:
+        'paragraphs' texts and 'char_count') and 'has_signature'
+    """
     prs = Presentation(pptx_path)
     slides_info = []
     
@@ -144,7 +149,9 @@ def get_slide_info(pptx_path: str) -> List[Dict[str, Any]]:
             "image_count": 0,
             "has_title": False,
             "title_text": "",
-            "shape_count": len(slide.shapes)
+            "shape_count": len(slide.shapes),
+            "text_frames": [],
+            "has_signature": False
         }
         
         # Check for notes
@@ -154,6 +161,7 @@ def get_slide_info(pptx_path: str) -> List[Dict[str, Any]]:
                 info["has_notes"] = True
                 info["notes_length"] = len(notes_text)
                 info["notes_text"] = notes_text  # Store for quality analysis
+                info["has_signature"] = any(m in notes_text for m in SIGNATURE_MARKERS)
         
         # Check shapes
         for shape in slide.shapes:
@@ -162,22 +170,34 @@ def get_slide_info(pptx_path: str) -> List[Dict[str, Any]]:
                 info["has_images"] = True
                 info["image_count"] += 1
             
+            if not shape.has_text_frame:
+                continue
+            
+            # Text frames (TextFrame.text is the paragraphs joined by newlines)
+            paragraphs = [para.text for para in shape.text_frame.paragraphs]
+            info["text_frames"].append({
+                "paragraphs": paragraphs,
+                "char_count": sum(len(p) for p in paragraphs) + max(len(paragraphs) - 1, 0)
+            })
+            
             # Check for title
-            if shape.has_text_frame:
-                if hasattr(shape, 'is_placeholder') and shape.is_placeholder:
-                    ph_type = shape.placeholder_format.type
-                    if str(ph_type) in ['TITLE (1)', 'CENTER_TITLE (3)']:
-                        info["has_title"] = True
-                        info["title_text"] = shape.text_frame.text[:50]
+            if shape.is_placeholder:
+                ph_type = shape.placeholder_format.type
+                if str(ph_type) in ['TITLE (1)', 'CENTER_TITLE (3)']:
+                    info["has_title"] = True
+                    info["title_text"] = "\n".join(paragraphs)[:50]
         
         slides_info.append(info)
     
-    return slides_info
+    return {
+        "slide_count": len(slides_info),
+        "slides": slides_info
+    }
 
 
-def validate_slide_count(result: ValidationResult, pptx_path: str, content: Dict[str, Any]):
+def validate_slide_count(result: ValidationResult, inspection: Dict[str, Any], content: Dict[str, Any]):
     """Validate that PPTX slide count matches content.json."""
-    pptx_count = count_pptx_slides(pptx_path)
+    pptx_count = inspection["slide_count"]
     
     # Count non-skipped slides in content.json
     slides = content.get("slides", [])
@@ -329,7 +349,7 @@ def validate_images(result: ValidationResult, slides_info: List[Dict[str, Any]],
     )
 
 
-def validate_text_overflow(result: ValidationResult, pptx_path: str):
+def validate_text_overflow(result: ValidationResult, slides_info: List[Dict[str, Any]]):
     """
     Check for text overflow issues in PPTX.
     
@@ -338,34 +358,23 @@ def validate_text_overflow(result: ValidationResult, pptx_path: str):
     - Too many paragraphs in a single shape (>15)
     - Very long lines that may cause horizontal overflow
     """
-    try:
-        prs = Presentation(pptx_path)
-    except Exception:
-        return  # Already handled in main validation
-    
     overflow_slides = []
     long_text_slides = []
     
-    for slide_idx, slide in enumerate(prs.slides, 1):
-        for shape in slide.shapes:
-            if not hasattr(shape, "text_frame") or not shape.has_text_frame:
-                continue
-            
-            text_frame = shape.text_frame
-            text_content = text_frame.text
-            
+    for slide_info in slides_info:
+        slide_idx = slide_info["slide_number"]
+        for text_frame in slide_info["text_frames"]:
             # Check for very long text (potential overflow)
-            if len(text_content) > 800:
+            if text_frame["char_count"] > 800:
                 long_text_slides.append(slide_idx)
             
             # Check paragraph count
-            para_count = len(text_frame.paragraphs)
+            para_count = len(text_frame["paragraphs"])
             if para_count > 15:
                 overflow_slides.append(slide_idx)
             
             # Check for very long single lines (may cause horizontal overflow)
-            for para in text_frame.paragraphs:
-                line_text = para.text
+            for line_text in text_frame["paragraphs"]:
                 if len(line_text) > 120:
                     if slide_idx not in overflow_slides:
                         overflow_slides.append(slide_idx)
@@ -403,7 +412,7 @@ def validate_signature(result: ValidationResult, slides_info: List[Dict[str, Any
     first_slide = slides_info[0]
     last_slide = slides_info[-1]
     
-    has_signature = first_slide["has_notes"] or last_slide["has_notes"]
+    has_signature = first_slide["has_signature"] or last_slide["has_signature"]
     
     if has_signature:
         result.add_info(
@@ -445,9 +454,9 @@ def validate_pptx(pptx_path: str, content_path: str = None) -> ValidationResult:
         )
         return result
     
-    # Get slide info
+    # Parse once; every validator below reads this inspection model
     try:
-        slides_info = get_slide_info(pptx_path)
+        inspection = inspect_pptx(pptx_path)
     except Exception as e:
         result.add_error(
             "pptx_parse_error",
@@ -457,6 +466,7 @@ def validate_pptx(pptx_path: str, content_path: str = None) -> ValidationResult:
         )
         return result
     
+    slides_info = inspection["slides"]
     result.add_info(
         "pptx_loaded",
         pptx_path,
@@ -467,12 +477,12 @@ def validate_pptx(pptx_path: str, content_path: str = None) -> ValidationResult:
     if content_path:
         content = load_content_json(content_path)
         if content:
-            validate_slide_count(result, pptx_path, content)
+            validate_slide_count(result, inspection, content)
             validate_notes(result, slides_info, content)
             validate_images(result, slides_info, content)
     
     # Always check text overflow
-    validate_text_overflow(result, pptx_path)
+    validate_text_overflow(result, slides_info)
     
     # Always check signature
     validate_signature(result, slides_info)
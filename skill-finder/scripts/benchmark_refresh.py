@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of the Skill Finder refresh pipeline (--update).
+
+Features:
+- Synthetic GitHub fixtures (commit head, recursive tree, SKILL.md blobs)
+  for N sources x M skills, replayed through the replay transport
+- Fixed per-request latency to model network round trips
+- Compares serial vs parallel full refresh, then an incremental rerun
+  (every source answers 304)
+- Never touches the network or the real skill-index.json
+
+Usage:
+    python scripts/benchmark_refresh.py
+    python scripts/benchmark_refresh.py --sources 20 --skills 30 --latency 80
+
+Author: yamapan (https://github.com/aktsmm)
+License: MIT
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+import search_skills as sf
+from github_api import LATENCY_ENV, RAW_ACCEPT, GitHubResponse, configure_client, write_fixture
+
+
+def put_fixture(fixture_dir: Path, endpoint: str, body, params: Dict[str, str] = None,
+                headers: Dict[str, str] = None, status: int = 200,
+                resp_headers: Dict[str, str] = None) -> None:
+    """Write one synthetic response fixture."""
+    text = body if isinstance(body, str) else json.dumps(body)
+    response = GitHubResponse(0 if 200 <= status < 300 else 1, text, "", status, resp_headers or {})
+    write_fixture(fixture_dir, endpoint, params or {}, headers or {}, response)
+
+
+def build_fixtures(fixture_dir: Path, sources: int, skills: int) -> Dict:
+    """Write fixtures for ``sources`` repos with ``skills`` SKILL.md each.
+
+    Returns a skill-index.json dict listing the sources (and no skills).
+    """
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    index = {"version": "1.0", "lastUpdated": "", "sources": [], "categories": [], "skills": []}
+    for i in range(sources):
+        repo = f"bench/repo-{i}"
+        etag = f'"etag-{i}"'
+        head = {"sha": f"commit-{i}", "commit": {"tree": {"sha": f"tree-{i}"}}}
+        put_fixture(fixture_dir, f"repos/{repo}/commits/HEAD", head, resp_headers={"etag": etag})
+        put_fixture(fixture_dir, f"repos/{repo}/commits/HEAD", "", headers={"If-None-Match": etag},
+                    status=304, resp_headers={"etag": etag})
+        tree = [{"path": f"skills/skill-{i}-{j}/SKILL.md", "type": "blob", "sha": f"blob-{i}-{j}"}
+                for j in range(skills)]
+        put_fixture(fixture_dir, f"repos/{repo}/git/trees/tree-{i}", {"tree": tree, "truncated": False},
+                    params={"recursive": "1"})
+        for j in range(skills):
+            content = f"---\nname: skill-{i}-{j}\ndescription: Synthetic skill {j} of repo {i}\n---\n"
+            put_fixture(fixture_dir, f"repos/{repo}/git/blobs/blob-{i}-{j}", content,
+                        headers={"Accept": RAW_ACCEPT})
+        index["sources"].append({"id": f"repo-{i}", "name": repo, "url": f"https://github.com/{repo}",
+                                 "type": "community"})
+    return index
+
+
+@contextlib.contextmanager
+def isolated_index(work_dir: Path, index: Dict):
+    """Point search_skills at a throwaway skill-index.json (and sidecars)."""
+    names = ("INDEX_PATH", "INDEX_CACHE_PATH", "SEARCH_INDEX_PATH", "SIMILARITY_PATH")
+    saved = {name: getattr(sf, name) for name in names}
+    sf.INDEX_PATH = work_dir / "skill-index.json"
+    sf.INDEX_CACHE_PATH = work_dir / ".skill-index.cache.sqlite"
+    sf.SEARCH_INDEX_PATH = work_dir / ".skill-index.search.bin"
+    sf.SIMILARITY_PATH = work_dir / ".skill-index.similar.bin"
+    with open(sf.INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    try:
+        yield sf.INDEX_PATH
+    finally:
+        for name, value in saved.items():
+            setattr(sf, name, value)
+
+
+def timed_update(fixture_dir: Path, workers: int, latency_ms: float) -> Dict:
+    """Run update_all_sources() against the fixtures; return timing and request count."""
+    os.environ[LATENCY_ENV] = str(latency_ms)
+    client = configure_client(f"replay:{fixture_dir}")
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        sf.update_all_sources(workers)
+    return {
+        "seconds": time.perf_counter() - started,
+        "requests": client.request_count,
+        "misses": len(client.transport.misses),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the skill-finder refresh pipeline offline")
+    parser.add_argument("--sources", type=int, default=12, help="Synthetic source repos (default: 12)")
+    parser.add_argument("--skills", type=int, default=20, help="SKILL.md per repo (default: 20)")
+    parser.add_argument("--latency", type=float, default=50, help="Per-request latency in ms (default: 50)")
+    parser.add_argument("--workers", type=int, default=sf.REFRESH_WORKERS,
+                        help=f"Parallel sources (default: {sf.REFRESH_WORKERS})")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        fixture_dir = work_dir / "fixtures"
+        index = build_fixtures(fixture_dir, args.sources, args.skills)
+        print(f"📦 {args.sources} sources x {args.skills} skills, {args.latency:.0f} ms per request")
+
+        runs = []
+        for label, workers in (("serial full", 1), (f"parallel full ({args.workers})", args.workers)):
+            with isolated_index(work_dir, index):
+                runs.append((label, timed_update(fixture_dir, workers, args.latency)))
+                if label.startswith("parallel"):
+                    runs.append(("incremental rerun", timed_update(fixture_dir, args.workers, args.latency)))
+
+        for label, result in runs:
+            print(f"  {label:<24} {result['seconds']:7.2f}s  {result['requests']:5d} requests"
+                  f"  {result['misses']} fixture misses")
+        serial, parallel = runs[0][1]["seconds"], runs[1][1]["seconds"]
+        print(f"\n⚡ Parallel speedup: {serial / max(parallel, 1e-9):.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Shared SKILL.md description backfill job for Skill Finder.
+
+Used by update_other_descriptions.py and update_scientific_descriptions.py.
+
+Features:
+- Bounded concurrency (GitHub client host cap + worker pool)
+- Checkpoint file (JSON lines), so an interrupted run resumes where it stopped
+- Identical blobs / files are fetched once, even when several skills share them
+- skill-index.json is written once at the end, atomically
+
+Author: yamapan (https://github.com/aktsmm)
+License: MIT
+"""
+
+import json
+import os
+import re
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from github_api import get_client
+
+SCRIPT_DIR = Path(__file__).parent
+INDEX_PATH = SCRIPT_DIR / ".." / "references" / "skill-index.json"
+CHECKPOINT_DIR = SCRIPT_DIR / ".." / "references"
+
+# Configuration
+DEFAULT_WORKERS = 8
+MAX_DESCRIPTION_LENGTH = 100
+
+
+def truncate(desc: str) -> str:
+    """Clamp a description to MAX_DESCRIPTION_LENGTH characters."""
+    if len(desc) > MAX_DESCRIPTION_LENGTH:
+        return desc[:MAX_DESCRIPTION_LENGTH - 3] + "..."
+    return desc
+
+
+def extract_description(content: str) -> Optional[str]:
+    """Extract the frontmatter description from SKILL.md content."""
+    match = re.search(r'^description:\s*["\']?(.+?)["\']?\s*$', content, re.MULTILINE)
+    if not match:
+        return None
+    return truncate(match.group(1).strip().rstrip('"\''))
+
+
+def needs_description(skill: Dict) -> bool:
+    """True if the skill still has no description or the "<name> skill" placeholder."""
+    current = skill.get("description", "")
+    return not current or current.endswith(" skill")
+
+
+def checkpoint_path(job_name: str) -> Path:
+    return CHECKPOINT_DIR / f".skill-index.backfill-{job_name}.jsonl"
+
+
+def load_checkpoint(path: Path) -> Dict[str, Optional[str]]:
+    """Return {skill key: description or None} from a checkpoint file."""
+    done: Dict[str, Optional[str]] = {}
+    if not path.exists():
+        return done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn last line from an interrupted write
+            done[entry["key"]] = entry.get("description")
+    return done
+
+
+class FetchFailed(Exception):
+    """No endpoint answered definitively (timeout, rate limit, server error)."""
+
+
+def fetch_description(task: Dict, parse: Callable[[str], Optional[str]]) -> Optional[str]:
+    """Fetch one task's content (blob SHA first, then each path) and parse it.
+
+    Returns None only when every endpoint answered 404 or the content has no
+    description; raises FetchFailed when an answer may change on retry.
+    """
+    client = get_client()
+    endpoints = []
+    if task.get("blobSha"):
+        endpoints.append(f"repos/{task['repo']}/git/blobs/{task['blobSha']}")
+    endpoints += [f"repos/{task['repo']}/contents/{path}" for path in task["paths"]]
+    transient = None
+    for endpoint in endpoints:
+        try:
+            result = client.get_raw(endpoint, timeout=30)
+        except subprocess.TimeoutExpired:
+            transient = "timeout"
+            continue
+        if result.ok:
+            return parse(result.stdout)
+        if result.status != 404:
+            transient = f"HTTP {result.status or 'error'}"
+    if transient:
+        raise FetchFailed(transient)
+    return None
+
+
+def write_index_atomic(index: Dict, path: Optional[Path] = None) -> None:
+    """Write skill-index.json via a temp file so readers never see a partial file.
+
+    Bumps ``lastUpdated`` like search_skills.save_index().
+    """
+    path = path or INDEX_PATH
+    index["lastUpdated"] = date.today().isoformat()
+    tmp_path = Path(f"{path}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def run_backfill(job_name: str,
+                 select: Callable[[Dict], List[Dict]],
+                 apply: Callable[[Dict, str], None],
+                 parse: Callable[[str], Optional[str]] = extract_description,
+                 workers: int = DEFAULT_WORKERS,
+                 restart: bool = False) -> None:
+    """Run a description backfill.
+
+    ``select(index)`` returns tasks: {"key", "skill", "repo", "paths", "blobSha"?}
+    where ``skill`` is the index entry to update and ``paths`` are files to try
+    in order. ``apply(skill, description)`` stores a fetched description.
+    """
+    with open(INDEX_PATH, "r", encoding="utf-8") as f:
+        index = json.load(f)
+
+    ckpt_path = checkpoint_path(job_name)
+    if restart and ckpt_path.exists():
+        ckpt_path.unlink()
+    done = load_checkpoint(ckpt_path)
+
+    tasks = select(index)
+    pending = [t for t in tasks if t["key"] not in done]
+    if done:
+        print(f"↩️ Resuming: {len(tasks) - len(pending)} of {len(tasks)} already fetched")
+
+    # Dedupe: one fetch per blob SHA / (repo, paths)
+    groups: Dict[tuple, List[Dict]] = {}
+    for task in pending:
+        ident = ("blob", task["blobSha"]) if task.get("blobSha") else ("path", task["repo"], tuple(task["paths"]))
+        groups.setdefault(ident, []).append(task)
+    if len(groups) < len(pending):
+        print(f"🧬 {len(pending)} skills share {len(groups)} unique files")
+
+    failed = 0
+    with open(ckpt_path, "a", encoding="utf-8") as ckpt:
+        def record(group: List[Dict], desc: Optional[str]) -> None:
+            for task in group:
+                done[task["key"]] = desc
+                ckpt.write(json.dumps({"key": task["key"], "description": desc}, ensure_ascii=False) + "\n")
+            ckpt.flush()
+
+        pool = ThreadPoolExecutor(max_workers=max(1, workers))
+        futures = {pool.submit(fetch_description, group[0], parse): group for group in groups.values()}
+        try:
+            for n, future in enumerate(as_completed(futures), 1):
+                group = futures.pop(future)
+                try:
+                    desc = future.result()
+                except Exception as e:
+                    failed += 1
+                    print(f"  ⚠️ {group[0]['key']}: {e}")
+                    continue  # Not checkpointed: retried on the next run
+                record(group, desc)
+                status = f"OK: {desc[:60]}..." if desc else "SKIP"
+                print(f"[{n}/{len(groups)}] {group[0]['key']}: {status}")
+        except KeyboardInterrupt:
+            # Drop queued fetches; keep whatever already finished
+            pool.shutdown(wait=False, cancel_futures=True)
+            for future, group in futures.items():
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    record(group, future.result())
+            fetched = sum(1 for task in tasks if task["key"] in done)
+            print(f"\n⏸️ Interrupted: {fetched} of {len(tasks)} checkpointed, run again to resume")
+            raise SystemExit(130)
+        pool.shutdown()
+
+    updated = 0
+    for task in tasks:
+        desc = done.get(task["key"])
+        if desc:
+            apply(task["skill"], desc)
+            updated += 1
+
+    write_index_atomic(index)
+    if failed:
+        print(f"\n⚠️ {failed} fetches failed; run again to retry them")
+    else:
+        ckpt_path.unlink()
+    print(f"\nUpdated {updated} skills ({len(tasks) - updated} without description)")
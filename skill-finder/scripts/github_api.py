@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Rate-limit-aware GitHub API client for Skill Finder.
+
+Features:
+- Pluggable transports behind one client:
+  - gh:     `gh api` subprocess per request (original behavior)
+  - http:   in-process HTTPS with keep-alive (no process fork per request)
+  - record: any live transport, saving every response as a JSON fixture
+  - replay: serve recorded fixtures only (offline, deterministic)
+- Per-host concurrency cap shared by all worker threads
+- Reads rate-limit headers and backs off until reset
+
+Select the transport with --transport or SKILL_FINDER_TRANSPORT
+(auto | gh | http | record:DIR | replay:DIR). "auto" uses http when a
+token is available (GH_TOKEN / GITHUB_TOKEN / `gh auth token`), else gh;
+with neither it warns and falls back to unauthenticated http.
+SKILL_FINDER_FIXTURE_LATENCY (ms) adds a fixed delay per replayed request
+for throughput benchmarks.
+
+Author: yamapan (https://github.com/aktsmm)
+License: MIT
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlencode, urlsplit
+
+API_HOST = "api.github.com"
+RAW_ACCEPT = "application/vnd.github.raw"
+
+# Configuration
+DEFAULT_HOST_CONCURRENCY = 6  # Concurrent requests per host
+MAX_REDIRECTS = 5             # Renamed / transferred repos answer 301 (gh follows them too)
+MAX_RETRIES = 3               # Retries after a rate-limit response
+MAX_RATE_LIMIT_WAIT = 90      # Never sleep longer than this (seconds)
+TRANSPORT_ENV = "SKILL_FINDER_TRANSPORT"
+LATENCY_ENV = "SKILL_FINDER_FIXTURE_LATENCY"
+
+
+class GitHubTimeout(subprocess.TimeoutExpired):
+    """Request timed out (subclass so existing TimeoutExpired handlers apply)."""
+
+
+class GitHubResponse:
+    """Result of one API request."""
+
+    def __init__(self, returncode: int, stdout: str, stderr: str = "",
+                 status: int = 0, headers: Optional[Dict[str, str]] = None):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.status = status
+        self.headers = headers or {}
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+    def json(self):
+        return json.loads(self.stdout)
+
+
+def parse_included_response(raw: str) -> tuple:
+    """Split `gh api --include` output into (status, headers, body)."""
+    if not raw.startswith("HTTP/"):
+        return 0, {}, raw
+    for sep in ("\r\n\r\n", "\n\n"):
+        head, found, body = raw.partition(sep)
+        if found:
+            break
+    else:
+        head, body = raw, ""
+    lines = head.splitlines()
+    status = 0
+    parts = lines[0].split()
+    if len(parts) >= 2 and parts[1].isdigit():
+        status = int(parts[1])
+    headers = {}
+    for line in lines[1:]:
+        key, _, value = line.partition(":")
+        headers[key.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+# =============================================================================
+# Transports
+# =============================================================================
+
+class GhCliTransport:
+    """Runs `gh api --include` once per request."""
+
+    name = "gh"
+
+    def request(self, endpoint: str, params: Dict[str, str], headers: Dict[str, str],
+                timeout: float) -> GitHubResponse:
+        cmd = ["gh", "api", "--include", "-X", "GET", endpoint]
+        for key, value in params.items():
+            cmd += ["-f", f"{key}={value}"]
+        for key, value in headers.items():
+            cmd += ["-H", f"{key}: {value}"]
+        result = subprocess.run(cmd, capture_output=True, timeout=timeout,
+                                encoding="utf-8", errors="replace")
+        status, resp_headers, body = parse_included_response(result.stdout or "")
+        return GitHubResponse(result.returncode, body, result.stderr or "", status, resp_headers)
+
+
+class HttpTransport:
+    """In-process HTTPS client with one keep-alive connection per thread."""
+
+    name = "http"
+
+    def __init__(self, token: Optional[str] = None, host: str = API_HOST):
+        self.token = token
+        self.host = host
+        self._local = threading.local()
+
+    def _connection(self, timeout: float) -> http.client.HTTPSConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(self.host, timeout=timeout)
+            self._local.conn = conn
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def request(self, endpoint: str, params: Dict[str, str], headers: Dict[str, str],
+                timeout: float) -> GitHubResponse:
+        path = "/" + endpoint.lstrip("/")
+        if params:
+            path += ("&" if "?" in path else "?") + urlencode(params)
+        req_headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "skill-finder",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if self.token:
+            req_headers["Authorization"] = f"Bearer {self.token}"
+        req_headers.update(headers)
+
+        host = self.host
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._send(host, path, req_headers, timeout)
+            location = response.headers.get("location")
+            if response.status not in (301, 302, 307, 308) or not location:
+                return response
+            target = urlsplit(location)
+            if target.netloc and target.netloc != host:
+                host = target.netloc
+                req_headers.pop("Authorization", None)  # Never forward the token to another host
+            path = (target.path or "/") + (f"?{target.query}" if target.query else "")
+        return response
+
+    def _send(self, host: str, path: str, headers: Dict[str, str], timeout: float) -> GitHubResponse:
+        if host != self.host:
+            # Cross-host redirect target: one-off connection
+            conn = http.client.HTTPSConnection(host, timeout=timeout)
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read().decode("utf-8", errors="replace")
+            except (socket.timeout, TimeoutError):
+                raise GitHubTimeout([host, path], timeout)
+            except (http.client.HTTPException, OSError) as e:
+                return GitHubResponse(1, "", str(e))
+            finally:
+                conn.close()
+            return self._response(resp, body)
+
+        for attempt in range(2):
+            conn = self._connection(timeout)
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read().decode("utf-8", errors="replace")
+            except (socket.timeout, TimeoutError):
+                self._drop_connection()
+                raise GitHubTimeout([host, path], timeout)
+            except (http.client.HTTPException, OSError) as e:
+                # Stale keep-alive connection: reconnect once
+                self._drop_connection()
+                if attempt == 0:
+                    continue
+                return GitHubResponse(1, "", str(e))
+            return self._response(resp, body)
+        return GitHubResponse(1, "", "connection failed")
+
+    @staticmethod
+    def _response(resp: http.client.HTTPResponse, body: str) -> GitHubResponse:
+        resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+        returncode = 0 if 200 <= resp.status < 300 else 1
+        return GitHubResponse(returncode, body, "", resp.status, resp_headers)
+
+
+def fixture_key(endpoint: str, params: Dict[str, str], headers: Dict[str, str]) -> str:
+    """Return a stable, readable file name for a request."""
+    identity = json.dumps([endpoint, sorted(params.items()), sorted(headers.items())])
+    digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:10]
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", endpoint).strip("_")[:80]
+    return f"{slug}-{digest}.json"
+
+
+def write_fixture(fixture_dir: Path, endpoint: str, params: Dict[str, str], headers: Dict[str, str],
+                  response: GitHubResponse) -> Path:
+    """Save one response in the format FixtureTransport replays."""
+    fixture = {
+        "request": {"endpoint": endpoint, "params": params, "headers": headers},
+        "returncode": response.returncode,
+        "status": response.status,
+        "headers": response.headers,
+        "body": response.stdout,
+    }
+    path = Path(fixture_dir) / fixture_key(endpoint, params, headers)
+    tmp_path = Path(f"{path}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(fixture, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+class RecordingTransport:
+    """Forwards to a live transport and saves each response as a fixture."""
+
+    name = "record"
+
+    def __init__(self, inner, fixture_dir: Path):
+        self.inner = inner
+        self.fixture_dir = Path(fixture_dir)
+        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+
+    def request(self, endpoint: str, params: Dict[str, str], headers: Dict[str, str],
+                timeout: float) -> GitHubResponse:
+        response = self.inner.request(endpoint, params, headers, timeout)
+        write_fixture(self.fixture_dir, endpoint, params, headers, response)
+        return response
+
+
+class FixtureTransport:
+    """Replays recorded fixtures; unknown requests get a 404 (never the network)."""
+
+    name = "replay"
+
+    def __init__(self, fixture_dir: Path, latency: float = 0.0):
+        self.fixture_dir = Path(fixture_dir)
+        self.latency = latency
+        self.misses: List[str] = []
+        self._lock = threading.Lock()
+
+    def request(self, endpoint: str, params: Dict[str, str], headers: Dict[str, str],
+                timeout: float) -> GitHubResponse:
+        if self.latency:
+            time.sleep(self.latency)
+        path = self.fixture_dir / fixture_key(endpoint, params, headers)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                fixture = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses.append(endpoint)
+            return GitHubResponse(1, '{"message":"Not Found (no fixture)"}', "", 404, {})
+        return GitHubResponse(fixture["returncode"], fixture["body"], "",
+                              fixture["status"], fixture["headers"])
+
+
+def resolve_token() -> Optional[str]:
+    """Return a GitHub token from the environment or `gh auth token`."""
+    for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        if os.environ.get(var):
+            return os.environ[var]
+    if not shutil.which("gh"):
+        return None
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
+def make_transport(spec: Optional[str] = None):
+    """Build a transport from a spec string (see module docstring)."""
+    spec = spec or os.environ.get(TRANSPORT_ENV) or "auto"
+    kind, _, arg = spec.partition(":")
+    if kind == "gh":
+        return GhCliTransport()
+    if kind == "http":
+        return HttpTransport(resolve_token())
+    if kind == "replay":
+        latency = float(os.environ.get(LATENCY_ENV, "0") or 0) / 1000
+        return FixtureTransport(Path(arg or "fixtures"), latency)
+    if kind == "record":
+        return RecordingTransport(make_transport("auto"), Path(arg or "fixtures"))
+    if kind == "auto":
+        token = resolve_token()
+        if token:
+            return HttpTransport(token)
+        if not shutil.which("gh"):
+            print("⚠️ GitHub CLI (gh) not found and no GH_TOKEN / GITHUB_TOKEN set: "
+                  "using unauthenticated API (low rate limit, no code search)", file=sys.stderr)
+            return HttpTransport(None)
+        return GhCliTransport()
+    raise ValueError(f"Unknown transport: {spec}")
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+class GitHubClient:
+    """Thread-safe API client with concurrency cap and rate-limit backoff."""
+
+    def __init__(self, transport=None, max_concurrency: int = DEFAULT_HOST_CONCURRENCY,
+                 max_retries: int = MAX_RETRIES, max_wait: float = MAX_RATE_LIMIT_WAIT):
+        self.transport = transport or GhCliTransport()
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self.request_count = 0
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+
+    # -------------------------------------------------------------------------
+    # Throttling
+    # -------------------------------------------------------------------------
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.BoundedSemaphore(self.max_concurrency)
+            return self._slots[host]
+
+    def _wait_if_blocked(self) -> None:
+        delay = self._blocked_until - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _block_for(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.time() + min(seconds, self.max_wait))
+
+    def _rate_limit_delay(self, response: GitHubResponse, attempt: int) -> Optional[float]:
+        """Return seconds to wait if the response is a rate-limit rejection."""
+        if response.status not in (403, 429):
+            return None
+        headers = response.headers
+        if "retry-after" in headers and headers["retry-after"].isdigit():
+            return float(headers["retry-after"])
+        if headers.get("x-ratelimit-remaining") == "0" and headers.get("x-ratelimit-reset", "").isdigit():
+            return max(1.0, int(headers["x-ratelimit-reset"]) - time.time() + 1)
+        if "rate limit" in response.stdout.lower():
+            return float(2 ** (attempt + 1))  # Secondary rate limit: exponential backoff
+        return None
+
+    # -------------------------------------------------------------------------
+    # Calls
+    # -------------------------------------------------------------------------
+
+    def get(self, endpoint: str, params: Optional[Dict[str, str]] = None,
+            headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> GitHubResponse:
+        """GET a REST endpoint, retrying on rate limits.
+
+        Raises FileNotFoundError (gh missing) / subprocess.TimeoutExpired.
+        """
+        params = params or {}
+        headers = headers or {}
+        for attempt in range(self.max_retries + 1):
+            with self._slot(API_HOST):
+                self._wait_if_blocked()
+                with self._lock:
+                    self.request_count += 1
+                response = self.transport.request(endpoint, params, headers, timeout)
+            delay = self._rate_limit_delay(response, attempt)
+            if delay is None or attempt == self.max_retries:
+                return response
+            self._block_for(delay)
+        return response
+
+    def get_raw(self, endpoint: str, timeout: float = 30) -> GitHubResponse:
+        """GET file contents as raw text."""
+        return self.get(endpoint, headers={"Accept": RAW_ACCEPT}, timeout=timeout)
+
+    def search_code(self, query: str, limit: int = 15, timeout: float = 30) -> List[Dict]:
+        """Code search, shaped like `gh search code --json repository,path,url`."""
+        response = self.get("search/code", {"q": query, "per_page": str(limit)}, timeout=timeout)
+        if not response.ok:
+            return []
+        return [
+            {
+                "repository": {"nameWithOwner": item.get("repository", {}).get("full_name", "")},
+                "path": item.get("path", ""),
+                "url": item.get("html_url", ""),
+            }
+            for item in response.json().get("items", [])
+        ]
+
+    def search_repos(self, query: str, limit: int = 10, timeout: float = 30) -> Optional[List[Dict]]:
+        """Repository search, shaped like `gh search repos --json nameWithOwner,...`.
+
+        Returns None if the request failed.
+        """
+        response = self.get("search/repositories", {"q": query, "per_page": str(limit)}, timeout=timeout)
+        if not response.ok:
+            return None
+        return [
+            {
+                "nameWithOwner": item.get("full_name", ""),
+                "description": item.get("description") or "",
+                "stargazersCount": item.get("stargazers_count", 0),
+            }
+            for item in response.json().get("items", [])
+        ]
+
+
+_default_client: Optional[GitHubClient] = None
+_client_lock = threading.Lock()
+
+
+def configure_client(spec: Optional[str] = None) -> GitHubClient:
+    """Replace the process-wide client with one using the given transport."""
+    global _default_client
+    with _client_lock:
+        _default_client = GitHubClient(make_transport(spec))
+        return _default_client
+
+
+def get_client() -> GitHubClient:
+    """Return the process-wide client (shared throttle and rate-limit state)."""
+    with _client_lock:
+        if _default_client is not None:
+            return _default_client
+    return configure_client()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Compiled SQLite sidecar for Skill Finder's skill-index.json.
+
+Features:
+- Whole index stored as a marshal blob (loads much faster than json.load)
+- One row per skill, so --info / --similar read only the rows they need
+- Precomputed similar-skill neighbor table (see similarity.py)
+- Keyed by the JSON's mtime/size, verified by SHA-256 when mtime drifts
+  (e.g. after git checkout) so identical content is not recompiled
+
+Author: yamapan (https://github.com/aktsmm)
+License: MIT
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Bump when the table layout changes so stale sidecars are rebuilt
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value BLOB);
+CREATE TABLE skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_lower TEXT NOT NULL,
+    source TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX idx_skills_name ON skills(name_lower);
+CREATE TABLE skill_categories (skill_id INTEGER NOT NULL, category TEXT NOT NULL);
+CREATE INDEX idx_skill_categories ON skill_categories(category);
+CREATE TABLE sources (id TEXT PRIMARY KEY, record TEXT NOT NULL);
+CREATE TABLE neighbors (
+    skill_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    neighbor_id INTEGER NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (skill_id, rank)
+);
+"""
+
+
+def file_digest(path: Path) -> str:
+    """Return SHA-256 hex digest of a file."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class IndexCache:
+    """SQLite sidecar mirroring skill-index.json."""
+
+    def __init__(self, cache_path: Path, index_path: Path,
+                 neighbor_builder: Optional[Callable[[Dict[str, Any]], List[List[Tuple[int, float]]]]] = None):
+        """``neighbor_builder(index)`` returns top-k (doc_id, score) lists per skill."""
+        self.cache_path = Path(cache_path)
+        self.index_path = Path(index_path)
+        self.neighbor_builder = neighbor_builder
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # -------------------------------------------------------------------------
+    # Connection / freshness
+    # -------------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.cache_path)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _meta(self, key: str) -> Any:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self) -> bool:
+        """Check whether the sidecar matches the current JSON file."""
+        if not self.cache_path.exists() or not self.index_path.exists():
+            return False
+        try:
+            if self._meta("schema") != SCHEMA_VERSION:
+                return False
+            st = os.stat(self.index_path)
+            if self._meta("mtime_ns") == st.st_mtime_ns and self._meta("size") == st.st_size:
+                return True
+            if self._meta("size") != st.st_size:
+                return False
+            # Same size, different mtime: compare content before recompiling
+            if self._meta("sha256") != file_digest(self.index_path):
+                return False
+            with self._connect() as conn:
+                conn.execute("UPDATE meta SET value = ? WHERE key = 'mtime_ns'", (st.st_mtime_ns,))
+            return True
+        except sqlite3.DatabaseError:
+            return False
+
+    def ensure_fresh(self) -> bool:
+        """Rebuild the sidecar from JSON if needed. Returns False if no JSON."""
+        if self.is_fresh():
+            return True
+        if not self.index_path.exists():
+            return False
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        self.rebuild(index)
+        return True
+
+    def rebuild(self, index: Dict[str, Any]) -> None:
+        """Compile ``index`` (already written to index_path) into the sidecar."""
+        self.close()
+        tmp_path = Path(f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        st = os.stat(self.index_path)
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.executescript(SCHEMA)
+            skills = index.get("skills", [])
+            conn.executemany(
+                "INSERT INTO skills (id, name, name_lower, source, record) VALUES (?, ?, ?, ?, ?)",
+                [(i, s["name"], s["name"].lower(), s.get("source", ""), json.dumps(s, ensure_ascii=False))
+                 for i, s in enumerate(skills)],
+            )
+            conn.executemany(
+                "INSERT INTO skill_categories (skill_id, category) VALUES (?, ?)",
+                [(i, c) for i, s in enumerate(skills) for c in dict.fromkeys(s.get("categories", []))],
+            )
+            if self.neighbor_builder:
+                conn.executemany(
+                    "INSERT INTO neighbors (skill_id, rank, neighbor_id, score) VALUES (?, ?, ?, ?)",
+                    [(i, rank, n, score)
+                     for i, lst in enumerate(self.neighbor_builder(index))
+                     for rank, (n, score) in enumerate(lst)],
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO sources (id, record) VALUES (?, ?)",
+                [(s["id"], json.dumps(s, ensure_ascii=False)) for s in index.get("sources", [])],
+            )
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("schema", SCHEMA_VERSION),
+                    ("mtime_ns", st.st_mtime_ns),
+                    ("size", st.st_size),
+                    ("sha256", file_digest(self.index_path)),
+                    ("lastUpdated", index.get("lastUpdated", "")),
+                    ("index_blob", marshal.dumps(index)),
+                ],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, self.cache_path)
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def load_index(self) -> Dict[str, Any]:
+        """Return the full index dict from the compiled blob."""
+        return marshal.loads(self._meta("index_blob"))
+
+    def find_skills(self, name: str) -> List[Dict]:
+        """Return skills whose name matches case-insensitively."""
+        rows = self._connect().execute(
+            "SELECT record FROM skills WHERE name_lower = ? ORDER BY id", (name.lower(),)
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def get_source(self, source_id: str) -> Dict:
+        """Return a source entry, or {} if unknown."""
+        row = self._connect().execute("SELECT record FROM sources WHERE id = ?", (source_id,)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def get_skills(self, skill_ids: List[int]) -> List[Dict]:
+        """Return skills by doc ID, in the given order."""
+        if not skill_ids:
+            return []
+        placeholders = ",".join("?" * len(skill_ids))
+        rows = self._connect().execute(
+            f"SELECT id, record FROM skills WHERE id IN ({placeholders})", list(skill_ids)
+        ).fetchall()
+        records = {i: json.loads(r) for i, r in rows}
+        return [records[i] for i in skill_ids if i in records]
+
+    def neighbors_of(self, name: str, limit: int = 5) -> Optional[List[Dict]]:
+        """Return precomputed similar skills, or None if ``name`` is unknown."""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT id FROM skills WHERE name_lower = ? ORDER BY id LIMIT 1", (name.lower(),)
+        ).fetchone()
+        if not row:
+            return None
+        # Same-name skills from other sources are copies, not neighbors
+        rows = conn.execute(
+            "SELECT s.record FROM neighbors n JOIN skills s ON s.id = n.neighbor_id "
+            "WHERE n.skill_id = ? AND s.name_lower != ? ORDER BY n.rank LIMIT ?",
+            (row[0], name.lower(), limit),
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows]
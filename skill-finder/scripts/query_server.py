@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Long-lived query server for Skill Finder (agent / batch use).
+
+Keeps the index, search index and similarity model warm in memory and
+answers JSON requests, one JSON result line per request:
+
+    {"id": 1, "op": "search", "query": "pdf", "limit": 5}
+    {"id": 2, "op": "info", "name": "docx"}
+    {"id": 3, "op": "similar", "name": "pptx", "limit": 5}
+    {"id": 4, "op": "stats"}
+    [{"op": "search", "query": "#azure"}, {"op": "info", "name": "pdf"}]
+
+A line holding a JSON array is a batch; its results are streamed in order.
+skill-index.json / starred-skills.json changes are picked up automatically
+before each request.
+
+Usage:
+    python scripts/search_skills.py --serve
+    python scripts/search_skills.py --serve --socket /tmp/skill-finder.sock
+
+Author: yamapan (https://github.com/aktsmm)
+License: MIT
+"""
+
+import json
+import os
+import socketserver
+import sys
+import threading
+from typing import Any, Dict, Iterator, Optional
+
+import search_skills as sf
+from search_index import file_signature
+
+# Fields returned for each skill
+SKILL_FIELDS = ("name", "source", "path", "categories", "description", "sourceUrl", "sourceName", "starred")
+
+
+class QueryEngine:
+    """In-memory index with automatic reload on file change."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Any]] = None
+        self._signature = None
+
+    def _current_index(self) -> Dict[str, Any]:
+        signature = file_signature(sf.INDEX_PATH)
+        if self._index is None or signature != self._signature:
+            self._index = sf.load_index() or {"skills": [], "sources": [], "categories": []}
+            self._signature = signature
+        return self._index
+
+    def _skill(self, skill: Dict, index: Dict[str, Any]) -> Dict:
+        if "sourceUrl" not in skill:
+            sources = {s["id"]: s for s in index.get("sources", [])}
+            src = sources.get(skill.get("source"), {})
+            skill = dict(skill, sourceUrl=src.get("url", ""), sourceName=src.get("name", skill.get("source", "")))
+        return {k: skill[k] for k in SKILL_FIELDS if k in skill}
+
+    # -------------------------------------------------------------------------
+    # Operations
+    # -------------------------------------------------------------------------
+
+    def op_search(self, index: Dict, req: Dict) -> Dict:
+        results = sf.search_local(index, req.get("query", ""), req.get("category", ""),
+                                  req.get("source", ""), req.get("tags"))
+        limit = req.get("limit")
+        total = len(results)
+        if isinstance(limit, int) and limit >= 0:
+            results = results[:limit]
+        return {"total": total, "skills": [self._skill(s, index) for s in results]}
+
+    def op_info(self, index: Dict, req: Dict) -> Dict:
+        name = req.get("name", "").lower()
+        matches = [s for s in index.get("skills", []) if s["name"].lower() == name]
+        if not matches:
+            suggestions = sf.find_similar_skills(index, req.get("name", ""))
+            return {"found": False, "suggestions": [s["name"] for s in suggestions]}
+        skill = self._skill(matches[0], index)
+        if skill.get("sourceUrl") and skill.get("path"):
+            skill["url"] = f"{skill['sourceUrl']}/tree/main/{skill['path']}"
+        return {"found": True, "skill": skill, "matches": len(matches)}
+
+    def op_similar(self, index: Dict, req: Dict) -> Dict:
+        limit = req.get("limit", 5)
+        similar = sf.find_similar_skills(index, req.get("name", ""), limit=limit)
+        return {"skills": [self._skill(s, index) for s in similar]}
+
+    def op_stats(self, index: Dict, req: Dict) -> Dict:
+        return sf.compute_statistics(index)
+
+    def op_ping(self, index: Dict, req: Dict) -> Dict:
+        return {"skills": len(index.get("skills", [])), "lastUpdated": index.get("lastUpdated", "")}
+
+    def handle(self, req: Any) -> Dict:
+        """Answer one request object."""
+        if not isinstance(req, dict):
+            return {"ok": False, "error": "request must be a JSON object"}
+        op = req.get("op", "search")
+        response = {"id": req.get("id"), "op": op}
+        handler = getattr(self, f"op_{op}", None)
+        if handler is None:
+            response.update(ok=False, error=f"unknown op: {op}")
+            return response
+        try:
+            with self._lock:
+                result = handler(self._current_index(), req)
+            response.update(ok=True, result=result)
+        except Exception as e:
+            response.update(ok=False, error=f"{e.__class__.__name__}: {e}")
+        return response
+
+    def handle_line(self, line: str) -> Iterator[Dict]:
+        """Answer one input line (a request object or a batch array)."""
+        line = line.strip()
+        if not line:
+            return
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {"ok": False, "error": f"invalid JSON: {e}"}
+            return
+        requests = payload if isinstance(payload, list) else [payload]
+        for req in requests:
+            yield self.handle(req)
+
+
+# =============================================================================
+# Front ends
+# =============================================================================
+
+def _dump(response: Dict) -> str:
+    return json.dumps(response, ensure_ascii=False) + "\n"
+
+
+def serve_stdio(stdin=None, stdout=None) -> None:
+    """Serve JSON-lines requests from stdin until EOF."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    engine = QueryEngine()
+    for line in stdin:
+        for response in engine.handle_line(line):
+            stdout.write(_dump(response))
+        stdout.flush()
+
+
+def serve_socket(path: str) -> None:
+    """Serve JSON-lines requests on a Unix socket (one engine, many clients)."""
+    engine = QueryEngine()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                for response in engine.handle_line(raw.decode("utf-8", errors="replace")):
+                    self.wfile.write(_dump(response).encode("utf-8"))
+                self.wfile.flush()
+
+    if os.path.exists(path):
+        os.unlink(path)
+    with socketserver.ThreadingUnixStreamServer(path, Handler) as server:
+        print(f"🛰️ Serving on {path} (Ctrl+C to stop)", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Inverted index for Skill Finder local search.
+
+Features:
+- Tokenized postings over skill name / description / categories
+- BM25 ranking with per-field weights (name > categories > description)
+- Prefix expansion via a sorted vocabulary (no full scan per query)
+- Infix fallback over the vocabulary for terms no word starts with
+- CJK text indexed as character bigrams (Japanese descriptions)
+- Persisted next to skill-index.json and reused until the JSON changes
+
+Author: yamapan (https://github.com/aktsmm)
+License: MIT
+"""
+
+import marshal
+import math
+import os
+import re
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bump when the on-disk layout changes so stale sidecars are rebuilt
+FORMAT_VERSION = 1
+
+# Field weights (a hit in the name counts more than one in the description)
+FIELD_WEIGHTS = {"name": 3.0, "categories": 2.0, "description": 1.0}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Score factor for terms matched by prefix instead of exactly
+PREFIX_FACTOR = 0.6
+
+# Score factor for terms matched inside a word (infix fallback)
+INFIX_FACTOR = 0.3
+
+_RUN_RE = re.compile(r"[^\W_]+")
+_ASCII_SPLIT_RE = re.compile(r"[a-z0-9]+|[^a-z0-9]+")
+
+
+# =============================================================================
+# Tokenizer
+# =============================================================================
+
+def tokenize(text: str) -> List[str]:
+    """Split text into search terms.
+
+    ASCII words become single terms. Non-ASCII runs (Japanese etc.) have no
+    word boundaries, so they are indexed as character bigrams plus the last
+    character, which lets both substrings and single characters match.
+    """
+    terms = []
+    for run in _RUN_RE.findall(text.lower()):
+        for part in _ASCII_SPLIT_RE.findall(run):
+            if part.isascii():
+                terms.append(part)
+            elif len(part) == 1:
+                terms.append(part)
+            else:
+                terms.extend(part[i:i + 2] for i in range(len(part) - 1))
+                terms.append(part[-1])
+    return terms
+
+
+def file_signature(path: Path) -> Optional[List[int]]:
+    """Return [mtime_ns, size] of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+# =============================================================================
+# Search Index
+# =============================================================================
+
+class SearchIndex:
+    """BM25 inverted index over the skills list of skill-index.json.
+
+    Document IDs are positions in ``index["skills"]``.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.signature = data.get("signature")
+        self.doc_count = data["doc_count"]
+        self.doc_len = data["doc_len"]
+        self.avg_len = data["avg_len"]
+        self.postings: Dict[str, List[Tuple[int, float]]] = data["postings"]
+        self.vocab: List[str] = data["vocab"]
+        self.categories: Dict[str, List[int]] = data["categories"]
+        self.sources: Dict[str, List[int]] = data["sources"]
+
+    # -------------------------------------------------------------------------
+    # Build / persist
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, skills: List[Dict], signature: Optional[List[int]] = None) -> "SearchIndex":
+        """Build the index from a list of skill entries."""
+        postings: Dict[str, Dict[int, float]] = {}
+        categories: Dict[str, List[int]] = {}
+        sources: Dict[str, List[int]] = {}
+        doc_len = []
+
+        for doc_id, skill in enumerate(skills):
+            cats = skill.get("categories", [])
+            fields = {
+                "name": skill.get("name", ""),
+                "categories": " ".join(cats),
+                "description": skill.get("description", ""),
+            }
+            length = 0.0
+            for field, text in fields.items():
+                weight = FIELD_WEIGHTS[field]
+                for term in tokenize(text):
+                    doc_terms = postings.setdefault(term, {})
+                    doc_terms[doc_id] = doc_terms.get(doc_id, 0.0) + weight
+                    length += weight
+            doc_len.append(length)
+
+            for cat in {c.lower() for c in cats}:
+                categories.setdefault(cat, []).append(doc_id)
+            sources.setdefault(skill.get("source", ""), []).append(doc_id)
+
+        doc_count = len(skills)
+        return cls({
+            "signature": signature,
+            "doc_count": doc_count,
+            "doc_len": doc_len,
+            "avg_len": (sum(doc_len) / doc_count) if doc_count else 0.0,
+            "postings": {t: sorted(d.items()) for t, d in postings.items()},
+            "vocab": sorted(postings),
+            "categories": categories,
+            "sources": sources,
+        })
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SearchIndex"]:
+        """Load a persisted index, or None if missing / incompatible."""
+        try:
+            with open(path, "rb") as f:
+                data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(data, dict) or data.get("format") != FORMAT_VERSION:
+            return None
+        return cls(data)
+
+    def save(self, path: Path) -> None:
+        """Persist the index (written to a temp file, then swapped in)."""
+        data = {
+            "format": FORMAT_VERSION,
+            "signature": self.signature,
+            "doc_count": self.doc_count,
+            "doc_len": self.doc_len,
+            "avg_len": self.avg_len,
+            "postings": self.postings,
+            "vocab": self.vocab,
+            "categories": self.categories,
+            "sources": self.sources,
+        }
+        tmp_path = Path(f"{path}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            marshal.dump(data, f)
+        os.replace(tmp_path, path)
+
+    # -------------------------------------------------------------------------
+    # Query
+    # -------------------------------------------------------------------------
+
+    def expand(self, term: str) -> List[str]:
+        """Return vocabulary terms equal to or starting with ``term``.
+
+        If no term starts with ``term``, fall back to terms containing it
+        (a vocabulary scan), so "script" still finds "descriptors".
+        """
+        start = bisect_left(self.vocab, term)
+        matches = []
+        for i in range(start, len(self.vocab)):
+            if not self.vocab[i].startswith(term):
+                break
+            matches.append(self.vocab[i])
+        if not matches:
+            matches = [vocab_term for vocab_term in self.vocab if term in vocab_term]
+        return matches
+
+    def search(self, query: str) -> Dict[int, float]:
+        """Return {doc_id: score} for docs matching every query term."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return {}
+
+        scores: Optional[Dict[int, float]] = None
+        for term in terms:
+            term_scores: Dict[int, float] = {}
+            for vocab_term in self.expand(term):
+                if vocab_term == term:
+                    factor = 1.0
+                elif vocab_term.startswith(term):
+                    factor = PREFIX_FACTOR
+                else:
+                    factor = INFIX_FACTOR
+                for doc_id, score in self._bm25(vocab_term):
+                    term_scores[doc_id] = max(term_scores.get(doc_id, 0.0), score * factor)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {d: s + term_scores[d] for d, s in scores.items() if d in term_scores}
+            if not scores:
+                return {}
+        return scores or {}
+
+    def _bm25(self, term: str):
+        """Yield (doc_id, score) for one vocabulary term."""
+        postings = self.postings.get(term, [])
+        df = len(postings)
+        idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+        avg_len = self.avg_len or 1.0
+        for doc_id, tf in postings:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len[doc_id] / avg_len)
+            yield doc_id, idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+    def with_category(self, tag: str) -> List[int]:
+        """Return doc IDs having the category (case-insensitive)."""
+        return self.categories.get(tag.lower(), [])
+
+    def with_source(self, source: str) -> List[int]:
+        """Return doc IDs from the given source."""
+        return self.sources.get(source, [])
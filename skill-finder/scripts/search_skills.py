@@ -3,7 +3,7 @@
 Skill Finder - Search and manage Agent Skills.
 
 Features:
-- Local index search (fast, offline)
+- Local index search (fast, offline, BM25-ranked inverted index)
 - GitHub Code Search API fallback
 - Web search URLs as final fallback
 - Add new sources (--add-source)
@@ -22,21 +22,34 @@ License: MIT
 import argparse
 import json
 import re
+import sqlite3
 import subprocess
 import sys
+import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+
+from description_backfill import extract_description
+from github_api import HttpTransport, configure_client, get_client
+from index_cache import IndexCache
+from search_index import SearchIndex, file_signature
+from similarity import TOP_K as SIMILAR_TOP_K, SimilarityModel
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 INDEX_PATH = SCRIPT_DIR / ".." / "references" / "skill-index.json"
+SEARCH_INDEX_PATH = SCRIPT_DIR / ".." / "references" / ".skill-index.search.bin"
+INDEX_CACHE_PATH = SCRIPT_DIR / ".." / "references" / ".skill-index.cache.sqlite"
+SIMILARITY_PATH = SCRIPT_DIR / ".." / "references" / ".skill-index.similar.bin"
 STARS_PATH = SCRIPT_DIR / ".." / "references" / "starred-skills.json"
 INSTALL_DIR = Path.home() / ".skills"  # Default install directory
 
 # Configuration
 AUTO_UPDATE_DAYS = 7  # Auto-update if index is older than this
+REFRESH_WORKERS = 8   # Sources refreshed in parallel by --update
 
 
 # =============================================================================
@@ -44,12 +57,47 @@ AUTO_UPDATE_DAYS = 7  # Auto-update if index is older than this
 # =============================================================================
 
 def load_index() -> Optional[Dict[str, Any]]:
-    """Load skill index from JSON file."""
+    """Load skill index (from the compiled sidecar when it is fresh)."""
     if not INDEX_PATH.exists():
         print(f"⚠️ Index file not found: {INDEX_PATH}")
         return None
+    cache = open_index_cache()
+    corrupt = False
+    if cache:
+        try:
+            return cache.load_index()
+        except (ValueError, EOFError, TypeError, sqlite3.Error):
+            cache.close()  # Corrupt / incompatible blob: recompile from JSON
+            corrupt = True
     with open(INDEX_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+        index = json.load(f)
+    if corrupt:
+        rebuild_index_cache(index)
+    return index
+
+
+def open_index_cache() -> Optional[IndexCache]:
+    """Return the compiled sidecar, rebuilding it if the JSON changed.
+    
+    Returns None when the sidecar cannot be used (e.g. read-only install),
+    in which case callers fall back to the JSON file.
+    """
+    cache = IndexCache(INDEX_CACHE_PATH, INDEX_PATH, neighbor_table)
+    try:
+        if cache.ensure_fresh():
+            return cache
+    except (OSError, sqlite3.Error, ValueError, EOFError):
+        pass  # Unusable sidecar: fall back to JSON
+    cache.close()
+    return None
+
+
+def rebuild_index_cache(index: Dict[str, Any]) -> None:
+    """Recompile the sidecar right after skill-index.json was written."""
+    try:
+        IndexCache(INDEX_CACHE_PATH, INDEX_PATH, neighbor_table).rebuild(index)
+    except (OSError, sqlite3.Error):
+        pass  # Stale sidecar is detected by mtime/hash on next load
 
 
 def save_index(index: Dict[str, Any]) -> None:
@@ -58,6 +106,8 @@ def save_index(index: Dict[str, Any]) -> None:
     with open(INDEX_PATH, "w", encoding="utf-8") as f:
         json.dump(index, f, indent=2, ensure_ascii=False)
     print(f"✅ Index saved: {INDEX_PATH}")
+    rebuild_index_cache(index)
+    rebuild_search_index(index)
 
 
 def is_index_outdated(index: Dict[str, Any]) -> bool:
@@ -90,12 +140,90 @@ def check_and_auto_update(index: Dict[str, Any], silent: bool = False) -> Dict[s
     return index
 
 
+# In-process cache: (skills list identity, skill count, SearchIndex)
+_search_index_cache = None
+
+
+def get_search_index(index: Dict[str, Any]) -> SearchIndex:
+    """Return the inverted index for ``index``, loading or building it once."""
+    global _search_index_cache
+    skills = index.get("skills", [])
+    if _search_index_cache and _search_index_cache[0] is skills and _search_index_cache[1] == len(skills):
+        return _search_index_cache[2]
+    
+    signature = file_signature(INDEX_PATH)
+    engine = SearchIndex.load(SEARCH_INDEX_PATH)
+    if not engine or engine.signature != signature or engine.doc_count != len(skills):
+        engine = SearchIndex.build(skills, signature)
+        try:
+            engine.save(SEARCH_INDEX_PATH)
+        except OSError:
+            pass  # Read-only install: keep the in-memory index only
+    _search_index_cache = (skills, len(skills), engine)
+    return engine
+
+
+def rebuild_search_index(index: Dict[str, Any]) -> None:
+    """Rebuild the persisted inverted index after skill-index.json changed."""
+    global _search_index_cache
+    _search_index_cache = None
+    get_search_index(index)
+
+
+# In-process cache: (file signature, starred list)
+_stars_cache = None
+
+
+# In-process cache: (skills list identity, skill count, SimilarityModel)
+_similarity_cache = None
+
+
+def get_similarity_model(index: Dict[str, Any]) -> SimilarityModel:
+    """Return the similar-skills model for ``index``, updating it incrementally."""
+    global _similarity_cache
+    skills = index.get("skills", [])
+    if _similarity_cache and _similarity_cache[0] is skills and _similarity_cache[1] == len(skills):
+        return _similarity_cache[2]
+    
+    signature = file_signature(INDEX_PATH)
+    model = SimilarityModel.load(SIMILARITY_PATH)
+    if not model or model.signature != signature or model.doc_count != len(skills):
+        model = model.update(skills, signature) if model else SimilarityModel.build(skills, signature)
+        try:
+            model.save(SIMILARITY_PATH)
+        except OSError:
+            pass  # Read-only install: keep the in-memory model only
+    _similarity_cache = (skills, len(skills), model)
+    return model
+
+
+def load_similarity_model() -> Optional[SimilarityModel]:
+    """Load the persisted model if it matches skill-index.json (no JSON parse)."""
+    model = SimilarityModel.load(SIMILARITY_PATH)
+    if model and model.signature == file_signature(INDEX_PATH):
+        return model
+    return None
+
+
+def neighbor_table(index: Dict[str, Any]) -> List[List[Tuple[int, float]]]:
+    """Neighbor builder for the SQLite sidecar."""
+    global _similarity_cache
+    _similarity_cache = None
+    return get_similarity_model(index).neighbors
+
+
 def load_stars() -> List[str]:
-    """Load starred skills list."""
-    if not STARS_PATH.exists():
+    """Load starred skills list (re-read only when the file changes)."""
+    global _stars_cache
+    signature = file_signature(STARS_PATH)
+    if signature is None:
         return []
+    if _stars_cache and _stars_cache[0] == signature:
+        return list(_stars_cache[1])
     with open(STARS_PATH, "r", encoding="utf-8") as f:
-        return json.load(f).get("starred", [])
+        starred = json.load(f).get("starred", [])
+    _stars_cache = (signature, starred)
+    return list(starred)
 
 
 def save_stars(starred: List[str]) -> None:
@@ -111,66 +239,81 @@ def save_stars(starred: List[str]) -> None:
 
 def search_local(index: Dict, query: str = "", category: str = "", source: str = "", 
                  tags: List[str] = None) -> List[Dict]:
-    """Search skills in local index with optional tag support."""
-    results = index.get("skills", [])
+    """Search skills in local index with optional tag support.
+    
+    Keywords are looked up in the inverted index and ranked by BM25;
+    tags, category and source narrow the candidates via their postings.
+    """
+    skills = index.get("skills", [])
+    engine = get_search_index(index)
+    candidates = None  # None = all skills
+    scores: Dict[int, float] = {}
     
     # Keyword filter (supports #tag syntax)
     if query:
         # Extract tags from query
         tag_pattern = r'#(\w+)'
         extracted_tags = re.findall(tag_pattern, query)
-        clean_query = re.sub(tag_pattern, '', query).strip().lower()
+        clean_query = re.sub(tag_pattern, '', query).strip()
         
         if extracted_tags:
             tags = (tags or []) + extracted_tags
         
         if clean_query:
-            results = [s for s in results 
-                      if clean_query in s["name"].lower() 
-                      or clean_query in s.get("description", "").lower()]
+            scores = engine.search(clean_query)
+            candidates = set(scores)
     
     # Tag filter (matches categories)
     if tags:
-        results = [s for s in results 
-                  if any(tag.lower() in [c.lower() for c in s.get("categories", [])] 
-                        for tag in tags)]
+        tagged = set()
+        for tag in tags:
+            tagged.update(engine.with_category(tag))
+        candidates = tagged if candidates is None else candidates & tagged
     
     # Category filter
     if category:
-        results = [s for s in results if category in s.get("categories", [])]
+        in_category = {i for i in engine.with_category(category)
+                       if category in skills[i].get("categories", [])}
+        candidates = in_category if candidates is None else candidates & in_category
     
     # Source filter
     if source:
-        results = [s for s in results if s.get("source") == source]
+        from_source = set(engine.with_source(source))
+        candidates = from_source if candidates is None else candidates & from_source
+    
+    doc_ids = range(len(skills)) if candidates is None else candidates
     
     # Add source info and star status
     sources = {s["id"]: s for s in index.get("sources", [])}
-    starred = load_stars()
-    for skill in results:
+    starred = set(load_stars())
+    results = []
+    for doc_id in doc_ids:
+        skill = skills[doc_id]
         src = sources.get(skill.get("source"), {})
         skill["sourceUrl"] = src.get("url", "")
         skill["sourceName"] = src.get("name", skill.get("source", ""))
         skill["starred"] = f"{skill['source']}/{skill['name']}" in starred
+        results.append((doc_id, skill))
     
-    # Sort: starred first
-    results.sort(key=lambda x: (not x.get("starred", False), x["name"]))
+    # Sort: starred first, then relevance
+    results.sort(key=lambda x: (not x[1]["starred"], -scores.get(x[0], 0.0), x[1]["name"]))
     
-    return results
+    return [skill for _, skill in results]
 
 
 def search_github(query: str) -> List[Dict]:
-    """Search skills on GitHub using gh CLI."""
+    """Search skills on GitHub Code Search."""
     print("\n🌐 Searching GitHub...")
     
     search_query = f"{query} filename:SKILL.md" if query else "filename:SKILL.md path:.github/skills"
     
+    client = get_client()
+    if isinstance(client.transport, HttpTransport) and not client.transport.token:
+        # Code search needs authentication ("auto" without gh or a token)
+        print("  ⚠️ GitHub CLI (gh) not found. Install it for external search.")
+        return []
     try:
-        result = subprocess.run(
-            ["gh", "search", "code", search_query, "--json", "repository,path,url", "--limit", "15"],
-            capture_output=True, text=True, timeout=30
-        )
-        if result.returncode == 0:
-            return json.loads(result.stdout)
+        return client.search_code(search_query, limit=15)
     except FileNotFoundError:
         print("  ⚠️ GitHub CLI (gh) not found. Install it for external search.")
     except subprocess.TimeoutExpired:
@@ -242,18 +385,19 @@ def add_source(repo_url: str) -> None:
     update_source_skills(index, source_id, repo_full)
 
 
-def update_source_skills(index: Dict, source_id: str, repo_full: str) -> None:
-    """Fetch and update skills from a source repository using GitHub Code Search API."""
-    print("\n🔍 Searching for skills...")
+def discover_source_skills(repo_full: str, log=print) -> List[Dict]:
+    """Find skill folders in a source repository (network only, no index changes).
+    
+    Uses GitHub Code Search first, then falls back to directory probes.
+    ``log`` receives progress lines so parallel refreshes can buffer them.
+    """
+    client = get_client()
     found_skills = []
     
     # Method 1: Use GitHub Code Search API to find all SKILL.md files
     try:
-        result = subprocess.run(
-            ["gh", "api", "search/code", "-f", f"q=repo:{repo_full} filename:SKILL.md"],
-            capture_output=True, text=True, timeout=30
-        )
-        if result.returncode == 0:
+        result = client.get("search/code", {"q": f"repo:{repo_full} filename:SKILL.md"}, timeout=30)
+        if result.ok:
             data = json.loads(result.stdout)
             items = data.get("items", [])
             if items:
@@ -270,13 +414,13 @@ def update_source_skills(index: Dict, source_id: str, repo_full: str) -> None:
                             found_skills.append({"name": skill_name, "path": parent})
                 
                 if found_skills:
-                    print(f"  📂 Found {len(found_skills)} skills via Code Search")
+                    log(f"  📂 Found {len(found_skills)} skills via Code Search")
                     for skill in found_skills:
-                        print(f"    - {skill['name']} ({skill['path']})")
+                        log(f"    - {skill['name']} ({skill['path']})")
     except subprocess.TimeoutExpired:
-        print("  ⚠️ Code Search timeout, falling back to directory scan...")
+        log("  ⚠️ Code Search timeout, falling back to directory scan...")
     except Exception as e:
-        print(f"  ⚠️ Code Search failed ({e}), falling back to directory scan...")
+        log(f"  ⚠️ Code Search failed ({e}), falling back to directory scan...")
     
     # Method 2: Fallback to directory-based search if Code Search fails or returns empty
     if not found_skills:
@@ -286,25 +430,22 @@ def update_source_skills(index: Dict, source_id: str, repo_full: str) -> None:
         
         for path in skills_paths:
             try:
-                result = subprocess.run(
-                    ["gh", "api", f"repos/{repo_full}/contents/{path}"],
-                    capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0 and "message" not in result.stdout[:50]:
+                result = client.get(f"repos/{repo_full}/contents/{path}", timeout=10)
+                if result.ok and "message" not in result.stdout[:50]:
                     items = json.loads(result.stdout)
                     if isinstance(items, list):
-                        print(f"  📂 Found {len(items)} items in {path}")
+                        log(f"  📂 Found {len(items)} items in {path}")
                         for item in items:
                             name = item.get("name", "")
                             if name and item.get("type") == "dir":
                                 found_skills.append({"name": name, "path": f"{path}/{name}"})
-                                print(f"    - {name}")
+                                log(f"    - {name}")
                         found_in_subdir = True
                         break
             except subprocess.TimeoutExpired:
-                print(f"  ⚠️ Timeout checking {path}")
+                log(f"  ⚠️ Timeout checking {path}")
             except FileNotFoundError:
-                print("  ❌ GitHub CLI (gh) not found.")
+                log("  ❌ GitHub CLI (gh) not found.")
                 break
             except Exception:
                 # Silently ignore other errors (JSON parse errors, network issues, etc.)
@@ -314,81 +455,282 @@ def update_source_skills(index: Dict, source_id: str, repo_full: str) -> None:
         # If no skills/ directory found, check root for SKILL.md in subdirectories
         if not found_in_subdir:
             try:
-                result = subprocess.run(
-                    ["gh", "api", f"repos/{repo_full}/contents"],
-                    capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0:
+                result = client.get(f"repos/{repo_full}/contents", timeout=10)
+                if result.ok:
                     items = json.loads(result.stdout)
                     if isinstance(items, list):
                         dirs = [item for item in items if item.get("type") == "dir"]
-                        skill_dirs = []
-                        for d in dirs:
-                            name = d.get("name", "")
-                            if name.startswith(".") or name in ["docs", "examples", "tests", "node_modules", "dist", "build"]:
-                                continue
-                            check_result = subprocess.run(
-                                ["gh", "api", f"repos/{repo_full}/contents/{name}/SKILL.md"],
-                                capture_output=True, text=True, timeout=5
-                            )
-                            if check_result.returncode == 0 and "message" not in check_result.stdout[:50]:
-                                skill_dirs.append({"name": name, "path": name})
+                        names = [d.get("name", "") for d in dirs]
+                        names = [n for n in names
+                                 if not n.startswith(".") and n not in ["docs", "examples", "tests", "node_modules", "dist", "build"]]
+                        
+                        def has_skill_md(name: str) -> bool:
+                            try:
+                                check = client.get(f"repos/{repo_full}/contents/{name}/SKILL.md", timeout=5)
+                            except subprocess.TimeoutExpired:
+                                return False
+                            return check.ok and "message" not in check.stdout[:50]
+                        
+                        # Probe candidate folders concurrently (bounded by the client's host cap)
+                        with ThreadPoolExecutor(max_workers=client.max_concurrency) as pool:
+                            probes = list(pool.map(has_skill_md, names))
+                        skill_dirs = [{"name": n, "path": n} for n, ok in zip(names, probes) if ok]
                         
                         if skill_dirs:
-                            print(f"  📂 Found {len(skill_dirs)} skills at root level")
+                            log(f"  📂 Found {len(skill_dirs)} skills at root level")
                             for skill in skill_dirs:
                                 found_skills.append(skill)
-                                print(f"    - {skill['name']}")
+                                log(f"    - {skill['name']}")
             except subprocess.TimeoutExpired:
-                print("  ⚠️ Timeout checking root")
+                log("  ⚠️ Timeout checking root")
             except Exception:
                 # Silently ignore errors when checking root directory
                 # (e.g., rate limits, permission issues)
                 pass
+    
+    return found_skills
 
-    # Add found skills to index
-    if found_skills:
-        print("\n✨ Adding skills to index...")
-        added = 0
-        for skill in found_skills:
-            existing = [s for s in index["skills"] 
-                       if s["name"] == skill["name"] and s["source"] == source_id]
-            if not existing:
-                index["skills"].append({
-                    "name": skill["name"],
-                    "source": source_id,
-                    "path": skill["path"],
-                    "categories": ["community"],
-                    "description": f"{skill['name']} skill"
-                })
-                print(f"  ✅ {skill['name']}")
-                added += 1
-            else:
-                print(f"  ⏭️ {skill['name']} (exists)")
-        if added > 0:
-            save_index(index)
-    else:
-        print("  ⚠️ No skills found")
 
+def fetch_source_changes(repo_full: str, state: Dict, known_blobs: Dict[str, str],
+                         log=print, force: bool = False) -> Dict[str, Any]:
+    """Incrementally fetch a source using its last-seen commit / tree SHA.
+    
+    1. Conditional GET of the default branch head (If-None-Match ETag);
+       304 or an identical tree SHA means the repo is skipped entirely.
+    2. One recursive tree listing finds every SKILL.md with its blob SHA.
+    3. Only SKILL.md blobs whose SHA differs from ``known_blobs``
+       (SKILL.md directory path -> blob SHA) are downloaded for their
+       description, so same-named skills in one repo never share a SHA.
+    
+    Falls back to discover_source_skills() when the tree API is unavailable.
+    Returns {"unchanged", "skills", "descriptions", "state"}; descriptions
+    are keyed by skill path.
+    """
+    client = get_client()
+    result = {"unchanged": False, "skills": [], "descriptions": {}, "state": dict(state)}
+    
+    # Step 1: has the default branch moved?
+    headers = {}
+    if state.get("etag") and not force:
+        headers["If-None-Match"] = state["etag"]
+    try:
+        head = client.get(f"repos/{repo_full}/commits/HEAD", headers=headers, timeout=15)
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        log(f"  ⚠️ Could not check latest commit ({e.__class__.__name__}), full scan...")
+        head = None
+    if head is not None and head.status == 304:
+        log(f"  ⏭️ Unchanged since {state.get('commitSha', '')[:7]} (304)")
+        result["unchanged"] = True
+        return result
+    
+    tree_sha = None
+    if head is not None and head.ok:
+        try:
+            commit = json.loads(head.stdout)
+            tree_sha = commit["commit"]["tree"]["sha"]
+            result["state"].update({
+                "commitSha": commit.get("sha", ""),
+                "treeSha": tree_sha,
+                "etag": head.headers.get("etag", ""),
+                "checkedAt": date.today().isoformat(),
+            })
+        except (json.JSONDecodeError, KeyError, TypeError):
+            tree_sha = None
+    if tree_sha and tree_sha == state.get("treeSha") and not force:
+        log(f"  ⏭️ Unchanged tree {tree_sha[:7]}")
+        result["unchanged"] = True
+        return result
+    
+    # Step 2: list every SKILL.md (with blob SHAs) from one tree call
+    tree = None
+    if tree_sha:
+        try:
+            response = client.get(f"repos/{repo_full}/git/trees/{tree_sha}", {"recursive": "1"}, timeout=30)
+            if response.ok:
+                tree = json.loads(response.stdout)
+        except (subprocess.TimeoutExpired, json.JSONDecodeError):
+            tree = None
+    if not tree or tree.get("truncated"):
+        result["skills"] = discover_source_skills(repo_full, log)
+        return result
+    
+    seen_paths = set()
+    for item in tree.get("tree", []):
+        path = item.get("path", "")
+        if item.get("type") != "blob" or not path.endswith("/SKILL.md"):
+            continue
+        parent = path[: -len("/SKILL.md")]
+        if parent in seen_paths:
+            continue
+        seen_paths.add(parent)
+        result["skills"].append({"name": parent.split("/")[-1], "path": parent, "blobSha": item.get("sha", "")})
+    log(f"  📂 Found {len(result['skills'])} skills in tree {tree_sha[:7]}")
+    
+    # Step 3: download only changed SKILL.md blobs
+    changed = [sk for sk in result["skills"] if known_blobs.get(sk["path"]) != sk["blobSha"]]
+    
+    def fetch_blob(skill: Dict) -> Optional[str]:
+        try:
+            blob = client.get_raw(f"repos/{repo_full}/git/blobs/{skill['blobSha']}", timeout=15)
+        except subprocess.TimeoutExpired:
+            return None
+        return blob.stdout if blob.ok else None
+    
+    failed = 0
+    if changed:
+        with ThreadPoolExecutor(max_workers=client.max_concurrency) as pool:
+            for skill, content in zip(changed, pool.map(fetch_blob, changed)):
+                if content is None:
+                    # Not recorded, so the blob is fetched again next time
+                    skill.pop("blobSha", None)
+                    failed += 1
+                    continue
+                desc = extract_description(content)
+                if desc:
+                    result["descriptions"][skill["path"]] = desc
+    log(f"  🔁 {len(changed)} changed SKILL.md, {len(result['skills']) - len(changed)} unchanged")
+    if failed:
+        # Keep the old commit / tree SHA so the next run lists the tree again
+        log(f"  ⚠️ {failed} SKILL.md fetches failed, will retry")
+        result["state"] = dict(state)
+    return result
+
+
+def apply_source_skills(index: Dict, source_id: str, found_skills: List[Dict], log=print,
+                        descriptions: Optional[Dict[str, str]] = None) -> int:
+    """Merge discovered skills into the in-memory index. Returns number of changed entries.
+    
+    New skills are added; existing ones get their blob SHA refreshed and
+    the description fetched from the changed SKILL.md blob, if any.
+    ``descriptions`` is keyed by skill path. A same-named skill at another
+    path in the source never overwrites the indexed entry.
+    """
+    if not found_skills:
+        log("  ⚠️ No skills found")
+        return 0
+    descriptions = descriptions or {}
+    
+    log("\n✨ Adding skills to index...")
+    existing = {(s["name"], s["source"]): s for s in index["skills"]}
+    changed = 0
+    for skill in found_skills:
+        entry = existing.get((skill["name"], source_id))
+        desc = descriptions.get(skill["path"])
+        if entry is None:
+            entry = {
+                "name": skill["name"],
+                "source": source_id,
+                "path": skill["path"],
+                "categories": ["community"],
+                "description": desc or f"{skill['name']} skill"
+            }
+            if skill.get("blobSha"):
+                entry["blobSha"] = skill["blobSha"]
+            index["skills"].append(entry)
+            existing[(skill["name"], source_id)] = entry
+            log(f"  ✅ {skill['name']}")
+            changed += 1
+            continue
+        
+        if entry.get("path") != skill["path"]:
+            log(f"  ⏭️ {skill['name']} (exists at {entry.get('path', '')})")
+            continue
+        updated = False
+        if skill.get("blobSha") and entry.get("blobSha") != skill["blobSha"]:
+            entry["blobSha"] = skill["blobSha"]
+            updated = True
+        if desc and entry.get("description") != desc:
+            entry["description"] = desc
+            updated = True
+        if updated:
+            log(f"  🔁 {skill['name']} (updated)")
+            changed += 1
+        else:
+            log(f"  ⏭️ {skill['name']} (exists)")
+    return changed
+
+
+def known_source_blobs(index: Dict, source_id: str) -> Dict[str, str]:
+    """Return {skill path: last-seen SKILL.md blob SHA} for one source."""
+    return {s.get("path", ""): s.get("blobSha", "") for s in index.get("skills", [])
+            if s.get("source") == source_id}
+
+
+def apply_refresh(index: Dict, source: Dict, changes: Dict[str, Any], log=print) -> int:
+    """Apply fetch_source_changes() output to the index. Returns number of changed entries."""
+    changed = 0
+    if not changes["unchanged"]:
+        changed = apply_source_skills(index, source["id"], changes["skills"], log, changes["descriptions"])
+    if changes["state"] and changes["state"] != source.get("refresh", {}):
+        source["refresh"] = changes["state"]
+        changed += 1
+    return changed
+
+
+def update_source_skills(index: Dict, source_id: str, repo_full: str, force: bool = False) -> None:
+    """Fetch and update skills from a source repository (incremental by tree SHA)."""
+    print("\n🔍 Searching for skills...")
+    source = next((s for s in index.get("sources", []) if s["id"] == source_id), {"id": source_id})
+    changes = fetch_source_changes(repo_full, source.get("refresh", {}),
+                                   known_source_blobs(index, source_id), force=force)
+    if apply_refresh(index, source, changes) > 0:
+        save_index(index)
 
-def update_all_sources() -> None:
-    """Update skills from all registered sources."""
+
+def update_all_sources(workers: int = REFRESH_WORKERS, force: bool = False) -> None:
+    """Update skills from all registered sources (in parallel, incremental).
+    
+    Sources are fetched concurrently; each source's log is printed as a
+    block when it finishes, and the index is written once at the end.
+    Repos whose default branch has not moved are skipped (see
+    fetch_source_changes); ``force`` ignores the stored SHAs.
+    """
     index = load_index()
     if not index:
         return
     
-    print("🔄 Updating all sources...")
-    sources = index.get("sources", [])
-    
-    for src in sources:
+    jobs = []
+    for src in index.get("sources", []):
         url = src.get("url", "")
         match = re.search(r"github\.com/([^/]+/[^/]+)", url)
         if match:
-            repo_full = match.group(1)
-            print(f"\n📦 {src['id']} ({repo_full})")
-            update_source_skills(index, src["id"], repo_full)
+            # Snapshot blob SHAs now: workers must not read the index while it is mutated
+            jobs.append((src, match.group(1), known_source_blobs(index, src["id"])))
     
-    print("\n✅ Update complete!")
+    print(f"🔄 Updating all sources ({len(jobs)} sources, {workers} workers)...")
+    
+    def refresh(job):
+        source, repo_full, known_blobs = job
+        lines = [f"\n📦 {source['id']} ({repo_full})", "\n🔍 Searching for skills..."]
+        started = time.monotonic()
+        try:
+            changes = fetch_source_changes(repo_full, source.get("refresh", {}), known_blobs,
+                                           log=lines.append, force=force)
+        except Exception as e:
+            lines.append(f"  ❌ Failed: {e}")
+            changes = {"unchanged": True, "skills": [], "descriptions": {}, "state": {}}
+        return source, changes, lines, time.monotonic() - started
+    
+    total_changed = 0
+    skipped = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(refresh, job) for job in jobs]
+        for done, future in enumerate(as_completed(futures), 1):
+            source, changes, lines, elapsed = future.result()
+            for line in lines:
+                print(line)
+            # Index mutation stays on the main thread
+            total_changed += apply_refresh(index, source, changes)
+            skipped += changes["unchanged"]
+            print(f"  ⏱️ [{done}/{len(jobs)}] {source['id']} done in {elapsed:.1f}s")
+    
+    if total_changed > 0:
+        save_index(index)
+    
+    print(f"\n✅ Update complete! ({skipped} unchanged sources skipped)")
+    misses = getattr(get_client().transport, "misses", None)
+    if misses:
+        print(f"⚠️ {len(misses)} requests had no recorded fixture (replayed as 404), e.g. {misses[0]}")
 
 
 # =============================================================================
@@ -397,16 +739,24 @@ def update_all_sources() -> None:
 
 def show_skill_info(skill_name: str) -> None:
     """Show detailed information about a skill."""
-    index = load_index()
-    if not index:
-        return
+    cache = open_index_cache()
+    if cache:
+        # Indexed lookup: only the matching rows are read
+        skills = cache.find_skills(skill_name)
+    else:
+        lookup = load_index()
+        if not lookup:
+            return
+        skills = [s for s in lookup.get("skills", []) if s["name"].lower() == skill_name.lower()]
     
     # Find skill
-    skills = [s for s in index.get("skills", []) if s["name"].lower() == skill_name.lower()]
     if not skills:
         print(f"❌ Skill not found: {skill_name}")
         # Suggest similar
-        similar = find_similar_skills(index, skill_name)
+        similar = similar_from_cache(cache, skill_name) if cache else None
+        if similar is None:
+            lookup = lookup if not cache else load_index()
+            similar = find_similar_skills(lookup, skill_name) if lookup else []
         if similar:
             print("\n💡 Did you mean:")
             for s in similar[:5]:
@@ -414,8 +764,11 @@ def show_skill_info(skill_name: str) -> None:
         return
     
     skill = skills[0]
-    sources = {s["id"]: s for s in index.get("sources", [])}
-    src = sources.get(skill.get("source"), {})
+    if cache:
+        src = cache.get_source(skill.get("source"))
+    else:
+        sources = {s["id"]: s for s in lookup.get("sources", [])}
+        src = sources.get(skill.get("source"), {})
     
     print(f"\n📦 {skill['name']}")
     print("=" * 50)
@@ -437,12 +790,8 @@ def show_skill_info(skill_name: str) -> None:
         if match:
             repo_full = match.group(1)
             try:
-                result = subprocess.run(
-                    ["gh", "api", f"repos/{repo_full}/contents/{path}/SKILL.md", 
-                     "-H", "Accept: application/vnd.github.raw"],
-                    capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0:
+                result = get_client().get_raw(f"repos/{repo_full}/contents/{path}/SKILL.md", timeout=10)
+                if result.ok:
                     print("\n" + "-" * 50)
                     # Show first 50 lines
                     lines = result.stdout.split('\n')[:50]
@@ -495,15 +844,12 @@ def install_skill(skill_name: str, target_dir: str = None) -> None:
     # Create directory
     install_path.mkdir(parents=True, exist_ok=True)
     
-    # Download files using gh CLI
+    # Download files (listing via GitHub API, files via curl)
     try:
         # Get file list
-        result = subprocess.run(
-            ["gh", "api", f"repos/{repo_full}/contents/{path}"],
-            capture_output=True, text=True, timeout=15
-        )
-        if result.returncode != 0:
-            print(f"❌ Failed to list files: {result.stderr}")
+        result = get_client().get(f"repos/{repo_full}/contents/{path}", timeout=15)
+        if not result.ok:
+            print(f"❌ Failed to list files: {result.stderr or result.stdout[:200]}")
             return
         
         items = json.loads(result.stdout)
@@ -587,49 +933,48 @@ def list_starred() -> None:
 # =============================================================================
 
 def find_similar_skills(index: Dict, skill_name: str, limit: int = 5) -> List[Dict]:
-    """Find skills similar to the given skill name or query."""
+    """Find skills similar to the given skill name or query.
+    
+    Known skills use the precomputed cosine neighbor table; anything else
+    is ranked as free text against the same TF-IDF vectors.
+    """
     skills = index.get("skills", [])
+    model = get_similarity_model(index)
     
-    # First try to find the exact skill
-    target_skill = None
-    for s in skills:
-        if s["name"].lower() == skill_name.lower():
-            target_skill = s
-            break
-    
-    if target_skill:
-        # Find by matching categories
-        target_cats = set(target_skill.get("categories", []))
-        similar = []
-        for s in skills:
-            if s["name"] != target_skill["name"]:
-                s_cats = set(s.get("categories", []))
-                overlap = len(target_cats & s_cats)
-                if overlap > 0:
-                    similar.append((overlap, s))
-        similar.sort(key=lambda x: -x[0])
-        return [s[1] for s in similar[:limit]]
-    else:
-        # Fuzzy match by name
-        query_lower = skill_name.lower()
-        similar = []
-        for s in skills:
-            name_lower = s["name"].lower()
-            # Simple similarity: count matching characters
-            score = sum(1 for c in query_lower if c in name_lower)
-            if score > 0:
-                similar.append((score, s))
-        similar.sort(key=lambda x: -x[0])
-        return [s[1] for s in similar[:limit]]
+    # First try to find the exact skill (its copies from other sources are not "similar")
+    name = skill_name.lower()
+    for doc_id, s in enumerate(skills):
+        if s["name"].lower() == name:
+            similar = [skills[d] for d, _ in model.similar(doc_id, SIMILAR_TOP_K)]
+            return [s for s in similar if s["name"].lower() != name][:limit]
+    
+    # Fuzzy match by name / text
+    return [skills[d] for d, _ in model.query(skill_name, limit)]
+
+
+def similar_from_cache(cache: IndexCache, skill_name: str, limit: int = 5) -> Optional[List[Dict]]:
+    """Similar skills read from the sidecar without loading the index.
+    
+    Returns None when the persisted model is stale (caller loads the index).
+    """
+    similar = cache.neighbors_of(skill_name, limit)
+    if similar is not None:
+        return similar
+    model = load_similarity_model()
+    if not model:
+        return None
+    return cache.get_skills([d for d, _ in model.query(skill_name, limit)])
 
 
 def show_similar(skill_name: str) -> None:
     """Show skills similar to the given skill."""
-    index = load_index()
-    if not index:
-        return
-    
-    similar = find_similar_skills(index, skill_name)
+    cache = open_index_cache()
+    similar = similar_from_cache(cache, skill_name) if cache else None
+    if similar is None:
+        index = load_index()
+        if not index:
+            return
+        similar = find_similar_skills(index, skill_name)
     if similar:
         print(f"\n💡 Skills similar to '{skill_name}':")
         for s in similar:
@@ -689,12 +1034,8 @@ def discover_new_repos(query: str) -> None:
     
     try:
         # Repository search
-        result = subprocess.run(
-            ["gh", "search", "repos", search_terms, "--json", "nameWithOwner,description,stargazersCount", "--limit", "10"],
-            capture_output=True, text=True, timeout=30
-        )
-        if result.returncode == 0:
-            repos = json.loads(result.stdout)
+        repos = get_client().search_repos(search_terms, limit=10)
+        if repos is not None:
             if repos:
                 print(f"\n📦 Found {len(repos)} repositories:")
                 for i, repo in enumerate(repos, 1):
@@ -718,7 +1059,7 @@ def discover_new_repos(query: str) -> None:
             else:
                 print("  No matching repositories found")
         else:
-            print(f"  ⚠️ Search failed: {result.stderr}")
+            print("  ⚠️ Search failed")
     except FileNotFoundError:
         print("  ⚠️ GitHub CLI (gh) not found")
     except subprocess.TimeoutExpired:
@@ -731,41 +1072,53 @@ def discover_new_repos(query: str) -> None:
 # Statistics
 # =============================================================================
 
+def compute_statistics(index: Dict[str, Any]) -> Dict[str, Any]:
+    """Return index statistics as plain data (used by --stats and --serve)."""
+    skills = index.get("skills", [])
+    
+    source_counts = {}
+    cat_counts = {}
+    for s in skills:
+        src = s.get("source", "unknown")
+        source_counts[src] = source_counts.get(src, 0) + 1
+        for cat in s.get("categories", []):
+            cat_counts[cat] = cat_counts.get(cat, 0) + 1
+    
+    return {
+        "lastUpdated": index.get("lastUpdated", "Unknown"),
+        "skills": len(skills),
+        "sources": len(index.get("sources", [])),
+        "categories": len(index.get("categories", [])),
+        "starred": len(load_stars()),
+        "bySource": dict(sorted(source_counts.items(), key=lambda x: -x[1])),
+        "byCategory": dict(sorted(cat_counts.items(), key=lambda x: -x[1])),
+    }
+
+
 def show_statistics() -> None:
     """Show skill index statistics."""
     index = load_index()
     if not index:
         return
     
-    skills = index.get("skills", [])
-    sources = index.get("sources", [])
-    categories = index.get("categories", [])
-    starred = load_stars()
+    stats = compute_statistics(index)
     
     print("\n📊 Skill Index Statistics")
     print("=" * 50)
-    print(f"📅 Last Updated: {index.get('lastUpdated', 'Unknown')}")
-    print(f"📦 Total Skills: {len(skills)}")
-    print(f"📁 Sources: {len(sources)}")
-    print(f"🏷️  Categories: {len(categories)}")
-    print(f"⭐ Starred: {len(starred)}")
+    print(f"📅 Last Updated: {stats['lastUpdated']}")
+    print(f"📦 Total Skills: {stats['skills']}")
+    print(f"📁 Sources: {stats['sources']}")
+    print(f"🏷️  Categories: {stats['categories']}")
+    print(f"⭐ Starred: {stats['starred']}")
     
     # Skills per source
     print("\n📦 Skills by Source:")
-    source_counts = {}
-    for s in skills:
-        src = s.get("source", "unknown")
-        source_counts[src] = source_counts.get(src, 0) + 1
-    for src, count in sorted(source_counts.items(), key=lambda x: -x[1]):
+    for src, count in stats["bySource"].items():
         print(f"  {src}: {count}")
     
     # Skills per category
     print("\n🏷️  Skills by Category:")
-    cat_counts = {}
-    for s in skills:
-        for cat in s.get("categories", []):
-            cat_counts[cat] = cat_counts.get(cat, 0) + 1
-    for cat, count in sorted(cat_counts.items(), key=lambda x: -x[1])[:10]:
+    for cat, count in list(stats["byCategory"].items())[:10]:
         print(f"  {cat}: {count}")
 
 
@@ -850,6 +1203,7 @@ Examples:
   %(prog)s --similar skill-name     Find similar skills
   %(prog)s --update                 Update all sources
   %(prog)s --stats                  Show statistics
+  %(prog)s --serve                  JSON-lines query server on stdin
         """
     )
     
@@ -868,6 +1222,10 @@ Examples:
     # Management arguments
     parser.add_argument("--add-source", metavar="URL", help="Add a new source repository")
     parser.add_argument("--update", action="store_true", help="Update all sources")
+    parser.add_argument("--workers", type=int, default=REFRESH_WORKERS,
+                        help=f"Parallel sources for --update (default: {REFRESH_WORKERS})")
+    parser.add_argument("--full", action="store_true",
+                        help="With --update: ignore stored commit/tree SHAs and rescan everything")
     
     # Skill actions
     parser.add_argument("--info", metavar="SKILL", help="Show skill details")
@@ -882,20 +1240,39 @@ Examples:
     parser.add_argument("--check", action="store_true", help="Check dependencies")
     parser.add_argument("--no-interactive", action="store_true", 
                         help="Disable interactive prompts (for CI/automation)")
+    parser.add_argument("--serve", action="store_true",
+                        help="Query server: read JSON-lines requests on stdin, stream JSON results")
+    parser.add_argument("--socket", metavar="PATH",
+                        help="With --serve: listen on a Unix socket instead of stdin")
+    parser.add_argument("--transport", metavar="SPEC",
+                        help="GitHub transport: auto|gh|http|record:DIR|replay:DIR "
+                             "(default: $SKILL_FINDER_TRANSPORT or auto)")
     
     args = parser.parse_args()
     
+    if args.transport:
+        configure_client(args.transport)
+    
     # Action handlers
     if args.check:
         check_dependencies()
         return
     
+    if args.serve:
+        # Deferred: query_server imports this module for the search functions
+        from query_server import serve_socket, serve_stdio
+        if args.socket:
+            serve_socket(args.socket)
+        else:
+            serve_stdio()
+        return
+    
     if args.add_source:
         add_source(args.add_source)
         return
     
     if args.update:
-        update_all_sources()
+        update_all_sources(args.workers, force=args.full)
         return
     
     if args.info:
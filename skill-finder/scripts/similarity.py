@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Precomputed "similar skills" model for Skill Finder.
+
+Features:
+- TF-IDF vectors over name character trigrams, name/description terms
+  and categories
+- Cosine top-k neighbor table per skill, persisted next to skill-index.json
+- Incremental updates: only new/changed skills (and the lists that pointed
+  at removed/changed ones) are recomputed; a full rebuild happens when a
+  large share of the index changed
+- Free-text queries ("did you mean") ranked through the same postings
+
+Author: yamapan (https://github.com/aktsmm)
+License: MIT
+"""
+
+import hashlib
+import heapq
+import marshal
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from search_index import tokenize
+
+# Bump when the on-disk layout changes so stale models are rebuilt
+FORMAT_VERSION = 1
+
+# Configuration
+TOP_K = 10               # Neighbors kept per skill
+NGRAM = 3                # Character n-gram size for names
+MAX_DF_RATIO = 0.5       # Features in more docs than this are not used for candidate lookup
+REBUILD_RATIO = 0.2      # Full rebuild when more than this share of skills changed
+CATEGORY_WEIGHT = 2.0    # Weight of a shared category vs. one shared term
+
+
+def skill_key(skill: Dict) -> str:
+    """Return the stable identity of a skill entry."""
+    return f"{skill.get('source', '')}/{skill.get('name', '')}"
+
+
+def skill_fingerprint(skill: Dict) -> str:
+    """Return a hash of the fields the vectors are built from."""
+    text = "\x1f".join([skill.get("name", ""), skill.get("description", ""),
+                        " ".join(skill.get("categories", []))])
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def text_features(name: str, text: str = "") -> Dict[str, float]:
+    """Return raw term counts for a name and free text."""
+    counts: Dict[str, float] = {}
+    padded = f" {name.lower().replace('-', ' ')} "
+    for i in range(len(padded) - NGRAM + 1):
+        gram = "g:" + padded[i:i + NGRAM]
+        counts[gram] = counts.get(gram, 0.0) + 1.0
+    for term in tokenize(f"{name} {text}"):
+        key = "t:" + term
+        counts[key] = counts.get(key, 0.0) + 1.0
+    return counts
+
+
+def skill_features(skill: Dict) -> Dict[str, float]:
+    """Return raw feature counts for a skill entry."""
+    counts = text_features(skill.get("name", ""), skill.get("description", ""))
+    for cat in skill.get("categories", []):
+        counts["c:" + cat.lower()] = CATEGORY_WEIGHT
+    return counts
+
+
+class SimilarityModel:
+    """TF-IDF vectors plus a cosine top-k neighbor table.
+
+    Document IDs are positions in ``index["skills"]`` at build time.
+    """
+
+    def __init__(self, data: Dict):
+        self.signature = data.get("signature")
+        self.keys: List[str] = data["keys"]
+        self.fingerprints: List[str] = data["fingerprints"]
+        self.df: Dict[str, int] = data["df"]
+        self.vectors: List[Dict[str, float]] = data["vectors"]
+        self.neighbors: List[List[Tuple[int, float]]] = data["neighbors"]
+        self._postings: Optional[Dict[str, List[Tuple[int, float]]]] = None
+
+    @property
+    def doc_count(self) -> int:
+        return len(self.keys)
+
+    # -------------------------------------------------------------------------
+    # Vectors
+    # -------------------------------------------------------------------------
+
+    def _idf(self, feature: str) -> float:
+        return math.log(1 + self.doc_count / (1 + self.df.get(feature, 0)))
+
+    def vectorize(self, counts: Dict[str, float]) -> Dict[str, float]:
+        """Return the L2-normalized TF-IDF vector of raw counts."""
+        vec = {f: (1 + math.log(c)) * self._idf(f) for f, c in counts.items() if c > 0}
+        norm = math.sqrt(sum(w * w for w in vec.values())) or 1.0
+        return {f: w / norm for f, w in vec.items()}
+
+    def postings(self) -> Dict[str, List[Tuple[int, float]]]:
+        """Return feature -> [(doc_id, weight)], skipping very common features."""
+        if self._postings is None:
+            max_df = max(2, int(self.doc_count * MAX_DF_RATIO))
+            postings: Dict[str, List[Tuple[int, float]]] = {}
+            for doc_id, vec in enumerate(self.vectors):
+                for feature, weight in vec.items():
+                    if self.df.get(feature, 0) <= max_df:
+                        postings.setdefault(feature, []).append((doc_id, weight))
+            self._postings = postings
+        return self._postings
+
+    def _scores(self, vec: Dict[str, float]) -> Dict[int, float]:
+        postings = self.postings()
+        scores: Dict[int, float] = {}
+        for feature, weight in vec.items():
+            for doc_id, doc_weight in postings.get(feature, ()):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * doc_weight
+        return scores
+
+    def _top(self, scores: Dict[int, float], limit: int, exclude: Optional[int] = None) -> List[Tuple[int, float]]:
+        items = ((d, s) for d, s in scores.items() if d != exclude and s > 0)
+        return [(d, round(s, 6)) for d, s in heapq.nlargest(limit, items, key=lambda x: (x[1], -x[0]))]
+
+    # -------------------------------------------------------------------------
+    # Build / update
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, skills: List[Dict], signature: Optional[List[int]] = None) -> "SimilarityModel":
+        """Build vectors and the full neighbor table."""
+        model = cls._with_vectors(skills, signature)
+        model.neighbors = [model._top(model._scores(vec), TOP_K, exclude=i)
+                           for i, vec in enumerate(model.vectors)]
+        return model
+
+    @classmethod
+    def _with_vectors(cls, skills: List[Dict], signature: Optional[List[int]]) -> "SimilarityModel":
+        raw = [skill_features(s) for s in skills]
+        df: Dict[str, int] = {}
+        for counts in raw:
+            for feature in counts:
+                df[feature] = df.get(feature, 0) + 1
+        model = cls({
+            "signature": signature,
+            "keys": [skill_key(s) for s in skills],
+            "fingerprints": [skill_fingerprint(s) for s in skills],
+            "df": df,
+            "vectors": [],
+            "neighbors": [],
+        })
+        model.vectors = [model.vectorize(counts) for counts in raw]
+        return model
+
+    def update(self, skills: List[Dict], signature: Optional[List[int]] = None) -> "SimilarityModel":
+        """Return a model for ``skills``, recomputing only what changed.
+
+        Vectors are re-weighted with fresh document frequencies (cheap), but
+        neighbor lists are only recomputed for new/changed skills and for
+        skills whose list referenced a removed/changed one; other lists just
+        absorb the changed skills if they now rank in their top-k.
+        """
+        old_pos = {key: i for i, key in enumerate(self.keys)}
+        new_keys = [skill_key(s) for s in skills]
+        new_fps = [skill_fingerprint(s) for s in skills]
+
+        dirty = set()
+        remap: Dict[int, int] = {}
+        for new_id, (key, fp) in enumerate(zip(new_keys, new_fps)):
+            old_id = old_pos.get(key)
+            if old_id is None or self.fingerprints[old_id] != fp:
+                dirty.add(new_id)
+            else:
+                remap[old_id] = new_id
+        removed = len(self.keys) - len(remap)
+        if not skills or (len(dirty) + removed) > REBUILD_RATIO * len(skills):
+            return SimilarityModel.build(skills, signature)
+
+        model = SimilarityModel._with_vectors(skills, signature)
+        neighbors: List[Optional[List[Tuple[int, float]]]] = [None] * len(skills)
+        for old_id, new_id in remap.items():
+            old_list = self.neighbors[old_id]
+            mapped = [(remap[d], s) for d, s in old_list if d in remap]
+            if len(mapped) == len(old_list):
+                neighbors[new_id] = mapped
+            else:
+                dirty.add(new_id)  # Lost a neighbor: recompute the whole list
+        for doc_id in dirty:
+            neighbors[doc_id] = None
+
+        for doc_id in sorted(dirty):
+            scores = model._scores(model.vectors[doc_id])
+            neighbors[doc_id] = model._top(scores, TOP_K, exclude=doc_id)
+            # Cosine is symmetric: offer this doc to every clean list it scores in
+            for other_id, score in scores.items():
+                other = neighbors[other_id]
+                if other_id == doc_id or other_id in dirty or other is None:
+                    continue
+                if len(other) < TOP_K or score > other[-1][1]:
+                    merged = [(d, s) for d, s in other if d != doc_id] + [(doc_id, round(score, 6))]
+                    merged.sort(key=lambda x: (-x[1], x[0]))
+                    neighbors[other_id] = merged[:TOP_K]
+        model.neighbors = neighbors
+        return model
+
+    # -------------------------------------------------------------------------
+    # Persist
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SimilarityModel"]:
+        """Load a persisted model, or None if missing / incompatible."""
+        try:
+            with open(path, "rb") as f:
+                data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(data, dict) or data.get("format") != FORMAT_VERSION:
+            return None
+        return cls(data)
+
+    def save(self, path: Path) -> None:
+        """Persist the model (written to a temp file, then swapped in)."""
+        data = {
+            "format": FORMAT_VERSION,
+            "signature": self.signature,
+            "keys": self.keys,
+            "fingerprints": self.fingerprints,
+            "df": self.df,
+            "vectors": self.vectors,
+            "neighbors": self.neighbors,
+        }
+        tmp_path = Path(f"{path}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            marshal.dump(data, f)
+        os.replace(tmp_path, path)
+
+    # -------------------------------------------------------------------------
+    # Query
+    # -------------------------------------------------------------------------
+
+    def similar(self, doc_id: int, limit: int = 5) -> List[Tuple[int, float]]:
+        """Return precomputed neighbors of a skill."""
+        return self.neighbors[doc_id][:limit]
+
+    def query(self, text: str, limit: int = 5) -> List[Tuple[int, float]]:
+        """Rank skills against free text (e.g. a misspelled skill name)."""
+        vec = self.vectorize(text_features(text.strip()))
+        return self._top(self._scores(vec), limit)
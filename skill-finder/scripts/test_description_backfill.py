@@ -0,0 +1,82 @@
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import description_backfill as backfill  # noqa: E402
+from benchmark_refresh import put_fixture  # noqa: E402
+from github_api import RAW_ACCEPT, configure_client  # noqa: E402
+
+
+def select(index):
+    return [{"key": s["name"], "skill": s, "repo": "o/r", "paths": [f"{s['path']}/SKILL.md"], "blobSha": s["blobSha"]}
+            for s in index["skills"] if backfill.needs_description(s)]
+
+
+def apply(skill, description):
+    skill["description"] = description
+
+
+class DescriptionBackfillTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.work_dir = Path(tmpdir.name)
+        self.index_path = self.work_dir / "skill-index.json"
+        for name, value in (("INDEX_PATH", self.index_path), ("CHECKPOINT_DIR", self.work_dir)):
+            patcher = mock.patch.object(backfill, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        index = {
+            "lastUpdated": "2026-01-01",
+            "skills": [{"name": n, "source": "s", "path": f"skills/{n}", "blobSha": f"b-{n}", "description": f"{n} skill"}
+                       for n in ("a", "b", "c")],
+        }
+        self.index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    def test_resume_fetches_only_what_the_checkpoint_lacks(self):
+        put_fixture(self.work_dir, "repos/o/r/git/blobs/b-c", "---\ndescription: Fetched C\n---\n",
+                    headers={"Accept": RAW_ACCEPT})
+        ckpt = backfill.checkpoint_path("test")
+        ckpt.write_text(
+            json.dumps({"key": "a", "description": "Checkpointed A"}) + "\n"
+            + json.dumps({"key": "b", "description": None}) + "\n"
+            + '{"key": "c", "descr',  # Torn line from an interrupted run
+            encoding="utf-8",
+        )
+        client = configure_client(f"replay:{self.work_dir}")
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            backfill.run_backfill("test", select, apply, workers=2)
+
+        self.assertIn("Resuming: 2 of 3 already fetched", out.getvalue())
+        self.assertEqual(client.request_count, 1)
+        self.assertEqual(client.transport.misses, [])
+        index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        self.assertEqual([s["description"] for s in index["skills"]], ["Checkpointed A", "b skill", "Fetched C"])
+        self.assertEqual(index["lastUpdated"], date.today().isoformat())
+        self.assertFalse(ckpt.exists())  # Removed once every task finished
+
+    def test_failed_fetch_keeps_the_checkpoint_for_the_next_run(self):
+        put_fixture(self.work_dir, "repos/o/r/git/blobs/b-a", "---\ndescription: Fetched A\n---\n",
+                    headers={"Accept": RAW_ACCEPT})
+        put_fixture(self.work_dir, "repos/o/r/git/blobs/b-b", "", headers={"Accept": RAW_ACCEPT}, status=502)
+        configure_client(f"replay:{self.work_dir}")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            backfill.run_backfill("test", select, apply, workers=2)
+
+        done = backfill.load_checkpoint(backfill.checkpoint_path("test"))
+        self.assertEqual(done, {"a": "Fetched A", "c": None})  # "b" is retried next run
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import search_skills as sf  # noqa: E402
+from benchmark_refresh import isolated_index  # noqa: E402
+from index_cache import IndexCache  # noqa: E402
+
+
+def make_index(*names):
+    return {
+        "version": "1.0",
+        "lastUpdated": "2026-01-01",
+        "sources": [{"id": "s", "name": "o/r", "url": "https://github.com/o/r"}],
+        "categories": [],
+        "skills": [{"name": n, "source": "s", "path": f"skills/{n}", "categories": [], "description": f"{n} skill"}
+                   for n in names],
+    }
+
+
+class IndexCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.work_dir = Path(tmpdir.name)
+        self.index_path = self.work_dir / "skill-index.json"
+        self.cache_path = self.work_dir / ".skill-index.cache.sqlite"
+
+    def write_json(self, index):
+        self.index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+
+    def test_changed_json_makes_the_sidecar_stale(self):
+        self.write_json(make_index("pdf", "docx"))
+        cache = IndexCache(self.cache_path, self.index_path)
+        self.addCleanup(cache.close)
+        self.assertTrue(cache.ensure_fresh())
+        self.assertTrue(cache.is_fresh())
+
+        self.write_json(make_index("pdf", "docx", "pptx"))
+        self.assertFalse(cache.is_fresh())
+        self.assertTrue(cache.ensure_fresh())
+        self.assertEqual([s["name"] for s in cache.load_index()["skills"]], ["pdf", "docx", "pptx"])
+        self.assertEqual(cache.find_skills("PPTX")[0]["path"], "skills/pptx")
+
+    def test_touched_json_with_same_content_is_not_recompiled(self):
+        self.write_json(make_index("pdf"))
+        cache = IndexCache(self.cache_path, self.index_path)
+        self.addCleanup(cache.close)
+        cache.ensure_fresh()
+        st = os.stat(self.index_path)
+        os.utime(self.index_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        self.assertTrue(cache.is_fresh())  # Verified by SHA-256, mtime re-recorded
+        self.assertEqual(cache._meta("mtime_ns"), st.st_mtime_ns + 10**9)
+
+    def test_same_size_edit_is_detected_by_hash(self):
+        self.write_json(make_index("pdf"))
+        cache = IndexCache(self.cache_path, self.index_path)
+        self.addCleanup(cache.close)
+        cache.ensure_fresh()
+        self.write_json(make_index("pdg"))
+
+        self.assertFalse(cache.is_fresh())
+
+    def test_corrupt_blob_falls_back_to_json_and_recompiles(self):
+        index = make_index("pdf", "docx")
+        with isolated_index(self.work_dir, index), contextlib.redirect_stdout(io.StringIO()):
+            cache = IndexCache(sf.INDEX_CACHE_PATH, sf.INDEX_PATH)
+            cache.rebuild(index)
+            cache.close()
+            with sqlite3.connect(sf.INDEX_CACHE_PATH) as conn:
+                conn.execute("UPDATE meta SET value = ? WHERE key = 'index_blob'", (b"\x00garbage",))
+            conn.close()
+
+            loaded = sf.load_index()
+
+            cache = IndexCache(sf.INDEX_CACHE_PATH, sf.INDEX_PATH)
+            self.addCleanup(cache.close)
+            self.assertEqual(loaded, index)
+            self.assertTrue(cache.is_fresh())
+            self.assertEqual(cache.load_index(), index)
+
+
+if __name__ == "__main__":
+    unittest.main()
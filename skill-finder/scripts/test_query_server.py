@@ -0,0 +1,69 @@
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import search_skills as sf  # noqa: E402
+from benchmark_refresh import isolated_index  # noqa: E402
+from query_server import serve_stdio  # noqa: E402
+
+
+INDEX = {
+    "version": "1.0",
+    "lastUpdated": "2026-01-01",
+    "sources": [{"id": "s", "name": "o/r", "url": "https://github.com/o/r"}],
+    "categories": [],
+    "skills": [
+        {"name": "pdf", "source": "s", "path": "skills/pdf", "categories": ["document"], "description": "Fill PDF forms"},
+        {"name": "docx", "source": "s", "path": "skills/docx", "categories": ["document"], "description": "Word files"},
+    ],
+}
+
+
+class QueryServerTests(unittest.TestCase):
+    def serve(self, *lines):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            work_dir = Path(tmpdir)
+            stdout = io.StringIO()
+            with isolated_index(work_dir, INDEX), mock.patch.object(sf, "STARS_PATH", work_dir / "stars.json"), \
+                    contextlib.redirect_stdout(io.StringIO()):
+                serve_stdio(io.StringIO("".join(line + "\n" for line in lines)), stdout)
+        return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_batch_streams_results_in_order_with_errors_inline(self):
+        batch = [
+            {"id": 1, "op": "search", "query": "pdf"},
+            {"id": 2, "op": "explode"},
+            "not an object",
+            {"id": 3, "op": "info", "name": "DOCX"},
+        ]
+        responses = self.serve(json.dumps(batch), "{broken", json.dumps({"id": 4, "op": "ping"}))
+
+        self.assertEqual(len(responses), 6)
+        search, unknown, not_object, info, invalid, ping = responses
+        self.assertEqual((search["id"], search["ok"]), (1, True))
+        self.assertEqual([s["name"] for s in search["result"]["skills"]], ["pdf"])
+        self.assertEqual(unknown, {"id": 2, "op": "explode", "ok": False, "error": "unknown op: explode"})
+        self.assertEqual(not_object, {"ok": False, "error": "request must be a JSON object"})
+        self.assertEqual(info["result"]["skill"]["url"], "https://github.com/o/r/tree/main/skills/docx")
+        self.assertFalse(invalid["ok"])
+        self.assertTrue(invalid["error"].startswith("invalid JSON:"))
+        self.assertEqual(ping["result"], {"skills": 2, "lastUpdated": "2026-01-01"})
+
+    def test_handler_exception_becomes_an_error_line(self):
+        with mock.patch.object(sf, "compute_statistics", side_effect=RuntimeError("boom")):
+            responses = self.serve(json.dumps([{"id": 1, "op": "stats"}, {"id": 2, "op": "ping"}]))
+
+        self.assertEqual(responses[0], {"id": 1, "op": "stats", "ok": False, "error": "RuntimeError: boom"})
+        self.assertTrue(responses[1]["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
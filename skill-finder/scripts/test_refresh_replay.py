@@ -0,0 +1,103 @@
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import search_skills as sf  # noqa: E402
+from benchmark_refresh import build_fixtures, isolated_index, put_fixture  # noqa: E402
+from github_api import RAW_ACCEPT, configure_client  # noqa: E402
+
+
+class RefreshReplayTests(unittest.TestCase):
+    def test_full_refresh_then_incremental_rerun_from_fixtures(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            work_dir = Path(tmpdir)
+            fixture_dir = work_dir / "fixtures"
+            index = build_fixtures(fixture_dir, sources=3, skills=4)
+
+            with isolated_index(work_dir, index) as index_path:
+                client = configure_client(f"replay:{fixture_dir}")
+                with contextlib.redirect_stdout(io.StringIO()):
+                    sf.update_all_sources(workers=3)
+                first = json.loads(index_path.read_text(encoding="utf-8"))
+
+                rerun = configure_client(f"replay:{fixture_dir}")
+                with contextlib.redirect_stdout(io.StringIO()):
+                    sf.update_all_sources(workers=3)
+                second = json.loads(index_path.read_text(encoding="utf-8"))
+
+            self.assertEqual(client.transport.misses, [])
+            self.assertEqual(len(first["skills"]), 12)
+            descriptions = {s["name"]: s["description"] for s in first["skills"]}
+            self.assertEqual(descriptions["skill-2-3"], "Synthetic skill 3 of repo 2")
+            self.assertTrue(all(s["refresh"]["treeSha"] for s in first["sources"]))
+            self.assertEqual(rerun.request_count, 3)  # One 304 per source
+            self.assertEqual(rerun.transport.misses, [])
+            self.assertEqual(second["skills"], first["skills"])
+
+    def test_changed_blob_updates_description_and_failed_fetch_is_retried(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fixture_dir = Path(tmpdir)
+            head = {"sha": "c2", "commit": {"tree": {"sha": "t2"}}}
+            put_fixture(fixture_dir, "repos/o/r/commits/HEAD", head,
+                        headers={"If-None-Match": '"e1"'}, resp_headers={"etag": '"e2"'})
+            tree = [{"path": "skills/a/SKILL.md", "type": "blob", "sha": "b1"},
+                    {"path": "skills/b/SKILL.md", "type": "blob", "sha": "b2"}]
+            put_fixture(fixture_dir, "repos/o/r/git/trees/t2", {"tree": tree}, params={"recursive": "1"})
+            put_fixture(fixture_dir, "repos/o/r/git/blobs/b1", "---\ndescription: New description\n---\n",
+                        headers={"Accept": RAW_ACCEPT})
+            index = {
+                "skills": [
+                    {"name": "a", "source": "s", "path": "skills/a", "description": "Old description", "blobSha": "b0"},
+                    {"name": "b", "source": "s", "path": "skills/b", "description": "B", "blobSha": "bx"},
+                ],
+                "sources": [{"id": "s", "refresh": {"etag": '"e1"', "treeSha": "t1"}}],
+            }
+            source = index["sources"][0]
+            configure_client(f"replay:{fixture_dir}")
+
+            changes = sf.fetch_source_changes("o/r", source["refresh"], sf.known_source_blobs(index, "s"),
+                                              log=lambda line: None)
+            sf.apply_refresh(index, source, changes, log=lambda line: None)
+
+            skill_a, skill_b = index["skills"]
+            self.assertEqual((skill_a["description"], skill_a["blobSha"]), ("New description", "b1"))
+            self.assertEqual(skill_b["blobSha"], "bx")  # Blob b2 had no fixture: not recorded
+            self.assertEqual(source["refresh"], {"etag": '"e1"', "treeSha": "t1"})
+
+    def test_same_named_skills_keep_their_own_blob_sha(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fixture_dir = Path(tmpdir)
+            head = {"sha": "c2", "commit": {"tree": {"sha": "t2"}}}
+            put_fixture(fixture_dir, "repos/o/r/commits/HEAD", head, resp_headers={"etag": '"e2"'})
+            tree = [{"path": "skills/pdf/SKILL.md", "type": "blob", "sha": "b1"},
+                    {"path": "legacy/pdf/SKILL.md", "type": "blob", "sha": "b2"}]
+            put_fixture(fixture_dir, "repos/o/r/git/trees/t2", {"tree": tree}, params={"recursive": "1"})
+            put_fixture(fixture_dir, "repos/o/r/git/blobs/b2", "---\ndescription: Legacy PDF\n---\n",
+                        headers={"Accept": RAW_ACCEPT})
+            index = {
+                "skills": [{"name": "pdf", "source": "s", "path": "skills/pdf", "description": "PDF", "blobSha": "b1"}],
+                "sources": [{"id": "s", "refresh": {"treeSha": "t1"}}],
+            }
+            source = index["sources"][0]
+            client = configure_client(f"replay:{fixture_dir}")
+
+            changes = sf.fetch_source_changes("o/r", source["refresh"], sf.known_source_blobs(index, "s"),
+                                              log=lambda line: None)
+            sf.apply_refresh(index, source, changes, log=lambda line: None)
+
+            self.assertEqual(client.transport.misses, [])  # Blob b1 is unchanged: never fetched
+            self.assertEqual(changes["descriptions"], {"legacy/pdf": "Legacy PDF"})
+            self.assertEqual(index["skills"], [
+                {"name": "pdf", "source": "s", "path": "skills/pdf", "description": "PDF", "blobSha": "b1"},
+            ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from search_index import SearchIndex  # noqa: E402
+
+
+SKILLS = [
+    {"name": "pdf", "source": "s", "categories": ["document"], "description": "Read and fill forms"},
+    {"name": "forms", "source": "s", "categories": [], "description": "Fill PDF forms"},
+    {"name": "merger", "source": "s", "categories": [], "description": "Merge pdfs into one file"},
+    {"name": "rdkit", "source": "s", "categories": ["science"], "description": "Molecular descriptors"},
+    {"name": "pptx", "source": "s", "categories": [], "description": "PowerPoint decks"},
+    {"name": "superpowers", "source": "s", "categories": [], "description": "Skill workflow"},
+    {"name": "slides-ja", "source": "t", "categories": [], "description": "スライドを作成する"},
+]
+
+
+def ranked(engine: SearchIndex, query: str):
+    scores = engine.search(query)
+    return [SKILLS[doc_id]["name"] for doc_id in sorted(scores, key=lambda d: (-scores[d], d))]
+
+
+class SearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = SearchIndex.build(SKILLS)
+
+    def test_exact_hits_rank_above_prefix_hits(self):
+        # Name hit > description hit > prefix hit ("pdfs")
+        self.assertEqual(ranked(self.engine, "pdf"), ["pdf", "forms", "merger"])
+
+    def test_every_query_word_must_match(self):
+        self.assertEqual(ranked(self.engine, "fill pdf"), ["pdf", "forms"])
+        self.assertEqual(ranked(self.engine, "pdf nothing"), [])
+
+    def test_infix_only_when_no_word_starts_with_the_term(self):
+        self.assertEqual(ranked(self.engine, "script"), ["rdkit"])
+        # "powerpoint" starts with "power", so "superpowers" is not an infix hit
+        self.assertEqual(ranked(self.engine, "power"), ["pptx"])
+
+    def test_cjk_bigrams(self):
+        self.assertEqual(ranked(self.engine, "作成"), ["slides-ja"])
+        self.assertEqual(ranked(self.engine, "スライド"), ["slides-ja"])
+        self.assertEqual(ranked(self.engine, "成"), ["slides-ja"])
+        self.assertEqual(ranked(self.engine, "作品"), [])
+
+    def test_save_and_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "search.bin"
+            self.engine.save(path)
+            loaded = SearchIndex.load(path)
+        self.assertEqual(loaded.search("pdf"), self.engine.search("pdf"))
+        self.assertEqual(loaded.with_source("t"), [6])
+
+
+if __name__ == "__main__":
+    unittest.main()
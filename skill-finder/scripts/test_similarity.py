@@ -0,0 +1,58 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from similarity import SimilarityModel, TOP_K  # noqa: E402
+
+
+TOPICS = ["pdf", "excel", "slides", "azure", "kubernetes", "docker", "react", "rust", "sql", "git",
+          "python", "latex", "figma", "jira", "slack", "redis", "graphql", "terraform", "pandas", "vue"]
+
+
+def make_skills():
+    return [{"name": f"{topic}-helper", "source": "s", "categories": [],
+             "description": f"Work with {topic} files and projects"} for topic in TOPICS]
+
+
+class SimilarityModelTests(unittest.TestCase):
+    def test_incremental_add_matches_full_rebuild_for_the_new_skill(self):
+        skills = make_skills()
+        model = SimilarityModel.build(skills)
+        added = skills + [{"name": "pdf-forms", "source": "s", "categories": [],
+                           "description": "Fill pdf forms"}]
+
+        # One new skill is far below REBUILD_RATIO: must not fall back to build()
+        with mock.patch.object(SimilarityModel, "build", side_effect=AssertionError("full rebuild")):
+            updated = model.update(added)
+
+        new_id = len(skills)
+        full = SimilarityModel.build(added)
+        self.assertEqual(updated.keys, full.keys)
+        self.assertEqual(updated.similar(new_id, TOP_K), full.similar(new_id, TOP_K))
+        self.assertEqual(updated.similar(new_id, 1)[0][0], TOPICS.index("pdf"))
+        # Cosine is symmetric: the existing pdf skill now lists the new one first
+        self.assertEqual(updated.similar(TOPICS.index("pdf"), 1)[0][0], new_id)
+
+    def test_removed_neighbor_is_dropped_from_remaining_lists(self):
+        skills = make_skills() + [{"name": "pdf-forms", "source": "s", "categories": [],
+                                   "description": "Fill pdf forms"}]
+        model = SimilarityModel.build(skills)
+        remaining = skills[:-1]
+
+        updated = model.update(remaining)
+
+        self.assertEqual(updated.doc_count, len(remaining))
+        for neighbors in updated.neighbors:
+            self.assertTrue(all(doc_id < len(remaining) for doc_id, _ in neighbors))
+
+    def test_query_ranks_misspelled_name(self):
+        model = SimilarityModel.build(make_skills())
+        self.assertEqual(model.query("kubernets", limit=1)[0][0], TOPICS.index("kubernetes"))
+
+
+if __name__ == "__main__":
+    unittest.main()
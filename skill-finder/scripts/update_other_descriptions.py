@@ -1,17 +1,17 @@
 #!/usr/bin/env python3
 """
 Fetch descriptions from various GitHub repositories and update skill-index.json
+
+Runs as a resumable, concurrent backfill (see description_backfill.py).
+Network access goes through github_api (set SKILL_FINDER_TRANSPORT to
+choose gh / http / record:DIR / replay:DIR).
 """
 
-import json
-import subprocess
+import argparse
 import re
-import time
-from pathlib import Path
+from typing import Dict, List, Optional
 
-# Paths
-SCRIPT_DIR = Path(__file__).parent
-INDEX_PATH = SCRIPT_DIR / ".." / "references" / "skill-index.json"
+from description_backfill import DEFAULT_WORKERS, extract_description, needs_description, run_backfill, truncate
 
 # Source configurations: (source_id, owner, repo, skill_path_prefix)
 SOURCES = [
@@ -23,121 +23,66 @@ SOURCES = [
 ]
 
 
-def get_skill_description(owner: str, repo: str, skill_path: str) -> str | None:
-    """Fetch description from SKILL.md frontmatter"""
-    try:
-        # Try SKILL.md first
-        result = subprocess.run(
-            [
-                "gh", "api",
-                f"repos/{owner}/{repo}/contents/{skill_path}/SKILL.md",
-                "-H", "Accept: application/vnd.github.raw"
-            ],
-            capture_output=True,
-            timeout=30,
-            encoding='utf-8',
-            errors='replace'
-        )
-        
-        if result.returncode != 0:
-            # Try README.md as fallback
-            result = subprocess.run(
-                [
-                    "gh", "api",
-                    f"repos/{owner}/{repo}/contents/{skill_path}/README.md",
-                    "-H", "Accept: application/vnd.github.raw"
-                ],
-                capture_output=True,
-                timeout=30,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            if result.returncode != 0:
-                return None
-        
-        content = result.stdout
-        
-        # Extract description from YAML frontmatter
-        match = re.search(r'^description:\s*["\']?(.+?)["\']?\s*$', content, re.MULTILINE)
-        if match:
-            desc = match.group(1).strip()
-            # Remove trailing quote if present
-            desc = desc.rstrip('"\'')
-            # Truncate if too long
-            if len(desc) > 100:
-                desc = desc[:97] + "..."
-            return desc
-        
-        # Fallback: try to get first sentence after # heading
-        match = re.search(r'^#\s+.+?\n+(.+?)\.', content, re.MULTILINE)
-        if match:
-            desc = match.group(1).strip()
-            if len(desc) > 100:
-                desc = desc[:97] + "..."
-            return desc
-        
-        return None
-        
-    except subprocess.TimeoutExpired:
-        return None
-    except Exception as e:
-        print(f"    Error: {e}")
-        return None
+def parse_description(content: str) -> Optional[str]:
+    """Extract description from SKILL.md frontmatter (README.md heading as fallback)"""
+    desc = extract_description(content)
+    if desc:
+        return desc
+    
+    # Fallback: try to get first sentence after # heading
+    match = re.search(r'^#\s+.+?\n+(.+?)\.', content, re.MULTILINE)
+    if match:
+        return truncate(match.group(1).strip())
+    
+    return None
 
 
-def main():
-    # Load index
-    with open(INDEX_PATH, "r", encoding="utf-8") as f:
-        index = json.load(f)
-    
+def select_tasks(index: Dict) -> List[Dict]:
+    """Skills that still have a placeholder description"""
     # Create source lookup
     source_lookup = {s["id"]: s for s in index["sources"]}
     
-    updated = 0
-    skipped = 0
-    
+    tasks = []
     for skill in index["skills"]:
-        current_desc = skill.get("description", "")
-        
         # Skip if already has a good description
-        if current_desc and not current_desc.endswith(" skill"):
-            skipped += 1
+        if not needs_description(skill):
             continue
         
         source_id = skill.get("source")
         source = source_lookup.get(source_id)
-        
         if not source:
             continue
         
         # Parse owner/repo from source URL
-        url = source.get("url", "")
-        match = re.search(r'github\.com/([^/]+)/([^/]+)', url)
+        match = re.search(r'github\.com/([^/]+)/([^/]+)', source.get("url", ""))
         if not match:
             continue
         
         owner, repo = match.groups()
         skill_path = skill.get("path", skill["name"])
-        
-        print(f"Fetching: {source_id}/{skill['name']}...")
-        desc = get_skill_description(owner, repo, skill_path)
-        
-        if desc:
-            skill["description"] = desc
-            print(f"  OK: {desc[:60]}...")
-            updated += 1
-        else:
-            print(f"  SKIP: {current_desc}")
-        
-        # Rate limiting
-        time.sleep(0.3)
-    
-    # Save updated index
-    with open(INDEX_PATH, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+        tasks.append({
+            "key": f"{source_id}/{skill['name']}",
+            "skill": skill,
+            "repo": f"{owner}/{repo}",
+            # Try SKILL.md first, README.md as fallback
+            "paths": [f"{skill_path}/SKILL.md", f"{skill_path}/README.md"],
+            "blobSha": skill.get("blobSha"),
+        })
+    return tasks
+
+
+def apply_description(skill: Dict, desc: str) -> None:
+    skill["description"] = desc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill skill descriptions from GitHub")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent fetches")
+    parser.add_argument("--restart", action="store_true", help="Discard checkpoint and start over")
+    args = parser.parse_args()
     
-    print(f"\nUpdated {updated} skills, skipped {skipped}")
+    run_backfill("other", select_tasks, apply_description, parse_description,
+                 workers=args.workers, restart=args.restart)
 
 
 if __name__ == "__main__":
@@ -2,101 +2,58 @@
 """
 Fetch descriptions from K-Dense-AI/claude-scientific-skills SKILL.md files
 and update skill-index.json
+
+Runs as a resumable, concurrent backfill (see description_backfill.py).
+Network access goes through github_api (set SKILL_FINDER_TRANSPORT to
+choose gh / http / record:DIR / replay:DIR).
 """
 
-import json
-import subprocess
-import re
-import time
-from pathlib import Path
+import argparse
+from typing import Dict, List
 
-# Paths
-SCRIPT_DIR = Path(__file__).parent
-INDEX_PATH = SCRIPT_DIR / ".." / "references" / "skill-index.json"
+from description_backfill import DEFAULT_WORKERS, needs_description, run_backfill
 
-def get_skill_description(skill_name: str) -> str | None:
-    """Fetch description from SKILL.md frontmatter"""
-    try:
-        result = subprocess.run(
-            [
-                "gh", "api",
-                f"repos/K-Dense-AI/claude-scientific-skills/contents/scientific-skills/{skill_name}/SKILL.md",
-                "-H", "Accept: application/vnd.github.raw"
-            ],
-            capture_output=True,
-            timeout=30,
-            encoding='utf-8',
-            errors='replace'
-        )
-        
-        if result.returncode != 0:
-            print(f"  ⚠️ Failed to fetch {skill_name}: {result.stderr[:100]}")
-            return None
-        
-        content = result.stdout
-        
-        # Extract description from YAML frontmatter
-        # Pattern: description: "..." or description: '...' or description: ...
-        match = re.search(r'^description:\s*["\']?(.+?)["\']?\s*$', content, re.MULTILINE)
-        if match:
-            desc = match.group(1).strip()
-            # Truncate if too long
-            if len(desc) > 100:
-                desc = desc[:97] + "..."
-            return desc
-        
-        return None
-        
-    except subprocess.TimeoutExpired:
-        print(f"  ⚠️ Timeout fetching {skill_name}")
-        return None
-    except Exception as e:
-        print(f"  ⚠️ Error fetching {skill_name}: {e}")
-        return None
+SOURCE_ID = "claude-scientific-skills"
+REPO = "K-Dense-AI/claude-scientific-skills"
 
 
-def main():
-    # Load index
-    with open(INDEX_PATH, "r", encoding="utf-8") as f:
-        index = json.load(f)
-    
-    # Find all claude-scientific-skills skills
-    updated = 0
-    skipped = 0
-    
+def select_tasks(index: Dict) -> List[Dict]:
+    """claude-scientific-skills entries that still have a placeholder description"""
+    tasks = []
     for skill in index["skills"]:
-        if skill.get("source") != "claude-scientific-skills":
+        if skill.get("source") != SOURCE_ID:
             continue
         
-        name = skill["name"]
-        current_desc = skill.get("description", "")
-        
         # Skip if already has a good description (not "xxx skill" pattern)
-        if current_desc and not current_desc.endswith(" skill"):
-            skipped += 1
+        if not needs_description(skill):
             continue
         
-        print(f"Fetching: {name}...")
-        desc = get_skill_description(name)
-        
-        if desc:
-            skill["description"] = desc
-            # Also update categories based on description keywords
-            if "community" in skill.get("categories", []):
-                skill["categories"] = infer_categories(name, desc)
-            print(f"  OK: {desc[:60]}...")
-            updated += 1
-        else:
-            print(f"  SKIP: {current_desc}")
-        
-        # Rate limiting - 1 request per 0.5 seconds
-        time.sleep(0.5)
-    
-    # Save updated index
-    with open(INDEX_PATH, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+        name = skill["name"]
+        tasks.append({
+            "key": f"{SOURCE_ID}/{name}",
+            "skill": skill,
+            "repo": REPO,
+            "paths": [f"scientific-skills/{name}/SKILL.md"],
+            "blobSha": skill.get("blobSha"),
+        })
+    return tasks
+
+
+def apply_description(skill: Dict, desc: str) -> None:
+    skill["description"] = desc
+    # Also update categories based on description keywords
+    if "community" in skill.get("categories", []):
+        skill["categories"] = infer_categories(skill["name"], desc)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill claude-scientific-skills descriptions")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent fetches")
+    parser.add_argument("--restart", action="store_true", help="Discard checkpoint and start over")
+    args = parser.parse_args()
     
-    print(f"\nUpdated {updated} skills, skipped {skipped}")
+    run_backfill("scientific", select_tasks, apply_description,
+                 workers=args.workers, restart=args.restart)
 
 
 def infer_categories(name: str, desc: str) -> list[str]: